@@ -15,6 +15,8 @@ from .barometer import veil_barometer
 from .rf import veil_rf
 from .ultrasonic import veil_ultrasonic
 from .fusion import veil_fusion_timeseries
+from .batch import veil_radar_batch, veil_thermal_batch, veil_rf_batch
+from .bundle import veil_bundle
 from .plugins import register_sensor, get_veil, list_sensors
 from .profiles import get_profile_strength, list_profiles
 
@@ -29,6 +31,10 @@ __all__ = [
     "veil_rf",
     "veil_ultrasonic",
     "veil_fusion_timeseries",
+    "veil_radar_batch",
+    "veil_thermal_batch",
+    "veil_rf_batch",
+    "veil_bundle",
     "register_sensor",
     "get_veil",
     "list_sensors",
@@ -17,18 +17,25 @@ Goal:
     while keeping the series physically plausible.
 """
 
-from typing import Dict
+from typing import Dict, Optional
 import numpy as np
 from .random_control import get_rng
+from .windows import ragged_windows
 
 
-def veil_barometer(baro: Dict[str, np.ndarray], strength: float = 1.0) -> Dict[str, np.ndarray]:
+def veil_barometer(
+    baro: Dict[str, np.ndarray],
+    strength: float = 1.0,
+    *,
+    rng: Optional[np.random.Generator] = None,
+) -> Dict[str, np.ndarray]:
     """
     Veil barometric pressure data with drift and anomalies.
 
     Args:
         baro: dict with keys "t", "pressure"
         strength: distortion intensity (0.5 .. 2.0 typical)
+        rng: optional numpy Generator (default: shared get_rng())
 
     Returns:
         new dict with same keys.
@@ -38,7 +45,7 @@ def veil_barometer(baro: Dict[str, np.ndarray], strength: float = 1.0) -> Dict[s
     if missing:
         raise ValueError(f"veil_barometer missing keys: {missing}")
 
-    veiled = {k: np.asarray(v, dtype=np.float32).copy() for k, v in baro.items()}
+    veiled = {k: np.array(v, dtype=np.float32, order="C") for k, v in baro.items()}
     t = veiled["t"]
     p = veiled["pressure"]
     n = t.shape[0]
@@ -46,7 +53,8 @@ def veil_barometer(baro: Dict[str, np.ndarray], strength: float = 1.0) -> Dict[s
     if n == 0:
         return veiled
 
-    rng = get_rng()
+    if rng is None:
+        rng = get_rng()
 
     p_min = float(p.min())
     p_max = float(p.max())
@@ -55,7 +63,8 @@ def veil_barometer(baro: Dict[str, np.ndarray], strength: float = 1.0) -> Dict[s
     std = max(std, 1e-3)
 
     # Normalize time 0..1
-    t_norm = (t - t[0]) / max(t[-1] - t[0], 1e-6)
+    t_norm = np.subtract(t, t[0])
+    t_norm *= np.float32(1.0 / max(float(t[-1] - t[0]), 1e-6))
 
     # --- 1) Multi-frequency drift ---
 
@@ -63,21 +72,24 @@ def veil_barometer(baro: Dict[str, np.ndarray], strength: float = 1.0) -> Dict[s
     freqs = np.array([0.1, 0.25, 0.45], dtype=np.float32) * strength
     phases = rng.uniform(0.0, 2.0 * np.pi, size=freqs.shape[0])
 
-    drift = np.zeros_like(t_norm, dtype=np.float32)
-
-    for i, f in enumerate(freqs):
-        angle = 2.0 * np.pi * f * t_norm + phases[i]
-        # Slightly different contributions: sin, cos, skewed
-        if i == 0:
-            drift += 0.6 * np.sin(angle)
-        elif i == 1:
-            drift += 0.4 * np.cos(angle)
-        else:
-            drift += 0.3 * np.sin(angle + 0.7) * np.cos(0.5 * angle)
+    # Slightly different contributions per component: sin, cos, skewed.
+    # All three are expressed as plain sines of scaled/offset angles so the
+    # whole bank is evaluated with one np.sin and one matmul:
+    #   0.6 * sin(a0)
+    #   0.4 * cos(a1)                     = 0.4 * sin(a1 + pi/2)
+    #   0.3 * sin(a2 + 0.7) * cos(0.5*a2) = 0.15 * (sin(1.5*a2 + 0.7) + sin(0.5*a2 + 0.7))
+    comp = np.array([0, 1, 2, 2])
+    mult = np.array([1.0, 1.0, 1.5, 0.5])
+    offset = np.array([0.0, 0.5 * np.pi, 0.7, 0.7])
+    weights = np.array([0.6, 0.4, 0.15, 0.15], dtype=np.float32)
+
+    angles = np.outer(t_norm, (2.0 * np.pi * mult * freqs[comp]).astype(np.float32))
+    angles += (mult * phases[comp] + offset).astype(np.float32)
+    drift = np.sin(angles, out=angles) @ weights
 
     # History-dependent cumulative drift
     step_sigma = 0.002 * strength
-    steps = rng.normal(0.0, step_sigma, size=n).astype(np.float32)
+    steps = rng.standard_normal(n, dtype=np.float32) * np.float32(step_sigma)
     cumulative = np.cumsum(steps)
 
     drift += cumulative
@@ -91,34 +103,32 @@ def veil_barometer(baro: Dict[str, np.ndarray], strength: float = 1.0) -> Dict[s
     anomaly_count = int(3 * strength) + rng.integers(0, 3)
     anomaly_count = max(anomaly_count, 1)
 
-    for _ in range(anomaly_count):
-        center = rng.integers(5, max(6, n - 5))
-        span_len = rng.integers(15, 60)
-        end = min(n, center + span_len)
-        if end <= center:
-            continue
-
-        window_len = end - center
-        base = np.linspace(0.0, 1.0, window_len, dtype=np.float32)
+    # All anomalies are sampled up front and applied with one scatter-add.
+    centers = rng.integers(5, max(6, n - 5), size=anomaly_count)
+    span_lens = rng.integers(15, 60, size=anomaly_count)
+    shape_types = rng.integers(0, 3, size=anomaly_count)  # 0=bump, 1=dip, 2=tilted
+    # Altitude illusions: amplitude scaled to std and strength
+    amps = (0.5 + 0.8 * rng.random(size=anomaly_count)) * std * strength
 
-        shape_type = rng.choice(["bump", "dip", "tilted"])
-        if shape_type == "bump":
-            shape = base * (1.0 - base) * 4.0
-        elif shape_type == "dip":
-            shape = -base * (1.0 - base) * 4.0
-        else:  # tilted
-            shape = (base - 0.5) * 2.0
+    idx, base, owner = ragged_windows(centers, span_lens, n)
+    bump = base * (1.0 - base) * 4.0
+    kind = shape_types[owner]
+    shape = np.where(kind == 0, bump, np.where(kind == 1, -bump, (base - 0.5) * 2.0))
 
-        # Altitude illusions: amplitude scaled to std and strength
-        amp = (0.5 + 0.8 * rng.random()) * std * strength
-        p[center:end] += amp * shape
+    np.add.at(p, idx, (amps[owner] * shape).astype(np.float32))
 
     # --- 3) Adaptive noise ---
 
     noise_sigma = 0.01 * span * strength
     # modulate noise by a slow envelope so variance is not constant
-    env = 0.5 + 0.5 * np.sin(2.0 * np.pi * 0.05 * t_norm + rng.uniform(0.0, 2.0 * np.pi))
-    p += rng.normal(0.0, noise_sigma * env, size=n)
+    # (t_norm is not needed any more, so the envelope is built in its buffer)
+    env = t_norm
+    env *= np.float32(2.0 * np.pi * 0.05)
+    env += np.float32(rng.uniform(0.0, 2.0 * np.pi))
+    np.sin(env, out=env)
+    env *= np.float32(0.5)
+    env += np.float32(0.5)
+    p += rng.standard_normal(n, dtype=np.float32) * (noise_sigma * env)
 
     veiled["pressure"] = p
 
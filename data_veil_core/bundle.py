@@ -0,0 +1,89 @@
+"""
+Bundle veiling – one call for a snapshot of several sensors.
+
+Instead of calling each veil_* function by hand on the exposure boundary,
+a whole snapshot can be veiled at once:
+
+    from data_veil_core import veil_bundle
+
+    veiled = veil_bundle(
+        {"depth": depth, "radar": radar_map, "imu": imu},
+        strengths={"depth": 1.2},
+    )
+
+Every sensor name is first looked up in the plugin registry
+(plugins.register_sensor()), so a plugin registered under a built-in name
+such as "depth" replaces that built-in here just as it does for
+get_veil(). Names without a plugin use the built-in veils (depth, lidar,
+radar, ...). Built-ins are veiled in dict order from one Generator, so
+seeded runs match the equivalent sequence of individual veil_* calls.
+"""
+
+from typing import Any, Callable, Dict, Mapping, Optional
+
+import numpy as np
+
+from .random_control import get_rng
+from .depth import veil_depth
+from .lidar import veil_lidar
+from .thermal import veil_thermal
+from .radar import veil_radar
+from .imu import veil_imu
+from .magnetometer import veil_magnetometer
+from .barometer import veil_barometer
+from .rf import veil_rf
+from .ultrasonic import veil_ultrasonic
+from .plugins import get_veil
+
+# Built-in sensor name -> veil; these all accept rng=
+_BUILTIN_VEILS: Dict[str, Callable[..., Any]] = {
+    "depth": veil_depth,
+    "lidar": veil_lidar,
+    "thermal": veil_thermal,
+    "radar": veil_radar,
+    "imu": veil_imu,
+    "magnetometer": veil_magnetometer,
+    "barometer": veil_barometer,
+    "rf": veil_rf,
+    "ultrasonic": veil_ultrasonic,
+}
+
+
+def veil_bundle(
+    sensors: Mapping[str, Any],
+    strengths: Optional[Mapping[str, float]] = None,
+    default_strength: float = 1.0,
+    *,
+    rng: Optional[np.random.Generator] = None,
+) -> Dict[str, Any]:
+    """
+    Veil several sensors in one call.
+
+    Args:
+        sensors: mapping sensor name -> data, in the format its veil expects.
+        strengths: optional mapping sensor name -> strength.
+        default_strength: strength for sensors missing from `strengths`.
+        rng: optional numpy Generator (default: shared get_rng())
+
+    Returns:
+        new mapping sensor name -> veiled data, in input order.
+    """
+    if rng is None:
+        rng = get_rng()
+    strengths = strengths or {}
+
+    veiled = {}
+    for name, data in sensors.items():
+        strength = strengths.get(name, default_strength)
+        # Plugins only promise fn(data, strength=...)
+        fn = get_veil(name)
+        if fn is not None:
+            veiled[name] = fn(data, strength=strength)
+            continue
+
+        fn = _BUILTIN_VEILS.get(name)
+        if fn is None:
+            raise KeyError(f"No veil registered for sensor '{name}'.")
+        veiled[name] = fn(data, strength=strength, rng=rng)
+
+    return veiled
@@ -15,17 +15,26 @@ This is designed to look like a corrupted / adversarial depth field
 that still feels geometrically plausible to a naive consumer.
 """
 
+from functools import lru_cache
+from typing import Optional, Tuple
+
 import numpy as np
 from .random_control import get_rng
 
 
-def veil_depth(depth_map: np.ndarray, strength: float = 1.0) -> np.ndarray:
+def veil_depth(
+    depth_map: np.ndarray,
+    strength: float = 1.0,
+    *,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
     """
     Apply a sci-fi distortion field to a depth map.
 
     Args:
         depth_map: 2D numpy array of depth values (H, W).
         strength:  overall veiling intensity multiplier (0.5 .. 2.0 recommended).
+        rng: optional numpy Generator (default: shared get_rng())
 
     Returns:
         veiled_depth: 2D numpy array of same shape.
@@ -33,7 +42,7 @@ def veil_depth(depth_map: np.ndarray, strength: float = 1.0) -> np.ndarray:
     if depth_map.ndim != 2:
         raise ValueError("veil_depth expects a 2D depth map array.")
 
-    depth = depth_map.astype(np.float32).copy()
+    depth = np.ascontiguousarray(depth_map, dtype=np.float32)
     h, w = depth.shape
 
     # Normalize to [0,1] for manipulation
@@ -47,79 +56,152 @@ def veil_depth(depth_map: np.ndarray, strength: float = 1.0) -> np.ndarray:
 
     # --- 1) Smooth “warp” field (like a gravitational lensing effect) ---
 
-    yy, xx = np.mgrid[0:h, 0:w]
-    yy_norm = yy / max(h - 1, 1)
-    xx_norm = xx / max(w - 1, 1)
-
-    # Low-frequency sinusoidal offset patterns
-    warp_y = 0.03 * strength * np.sin(2 * np.pi * (xx_norm * 1.3 + yy_norm * 0.7))
-    warp_x = 0.03 * strength * np.cos(2 * np.pi * (xx_norm * 0.9 - yy_norm * 1.1))
-
-    # Compute warped coordinates
-    yy_warp = np.clip(yy + warp_y * h, 0, h - 1)
-    xx_warp = np.clip(xx + warp_x * w, 0, w - 1)
-
-    # Bilinear-ish sampling
-    y0 = np.floor(yy_warp).astype(int)
-    x0 = np.floor(xx_warp).astype(int)
-    y1 = np.clip(y0 + 1, 0, h - 1)
-    x1 = np.clip(x0 + 1, 0, w - 1)
-
-    wy = yy_warp - y0
-    wx = xx_warp - x0
-
-    top_left = d_norm[y0, x0]
-    top_right = d_norm[y0, x1]
-    bot_left = d_norm[y1, x0]
-    bot_right = d_norm[y1, x1]
-
-    warped = (
-        top_left * (1 - wy) * (1 - wx)
-        + top_right * (1 - wy) * wx
-        + bot_left * wy * (1 - wx)
-        + bot_right * wy * wx
-    )
-
-    d_veiled = warped
+    d_veiled = _warp_bilinear(d_norm, strength)
 
     # --- 2) Punch “voids” and fake walls ---
 
-    rng = get_rng()
+    if rng is None:
+        rng = get_rng()
 
     # Voids: patches forced to maximum depth (holes / missing surfaces)
-    for _ in range(int(5 * strength)):
-        cy = rng.integers(0, h)
-        cx = rng.integers(0, w)
-        ry = rng.integers(h // 20, h // 8 + 1)
-        rx = rng.integers(w // 20, w // 8 + 1)
-        y0 = max(cy - ry, 0)
-        y1 = min(cy + ry, h)
-        x0 = max(cx - rx, 0)
-        x1 = min(cx + rx, w)
-        d_veiled[y0:y1, x0:x1] = 1.0  # “infinite” depth
+    void_count = int(5 * strength)
+    cy = rng.integers(0, h, size=void_count)
+    cx = rng.integers(0, w, size=void_count)
+    ry = rng.integers(h // 20, h // 8 + 1, size=void_count)
+    rx = rng.integers(w // 20, w // 8 + 1, size=void_count)
+    voids = _stamp_rects(h, w, cy - ry, cy + ry, cx - rx, cx + rx)
+    d_veiled[voids > 0] = 1.0  # “infinite” depth
 
     # Fake walls: narrow bands forced closer than surroundings
-    for _ in range(int(4 * strength)):
-        cy = rng.integers(int(h * 0.2), int(h * 0.9))
-        thickness = rng.integers(1, max(2, h // 40))
-        x0 = rng.integers(0, w // 2)
-        x1 = rng.integers(w // 2, w)
-        band = d_veiled[cy:cy + thickness, x0:x1]
-        band = np.clip(band - (0.3 + 0.3 * rng.random()), 0.0, 1.0)  # closer
-        d_veiled[cy:cy + thickness, x0:x1] = band
+    wall_count = int(4 * strength)
+    cy = rng.integers(int(h * 0.2), int(h * 0.9), size=wall_count)
+    thickness = rng.integers(1, max(2, h // 40), size=wall_count)
+    x0 = rng.integers(0, w // 2, size=wall_count)
+    x1 = rng.integers(w // 2, w, size=wall_count)
+    closer = 0.3 + 0.3 * rng.random(size=wall_count)
+    # Walls only ever push values down, so clipping after the summed shift
+    # is the same as clipping after each overlapping band.
+    d_veiled -= _stamp_rects(h, w, cy, cy + thickness, x0, x1, closer)
+    np.clip(d_veiled, 0.0, 1.0, out=d_veiled)
 
     # --- 3) Edge noise & quantization ---
 
     # Add light high-frequency noise
-    noise = rng.normal(loc=0.0, scale=0.02 * strength, size=d_veiled.shape)
-    d_veiled = np.clip(d_veiled + noise, 0.0, 1.0)
+    noise = rng.standard_normal(d_veiled.shape, dtype=np.float32)
+    noise *= np.float32(0.02 * strength)
+    d_veiled += noise
+    np.clip(d_veiled, 0.0, 1.0, out=d_veiled)
 
     # Slight quantization to create banding (bad depth discretization effect)
     levels = int(32 * strength)
     levels = max(8, min(levels, 64))
-    d_veiled = np.round(d_veiled * levels) / levels
+    np.multiply(d_veiled, levels, out=d_veiled)
+    np.rint(d_veiled, out=d_veiled)
+
+    # Map back to original depth range; the 1/levels step of the
+    # quantization is folded into the same multiply.
+    np.multiply(d_veiled, (d_max - d_min) / levels, out=d_veiled)
+    d_veiled += d_min
 
-    # Map back to original depth range
-    veiled_depth = d_veiled * (d_max - d_min) + d_min
+    return d_veiled
+
+
+@lru_cache(maxsize=8)
+def _warp_patterns(h: int, w: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-resolution warp inputs, cached so streams of same-sized frames skip
+    the grid construction and trig.
 
-    return veiled_depth
+    Returns read-only float32 arrays:
+        yy, xx:        (H, 1) / (1, W) pixel coordinate axes
+        sin_pattern:   (H, W) low-frequency offset pattern for rows
+        cos_pattern:   (H, W) low-frequency offset pattern for columns
+    """
+    yy = np.arange(h, dtype=np.float32)[:, None]
+    xx = np.arange(w, dtype=np.float32)[None, :]
+    yy_norm = yy / max(h - 1, 1)
+    xx_norm = xx / max(w - 1, 1)
+
+    # Low-frequency sinusoidal offset patterns
+    sin_pattern = np.sin(np.float32(2 * np.pi) * (xx_norm * 1.3 + yy_norm * 0.7))
+    cos_pattern = np.cos(np.float32(2 * np.pi) * (xx_norm * 0.9 - yy_norm * 1.1))
+
+    out = (yy, xx, sin_pattern, cos_pattern)
+    for arr in out:
+        arr.flags.writeable = False
+    return out
+
+
+def _warp_bilinear(d_norm: np.ndarray, strength: float) -> np.ndarray:
+    """
+    Resample d_norm through a low-frequency sinusoidal warp with bilinear
+    interpolation.
+
+    Works on broadcast 1D coordinate axes and cached warp patterns and reuses
+    its (H, W) buffers in place, so only a handful of float32 temporaries
+    are touched.
+    """
+    h, w = d_norm.shape
+    yy, xx, sin_pattern, cos_pattern = _warp_patterns(h, w)
+
+    # Patterns are strength independent; scale them to pixels here
+    yy_warp = sin_pattern * np.float32(0.03 * strength * h)
+    yy_warp += yy
+    np.clip(yy_warp, 0, h - 1, out=yy_warp)
+
+    xx_warp = cos_pattern * np.float32(0.03 * strength * w)
+    xx_warp += xx
+    np.clip(xx_warp, 0, w - 1, out=xx_warp)
+
+    # Coordinates are clipped to be non-negative, so truncation == floor
+    y0 = yy_warp.astype(np.intp)
+    x0 = xx_warp.astype(np.intp)
+    y1 = np.minimum(y0 + 1, h - 1)
+    x1 = np.minimum(x0 + 1, w - 1)
+
+    # Fractional parts, computed in place
+    wy = yy_warp
+    wy -= y0
+    wx = xx_warp
+    wx -= x0
+
+    # Gather corners from the flattened map and lerp in place:
+    #   top = tl + wx * (tr - tl), bot = bl + wx * (br - bl)
+    #   out = top + wy * (bot - top)
+    flat = d_norm.ravel()
+    y0 *= w
+    y1 *= w
+    top = flat[y0 + x0]
+    top += wx * (flat[y0 + x1] - top)
+    bot = flat[y1 + x0]
+    bot += wx * (flat[y1 + x1] - bot)
+
+    bot -= top
+    bot *= wy
+    top += bot
+    return top
+
+
+def _stamp_rects(
+    h: int,
+    w: int,
+    y0: np.ndarray,
+    y1: np.ndarray,
+    x0: np.ndarray,
+    x1: np.ndarray,
+    weights: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Sum K weighted rectangles [y0:y1, x0:x1] into an (H, W) float32 map.
+
+    Each rectangle is the outer product of a row and a column indicator, so
+    the whole batch is one (H, K) @ (K, W) matmul. Bounds outside the map
+    are clipped implicitly.
+    """
+    rows = np.arange(h)[:, None]
+    cols = np.arange(w)[None, :]
+    row_in = ((rows >= y0) & (rows < y1)).astype(np.float32)  # (H, K)
+    col_in = ((cols >= x0[:, None]) & (cols < x1[:, None])).astype(np.float32)  # (K, W)
+    if weights is not None:
+        row_in *= weights.astype(np.float32)
+    return row_in @ col_in
@@ -24,7 +24,7 @@ Design:
         * Very hard to invert or remove from logs
 """
 
-from typing import Dict
+from typing import Dict, Optional
 import numpy as np
 from .random_control import get_rng
 
@@ -32,6 +32,8 @@ from .random_control import get_rng
 def veil_fusion_timeseries(
     sensors: Dict[str, np.ndarray],
     strength: float = 1.0,
+    *,
+    rng: Optional[np.random.Generator] = None,
 ) -> Dict[str, np.ndarray]:
     """
     Apply a correlated fusion veil to aligned 1D time-series sensors.
@@ -39,6 +41,7 @@ def veil_fusion_timeseries(
     Args:
         sensors: mapping sensor_name -> 1D numpy array (length N)
         strength: distortion intensity (0.5 .. 2.0 typical)
+        rng: optional numpy Generator (default: shared get_rng())
 
     Returns:
         new mapping sensor_name -> veiled 1D numpy array (length N_shortest)
@@ -50,7 +53,7 @@ def veil_fusion_timeseries(
     arrays = {}
     lengths = []
     for name, arr in sensors.items():
-        a = np.asarray(arr, dtype=np.float32)
+        a = np.ascontiguousarray(arr, dtype=np.float32)
         if a.ndim != 1:
             raise ValueError(f"veil_fusion_timeseries: sensor '{name}' is not 1D.")
         arrays[name] = a
@@ -64,14 +67,15 @@ def veil_fusion_timeseries(
     for name in arrays:
         arrays[name] = arrays[name][:n]
 
-    rng = get_rng()
+    if rng is None:
+        rng = get_rng()
 
     # Build shared latent processes over time index 0..n-1
     t = np.linspace(0.0, 1.0, n, dtype=np.float32)
 
     # Latent 1: random walk (slow drift)
     step_sigma = 0.05 * strength
-    steps = rng.normal(0.0, step_sigma, size=n).astype(np.float32)
+    steps = rng.standard_normal(n, dtype=np.float32) * np.float32(step_sigma)
     latent1 = np.cumsum(steps)
 
     # Latent 2: multi-frequency sinusoid
@@ -79,42 +83,50 @@ def veil_fusion_timeseries(
     freq2 = 0.8 * strength
     phase1 = rng.uniform(0.0, 2.0 * np.pi)
     phase2 = rng.uniform(0.0, 2.0 * np.pi)
-    latent2 = (
-        0.7 * np.sin(2.0 * np.pi * freq1 * t + phase1)
-        + 0.5 * np.cos(2.0 * np.pi * freq2 * t + phase2)
-    )
+    # 0.7 * sin(a1) + 0.5 * cos(a2), with cos(a2) = sin(a2 + pi/2) so both
+    # terms come from a single np.sin over a (2, n) angle block.
+    sin_freqs = np.array([[freq1], [freq2]], dtype=np.float32)
+    sin_phases = np.array([[phase1], [phase2 + 0.5 * np.pi]], dtype=np.float32)
+    angles = np.float32(2.0 * np.pi) * sin_freqs * t[None, :]
+    angles += sin_phases
+    latent2 = np.array([0.7, 0.5], dtype=np.float32) @ np.sin(angles, out=angles)
 
     # Latent 3: band-limited noise envelope
-    noise_raw = rng.normal(0.0, 1.0, size=n).astype(np.float32)
-    # Smooth the noise a bit with a simple moving average
+    noise_raw = rng.standard_normal(n, dtype=np.float32)
+    # Smooth the noise a bit with a simple moving average (centered box
+    # filter, zero-padded like np.convolve(mode="same")) via a cumsum diff.
     kernel_size = 5
-    kernel = np.ones(kernel_size, dtype=np.float32) / float(kernel_size)
-    noise_smoothed = np.convolve(noise_raw, kernel, mode="same")
-    latent3 = noise_smoothed
-
-    veiled: Dict[str, np.ndarray] = {}
-
-    for name, base in arrays.items():
-        base = base.copy()
-        span = float(base.max() - base.min())
-        std = float(base.std())
-        span = max(span, 1e-3)
-        std = max(std, 1e-3)
-
-        # Each sensor gets its own mixture weights
-        w = rng.normal(0.0, 1.0, size=3).astype(np.float32)
-        # Normalize weights so they are not huge
-        w /= max(np.linalg.norm(w), 1e-6)
-
-        # Combined latent for this sensor
-        latent = w[0] * latent1 + w[1] * latent2 + w[2] * latent3
-
-        # Scale relative to sensor stats and global strength
-        # Use a mix of span and std so flat signals still get some distortion.
-        scale = (0.2 * span + 0.8 * std) * strength
-
-        distorted = base + scale * latent
-
-        veiled[name] = distorted
+    half = kernel_size // 2
+    padded = np.zeros(n + kernel_size, dtype=np.float32)
+    padded[half + 1:half + 1 + n] = noise_raw
+    csum = np.cumsum(padded, dtype=np.float64)
+    noise_smoothed = (csum[kernel_size:] - csum[:-kernel_size]) / kernel_size
+    latent3 = noise_smoothed.astype(np.float32)
+
+    # Stack latents (3, n) and sensors (S, n) so the per-sensor mixing is a
+    # single matmul instead of 3 * S axpy passes.
+    latents = np.stack([latent1, latent2, latent3])
+    names = list(arrays.keys())
+    bases = np.stack([arrays[name] for name in names])
+
+    spans = np.maximum(bases.max(axis=1) - bases.min(axis=1), 1e-3)
+    stds = np.maximum(bases.std(axis=1), 1e-3)
+
+    # Each sensor gets its own mixture weights
+    w = rng.standard_normal((len(names), 3), dtype=np.float32)
+    # Normalize weights so they are not huge
+    w /= np.maximum(np.linalg.norm(w, axis=1, keepdims=True), 1e-6)
+
+    # Combined latent for every sensor, (S, n)
+    mixed = w @ latents
+
+    # Scale relative to sensor stats and global strength
+    # Use a mix of span and std so flat signals still get some distortion.
+    scales = ((0.2 * spans + 0.8 * stds) * strength).astype(np.float32)
+
+    mixed *= scales[:, None]
+    mixed += bases
+
+    veiled: Dict[str, np.ndarray] = dict(zip(names, mixed))
 
     return veiled
@@ -0,0 +1,30 @@
+"""
+Grid helpers for coarse-to-full displacement fields.
+
+Several demo warps draw their low-frequency noise on a coarse grid, one
+sample per factor x factor block, and expand it back to the field size
+with nearest-neighbour upsampling (what np.repeat along both axes and a
+crop would give). upsample_blocks() does that expansion in one copy.
+"""
+
+import numpy as np
+
+
+def upsample_blocks(small: np.ndarray, factor: int, h: int, w: int) -> np.ndarray:
+    """
+    Nearest-neighbour upsample of a coarse (sh, sw) grid by `factor`,
+    cropped to (h, w).
+
+    Args:
+        small:  (sh, sw) coarse values, with sh * factor >= h, sw * factor >= w
+        factor: block size in pixels
+        h, w:   output shape
+
+    Returns:
+        (h, w) array of small's dtype. It is always a fresh, writable array
+        (never a view of `small`), so callers may modify it in place.
+    """
+    sh, sw = small.shape
+    full = np.empty((sh, factor, sw, factor), dtype=small.dtype)
+    full[...] = small[:, None, :, None]
+    return full.reshape(sh * factor, sw * factor)[:h, :w]
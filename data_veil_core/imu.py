@@ -15,17 +15,24 @@ Output:
 """
 
 import numpy as np
-from typing import Dict
+from typing import Dict, Optional
 from .random_control import get_rng
+from .windows import ragged_windows
 
 
-def veil_imu(imu: Dict[str, np.ndarray], strength: float = 1.0) -> Dict[str, np.ndarray]:
+def veil_imu(
+    imu: Dict[str, np.ndarray],
+    strength: float = 1.0,
+    *,
+    rng: Optional[np.random.Generator] = None,
+) -> Dict[str, np.ndarray]:
     """
     Veil IMU data (gyro + accel) with sci-fi distortions.
 
     Args:
         imu: dict with keys "t", "gx", "gy", "gz", "ax", "ay", "az"
         strength: intensity of veiling
+        rng: optional numpy Generator (default: shared get_rng())
 
     Returns:
         new dict with same keys.
@@ -35,50 +42,52 @@ def veil_imu(imu: Dict[str, np.ndarray], strength: float = 1.0) -> Dict[str, np.
     if missing:
         raise ValueError(f"veil_imu missing keys: {missing}")
 
-    veiled = {k: np.asarray(v, dtype=np.float32).copy() for k, v in imu.items()}
+    veiled = {k: np.array(v, dtype=np.float32, order="C") for k, v in imu.items()}
     n = veiled["t"].shape[0]
     if n == 0:
         return veiled
 
-    rng = get_rng()
+    if rng is None:
+        rng = get_rng()
 
     # --- 1) Slow drift on some channels ---
+    # One shared 0..1 ramp, scaled per channel
     drift_scale = strength
-    drift_gz = np.linspace(0.0, 0.3 * drift_scale, n)
-    drift_ax = np.linspace(0.0, 1.0 * drift_scale, n)
-    drift_ay = np.linspace(0.0, -0.7 * drift_scale, n)
+    ramp = np.linspace(0.0, 1.0, n, dtype=np.float32)
 
-    veiled["gz"] += drift_gz
-    veiled["ax"] += drift_ax
-    veiled["ay"] += drift_ay
+    veiled["gz"] += np.float32(0.3 * drift_scale) * ramp
+    veiled["ax"] += np.float32(1.0 * drift_scale) * ramp
+    veiled["ay"] += np.float32(-0.7 * drift_scale) * ramp
 
     # --- 2) Fake impact spikes ---
+    # All spikes are sampled up front and applied with one scatter-add per
+    # channel (overlapping spikes still accumulate).
     spike_count = int(6 * strength)
-    for _ in range(spike_count):
-        idx = rng.integers(5, max(6, n - 5))
-        span = rng.integers(3, 10)
-        end = min(n, idx + span)
+    starts = rng.integers(5, max(6, n - 5), size=spike_count)
+    spans = rng.integers(3, 10, size=spike_count)
 
-        gyro_spike = rng.choice([-1.8, -1.2, 1.2, 1.8])
-        accel_spike_x = rng.choice([-4.0, 4.0])
-        accel_spike_y = rng.choice([-3.0, 3.0])
-        accel_spike_z = rng.choice([-6.0, 6.0])
+    gyro_spike = rng.choice([-1.8, -1.2, 1.2, 1.8], size=spike_count)
+    accel_spike_x = rng.choice([-4.0, 4.0], size=spike_count)
+    accel_spike_y = rng.choice([-3.0, 3.0], size=spike_count)
+    accel_spike_z = rng.choice([-6.0, 6.0], size=spike_count)
 
-        veiled["gx"][idx:end] += gyro_spike
-        veiled["gy"][idx:end] += gyro_spike * 0.7
+    idx, _, owner = ragged_windows(starts, spans, n)
 
-        veiled["ax"][idx:end] += accel_spike_x
-        veiled["ay"][idx:end] += accel_spike_y
-        veiled["az"][idx:end] += accel_spike_z
+    np.add.at(veiled["gx"], idx, gyro_spike[owner].astype(np.float32))
+    np.add.at(veiled["gy"], idx, (gyro_spike * 0.7)[owner].astype(np.float32))
+
+    np.add.at(veiled["ax"], idx, accel_spike_x[owner].astype(np.float32))
+    np.add.at(veiled["ay"], idx, accel_spike_y[owner].astype(np.float32))
+    np.add.at(veiled["az"], idx, accel_spike_z[owner].astype(np.float32))
 
     # --- 3) High-frequency jitter / sensor noise ---
 
     for key in ["gx", "gy", "gz"]:
         sigma = 0.05 * strength
-        veiled[key] += rng.normal(0.0, sigma, size=n)
+        veiled[key] += rng.standard_normal(n, dtype=np.float32) * np.float32(sigma)
 
     for key in ["ax", "ay", "az"]:
         sigma = 0.2 * strength
-        veiled[key] += rng.normal(0.0, sigma, size=n)
+        veiled[key] += rng.standard_normal(n, dtype=np.float32) * np.float32(sigma)
 
     return veiled
@@ -12,11 +12,18 @@ The goal is to:
     - preserve overall "LiDAR-like" structure so it looks plausible at a glance
 """
 
+from typing import Optional
+
 import numpy as np
 from .random_control import get_rng
 
 
-def veil_lidar(lidar_data: np.ndarray, strength: float = 1.0) -> np.ndarray:
+def veil_lidar(
+    lidar_data: np.ndarray,
+    strength: float = 1.0,
+    *,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
     """
     Veil LiDAR distances or point cloud in a sci-fi way.
 
@@ -26,12 +33,14 @@ def veil_lidar(lidar_data: np.ndarray, strength: float = 1.0) -> np.ndarray:
             - or (N, 3)       x, y, z points
         strength: float
             intensity multiplier for distortion.
+        rng: optional numpy Generator (default: shared get_rng())
 
     Returns:
         veiled: numpy array of same shape.
     """
-    arr = np.asarray(lidar_data).astype(np.float32)
-    rng = get_rng()
+    arr = np.ascontiguousarray(lidar_data, dtype=np.float32)
+    if rng is None:
+        rng = get_rng()
 
     if arr.ndim == 1:
         return _veil_lidar_ranges(arr, strength=strength, rng=rng)
@@ -77,38 +86,39 @@ def _veil_lidar_ranges(ranges: np.ndarray, strength: float, rng: np.random.Gener
 
 
 def _veil_lidar_points(points: np.ndarray, strength: float, rng: np.random.Generator) -> np.ndarray:
-    pts = points.copy()
-    n = pts.shape[0]
+    n = points.shape[0]
     if n == 0:
-        return pts
+        return points.copy()
 
     # Compute radial distance
-    d = np.linalg.norm(pts[:, :2], axis=1)
+    d = np.linalg.norm(points[:, :2], axis=1)
     d_min = float(np.min(d))
     d_max = float(np.max(d))
     span = max(d_max - d_min, 1e-3)
 
     # --- 1) Ghost clouds (fake clusters) ---
+    # All swarms are drawn in one batch and written into a single
+    # preallocated buffer after the real points.
     ghost_count = int(5 * strength)
-    for _ in range(ghost_count):
-        # pick a random existing point as seed
-        idx = rng.integers(0, n)
-        center = pts[idx]
 
-        # create a small swarm around it
-        swarm_size = rng.integers(10, 30)
-        offsets = rng.normal(
-            loc=0.0,
-            scale=0.05 * span * strength,
-            size=(swarm_size, 3),
-        )
-        ghost_swarm = center + offsets
+    # pick random existing points as seeds
+    seeds = rng.integers(0, n, size=ghost_count)
+    # each seed gets a small swarm around it
+    swarm_sizes = rng.integers(10, 30, size=ghost_count)
+    # optionally force them closer or farther
+    scale_factors = rng.uniform(0.6, 1.4, size=ghost_count).astype(np.float32)
+
+    owner = np.repeat(np.arange(ghost_count), swarm_sizes)
+    out = np.empty((n + owner.shape[0], 3), dtype=np.float32)
+    out[:n] = points
 
-        # optionally force them closer or farther
-        scale_factor = rng.uniform(0.6, 1.4)
-        ghost_swarm[:, :2] *= scale_factor
+    ghosts = out[n:]
+    rng.standard_normal(ghosts.shape, dtype=np.float32, out=ghosts)
+    ghosts *= np.float32(0.05 * span * strength)
+    ghosts += points[seeds[owner]]
+    ghosts[:, :2] *= scale_factors[owner][:, None]
 
-        pts = np.vstack([pts, ghost_swarm])
+    pts = out
 
     # --- 2) Erase sectors (e.g., wedge in angle space) ---
     angles = np.arctan2(pts[:, 1], pts[:, 0])  # -pi..pi
@@ -117,7 +127,10 @@ def _veil_lidar_points(points: np.ndarray, strength: float, rng: np.random.Gener
     for _ in range(sector_count):
         center_angle = rng.uniform(-np.pi, np.pi)
         width = rng.uniform(0.1, 0.4) * strength
-        sector = np.abs(np.angle(np.exp(1j * (angles - center_angle)))) < width
+        # wrap the angular distance to [-pi, pi] without a complex round-trip
+        diff = angles - np.float32(center_angle)
+        diff -= np.float32(2 * np.pi) * np.round(diff / np.float32(2 * np.pi))
+        sector = np.abs(diff) < width
         # drop some of these
         drop_mask = sector & (rng.random(pts.shape[0]) < 0.5)
         mask[drop_mask] = False
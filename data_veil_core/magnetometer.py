@@ -19,18 +19,25 @@ Design goals:
     - Very difficult to invert or "subtract out" statistically.
 """
 
-from typing import Dict
+from typing import Dict, Optional
 import numpy as np
 from .random_control import get_rng
+from .windows import ragged_windows
 
 
-def veil_magnetometer(mag: Dict[str, np.ndarray], strength: float = 1.0) -> Dict[str, np.ndarray]:
+def veil_magnetometer(
+    mag: Dict[str, np.ndarray],
+    strength: float = 1.0,
+    *,
+    rng: Optional[np.random.Generator] = None,
+) -> Dict[str, np.ndarray]:
     """
     Veil magnetometer data with drift and magnetic ghosts.
 
     Args:
         mag: dict with keys "t", "mx", "my", "mz"
         strength: distortion intensity (typical range 0.5 .. 2.0)
+        rng: optional numpy Generator (default: shared get_rng())
 
     Returns:
         new dict with same keys.
@@ -40,27 +47,33 @@ def veil_magnetometer(mag: Dict[str, np.ndarray], strength: float = 1.0) -> Dict
     if missing:
         raise ValueError(f"veil_magnetometer missing keys: {missing}")
 
-    veiled = {k: np.asarray(v, dtype=np.float32).copy() for k, v in mag.items()}
+    veiled = {k: np.array(v, dtype=np.float32, order="C") for k, v in mag.items()}
     t = veiled["t"]
     n = t.shape[0]
     if n == 0:
         return veiled
 
-    rng = get_rng()
+    if rng is None:
+        rng = get_rng()
 
     mx = veiled["mx"]
     my = veiled["my"]
     mz = veiled["mz"]
 
-    # Basic stats for scaling
-    stacked = np.vstack([mx, my, mz])
-    span = float(stacked.max() - stacked.min())
-    span = max(span, 1e-3)
-    std = float(stacked.std())
+    # Basic stats for scaling, over all three axes together. Computed from
+    # per-axis reductions instead of stacking a (3, N) copy; the pooled
+    # variance is the mean within-axis variance plus the variance of the
+    # axis means.
+    span = max(mx.max(), my.max(), mz.max()) - min(mx.min(), my.min(), mz.min())
+    span = max(float(span), 1e-3)
+    means = np.array([mx.mean(), my.mean(), mz.mean()], dtype=np.float64)
+    variances = np.array([mx.var(), my.var(), mz.var()], dtype=np.float64)
+    std = float(np.sqrt(variances.mean() + means.var()))
     std = max(std, 1e-3)
 
     # Normalize time to 0..1
-    t_norm = (t - t[0]) / max(t[-1] - t[0], 1e-6)
+    t_norm = np.subtract(t, t[0])
+    t_norm *= np.float32(1.0 / max(float(t[-1] - t[0]), 1e-6))
 
     # --- 1) Multi-frequency bias drift (history-dependent) ---
 
@@ -69,36 +82,45 @@ def veil_magnetometer(mag: Dict[str, np.ndarray], strength: float = 1.0) -> Dict
     freqs = np.array([0.3, 0.7, 1.3], dtype=np.float32) * strength
     phases = rng.uniform(0.0, 2.0 * np.pi, size=freqs.shape[0])
 
-    drift_x = np.zeros_like(t_norm, dtype=np.float32)
-    drift_y = np.zeros_like(t_norm, dtype=np.float32)
-    drift_z = np.zeros_like(t_norm, dtype=np.float32)
-
-    for i, f in enumerate(freqs):
-        angle = 2.0 * np.pi * f * t_norm + phases[i]
-        # Axis-specific weights
-        w = rng.normal(0.0, 1.0, size=3)
-        w /= max(np.linalg.norm(w), 1e-6)
-
-        drift_x += w[0] * np.sin(angle)
-        drift_y += w[1] * np.cos(angle)
-        drift_z += w[2] * np.sin(angle + 0.5)
+    # Axis-specific weights, one normalized row per frequency
+    w = rng.normal(0.0, 1.0, size=(freqs.shape[0], 3))
+    w /= np.maximum(np.linalg.norm(w, axis=1, keepdims=True), 1e-6)
+
+    # Per frequency: x gets sin(angle), y gets cos(angle) and z gets
+    # sin(angle + 0.5) = sin(angle)*cos(0.5) + cos(angle)*sin(0.5), so every
+    # axis is a linear combination of one sin and one cos bank:
+    #   drift = [sin, cos] (N, 6) @ mix (6, 3)
+    k = freqs.shape[0]
+    mix = np.zeros((2 * k, 3), dtype=np.float32)
+    mix[:k, 0] = w[:, 0]
+    mix[k:, 1] = w[:, 1]
+    mix[:k, 2] = w[:, 2] * np.cos(0.5)
+    mix[k:, 2] = w[:, 2] * np.sin(0.5)
+
+    angles = np.outer(t_norm, (2.0 * np.pi * freqs).astype(np.float32))
+    angles += phases.astype(np.float32)
+    bank = np.concatenate([np.sin(angles), np.cos(angles)], axis=1)
+    drift = bank @ mix  # (N, 3)
+
+    # All Gaussian samples for the random walk (N, 3) and the per-axis
+    # jitter (3, N) come from one draw.
+    normals = rng.standard_normal(6 * n, dtype=np.float32)
+    random_steps = normals[:3 * n].reshape(n, 3)
+    jitter = normals[3 * n:].reshape(3, n)
 
     # History-dependent cumulative component
     # Integrate a small random step to create drift that cannot be modeled
     # with simple sinusoids alone.
     step_scale = 0.01 * strength
-    random_steps = rng.normal(0.0, step_scale, size=(n, 3)).astype(np.float32)
-    cumulative = np.cumsum(random_steps, axis=0)
-
-    drift_x += cumulative[:, 0]
-    drift_y += cumulative[:, 1]
-    drift_z += cumulative[:, 2]
+    random_steps *= np.float32(step_scale)
+    drift += np.cumsum(random_steps, axis=0)
 
     # Scale relative to span
     drift_scale = 0.05 * span  # 5% of range at full strength
-    mx += drift_scale * drift_x
-    my += drift_scale * drift_y
-    mz += drift_scale * drift_z
+    drift *= np.float32(drift_scale)
+    mx += drift[:, 0]
+    my += drift[:, 1]
+    mz += drift[:, 2]
 
     # --- 2) Local anomalies with varying shapes ---
 
@@ -109,42 +131,40 @@ def veil_magnetometer(mag: Dict[str, np.ndarray], strength: float = 1.0) -> Dict
     anomaly_count = int(4 * strength) + rng.integers(0, 3)
     anomaly_count = max(anomaly_count, 1)
 
-    for _ in range(anomaly_count):
-        center = rng.integers(5, max(6, n - 5))
-        span_len = rng.integers(8, 40)
-        end = min(n, center + span_len)
-        if end <= center:
-            continue
-
-        window_len = end - center
-        base = np.linspace(0.0, 1.0, window_len, dtype=np.float32)
+    # All anomalies are sampled up front and applied with one scatter-add
+    # per axis.
+    centers = rng.integers(5, max(6, n - 5), size=anomaly_count)
+    span_lens = rng.integers(8, 40, size=anomaly_count)
+    shape_types = rng.integers(0, 3, size=anomaly_count)  # 0=bump, 1=ramp, 2=asym_bump
 
-        shape_type = rng.choice(["bump", "ramp", "asym_bump"])
-        if shape_type == "bump":
-            shape = base * (1.0 - base) * 4.0  # symmetric
-        elif shape_type == "ramp":
-            shape = base
-        else:  # asym_bump
-            shape = base * np.exp(-2.0 * base)
+    # Random direction and amplitude
+    directions = rng.normal(0.0, 1.0, size=(anomaly_count, 3))
+    directions /= np.maximum(np.linalg.norm(directions, axis=1, keepdims=True), 1e-6)
 
-        # Random direction and amplitude
-        direction = rng.normal(0.0, 1.0, size=3)
-        direction /= max(np.linalg.norm(direction), 1e-6)
+    # Amplitude scaled from std and strength
+    amps = (0.5 + 0.5 * rng.random(size=anomaly_count)) * std * strength
 
-        # Amplitude scaled from std and strength
-        amp = (0.5 + 0.5 * rng.random()) * std * strength
+    idx, base, owner = ragged_windows(centers, span_lens, n)
+    kind = shape_types[owner]
+    shape = np.where(
+        kind == 0,
+        base * (1.0 - base) * 4.0,  # symmetric
+        np.where(kind == 1, base, base * np.exp(-2.0 * base)),
+    )
 
-        mx[center:end] += direction[0] * amp * shape
-        my[center:end] += direction[1] * amp * shape
-        mz[center:end] += direction[2] * amp * shape
+    contrib = (directions[owner] * (amps[owner] * shape)[:, None]).astype(np.float32)
+    np.add.at(mx, idx, contrib[:, 0])
+    np.add.at(my, idx, contrib[:, 1])
+    np.add.at(mz, idx, contrib[:, 2])
 
     # --- 3) Adaptive high-frequency jitter ---
 
     # Use std to scale jitter; add slightly different characteristics per axis.
     jitter_base = 0.05 * std * strength
-    mx += rng.normal(0.0, jitter_base, size=n)
-    my += rng.normal(0.0, jitter_base * 1.2, size=n)
-    mz += rng.normal(0.0, jitter_base * 0.8, size=n)
+    jitter *= np.array([[1.0], [1.2], [0.8]], dtype=np.float32) * np.float32(jitter_base)
+    mx += jitter[0]
+    my += jitter[1]
+    mz += jitter[2]
 
     veiled["mx"] = mx
     veiled["my"] = my
@@ -16,6 +16,7 @@ Then, elsewhere:
     veiled = fn(data, strength=0.8)
 """
 
+import sys
 from typing import Callable, Dict, List, Optional, Any
 
 # Registry maps sensor name -> veiling function
@@ -37,7 +38,9 @@ def register_sensor(name: str, fn: Callable[..., Any]) -> None:
     if not callable(fn):
         raise ValueError("fn must be callable.")
 
-    _REGISTRY[key] = fn
+    # Keys are stored normalized (and interned), so lookups with a clean
+    # name hit the registry directly in get_veil().
+    _REGISTRY[sys.intern(key)] = fn
 
 
 def get_veil(name: str) -> Optional[Callable[..., Any]]:
@@ -50,6 +53,10 @@ def get_veil(name: str) -> Optional[Callable[..., Any]]:
     Returns:
         callable or None if not found.
     """
+    if isinstance(name, str):
+        fn = _REGISTRY.get(name)
+        if fn is not None:
+            return fn
     return _REGISTRY.get(str(name).strip())
 
 
@@ -18,13 +18,14 @@ profiles:
       rf: 1.1
 """
 
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Tuple
 import os
 
-try:
-    import yaml  # type: ignore
-except ImportError:
-    yaml = None  # Graceful fallback to built-in profiles if missing.
+# PyYAML is imported lazily (see _import_yaml) so `import data_veil_core`
+# does not pay for it when no profiles.yaml is present.
+_yaml = None
+_YAML_UNAVAILABLE = False
 
 
 # --- Built-in base profile multipliers (generic) ---
@@ -55,11 +56,41 @@ _SENSOR_PROFILE_TWEAKS: Dict[str, Dict[str, float]] = {
     },
 }
 
+_BUILTIN_PROFILE_KEYS = frozenset(_BASE_PROFILES)
+
 # --- YAML-backed profiles cache ---
 
-_YAML_PROFILES: Dict[str, Dict] | None = None
+# Set once config/profiles.yaml is found to be missing, so later calls skip
+# the filesystem entirely.
+_YAML_MISSING = False
+
+# Shared "no YAML profiles" result, so the flat table below is not rebuilt
+# on every call when the file is missing or unreadable.
+_NO_YAML_PROFILES: Dict[str, Dict] = {}
+
+# Flattened (profile, sensor) -> strength table, together with the YAML
+# profiles dict it was built from.
+_FLAT: Dict[Tuple[str, str], float] = {}
+_FLAT_SOURCE: Dict[str, Dict] | None = None
 
 
+def _import_yaml():
+    """
+    Import PyYAML on first use and remember the module (or its absence).
+    """
+    global _yaml, _YAML_UNAVAILABLE
+
+    if _yaml is None and not _YAML_UNAVAILABLE:
+        try:
+            import yaml  # type: ignore
+        except ImportError:
+            _YAML_UNAVAILABLE = True  # Graceful fallback to built-in profiles if missing.
+        else:
+            _yaml = yaml
+    return _yaml
+
+
+@lru_cache(maxsize=1)
 def _profiles_yaml_path() -> str:
     """
     Resolve the path to config/profiles.yaml relative to project root.
@@ -69,6 +100,30 @@ def _profiles_yaml_path() -> str:
     return os.path.join(root, "config", "profiles.yaml")
 
 
+@lru_cache(maxsize=4)
+def _load_profiles_cached(path: str, mtime_ns: int) -> Dict[str, Dict]:
+    """
+    Parse the profiles section of a YAML file.
+
+    Keyed on (path, mtime) so an edited file is picked up on the next call
+    while unchanged files are parsed only once.
+    """
+    yaml = _import_yaml()
+    if yaml is None:
+        return _NO_YAML_PROFILES
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+    except Exception:
+        return _NO_YAML_PROFILES
+
+    profiles = data.get("profiles", {}) if isinstance(data, dict) else {}
+    if not isinstance(profiles, dict):
+        return _NO_YAML_PROFILES
+    return profiles
+
+
 def _load_profiles_from_yaml() -> Dict[str, Dict]:
     """
     Load profiles from config/profiles.yaml if available.
@@ -77,43 +132,91 @@ def _load_profiles_from_yaml() -> Dict[str, Dict]:
         dict mapping profile_name -> profile_config
         (or {} if file missing / yaml unavailable / parse error)
     """
-    global _YAML_PROFILES
-
-    if _YAML_PROFILES is not None:
-        return _YAML_PROFILES
+    global _YAML_MISSING
 
-    if yaml is None:
-        _YAML_PROFILES = {}
-        return _YAML_PROFILES
+    if _YAML_MISSING or _YAML_UNAVAILABLE:
+        return _NO_YAML_PROFILES
 
     path = _profiles_yaml_path()
-    if not os.path.exists(path):
-        _YAML_PROFILES = {}
-        return _YAML_PROFILES
-
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-    except Exception:
-        _YAML_PROFILES = {}
-        return _YAML_PROFILES
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        _YAML_MISSING = True
+        return _NO_YAML_PROFILES
+    except OSError:
+        return _NO_YAML_PROFILES
 
-    profiles = data.get("profiles", {})
-    if not isinstance(profiles, dict):
-        profiles = {}
+    return _load_profiles_cached(path, mtime_ns)
+
+
+def _build_flat(yaml_profiles: Dict[str, Dict]) -> Dict[Tuple[str, str], float]:
+    """
+    Materialize every (profile, sensor) strength, including a
+    (profile, "default") entry used for sensors without their own value.
+
+    YAML profiles replace built-ins of the same name. Only lowercase,
+    unpadded names are stored, since lookups are normalized that way.
+
+    Entries whose values do not coerce to float are left out rather than
+    failing the whole table; lookups that miss fall back to
+    _resolve_strength, which raises for that profile exactly as before.
+    A profile with any such sensor entry gets no "default" key, so its
+    other sensors also take that path.
+    """
+    flat: Dict[Tuple[str, str], float] = {}
+
+    for p, base in _BASE_PROFILES.items():
+        if p in yaml_profiles:
+            continue
+        flat[(p, "default")] = base
+        for s, tweak_table in _SENSOR_PROFILE_TWEAKS.items():
+            flat[(p, s)] = base * tweak_table.get(p, 1.0)
+
+    for p, cfg in yaml_profiles.items():
+        if not isinstance(p, str) or p != p.strip().lower():
+            continue
+        try:
+            cfg = cfg or {}
+            base = float(cfg.get("base", _BASE_PROFILES.get(p, 1.0)))
+            sensors_cfg = cfg.get("sensors", {}) or {}
+            sensor_items = list(sensors_cfg.items())
+            default = float(sensors_cfg.get("default", 1.0))
+        except (AttributeError, TypeError, ValueError):
+            continue
+
+        complete = True
+        for s, factor in sensor_items:
+            try:
+                factor = float(factor)
+            except (TypeError, ValueError):
+                complete = False
+                continue
+            if isinstance(s, str) and s == s.strip().lower() and s != "default":
+                flat[(p, s)] = base * factor
+        if complete:
+            flat[(p, "default")] = base * default
+
+    return flat
+
+
+def _flat_profiles() -> Dict[Tuple[str, str], float]:
+    """
+    Return the flat strength table, rebuilding it when the YAML changes.
+    """
+    global _FLAT, _FLAT_SOURCE
 
-    _YAML_PROFILES = profiles
-    return _YAML_PROFILES
+    yaml_profiles = _load_profiles_from_yaml()
+    if yaml_profiles is not _FLAT_SOURCE:
+        _FLAT = _build_flat(yaml_profiles)
+        _FLAT_SOURCE = yaml_profiles
+    return _FLAT
 
 
 def list_profiles():
     """
     Return a sorted list of supported profile names (union of built-in and YAML).
     """
-    built_in = set(_BASE_PROFILES.keys())
-    yaml_profiles = set(_load_profiles_from_yaml().keys())
-    all_profiles = built_in | yaml_profiles
-    return sorted(all_profiles)
+    return sorted(_BUILTIN_PROFILE_KEYS.union(_load_profiles_from_yaml()))
 
 
 def get_profile_strength(profile: str, sensor_name: str) -> float:
@@ -134,14 +237,33 @@ def get_profile_strength(profile: str, sensor_name: str) -> float:
     Raises:
         KeyError if profile is unknown in both YAML and built-ins.
     """
-    p_raw = profile.strip()
-    s_raw = sensor_name.strip()
+    flat = _flat_profiles()
 
-    p = p_raw.lower()
-    s = s_raw.lower()
+    # Fast path: names that are already normalized
+    strength = flat.get((profile, sensor_name))
+    if strength is not None:
+        return strength
 
-    yaml_profiles = _load_profiles_from_yaml()
+    p = profile.strip().lower()
+    s = sensor_name.strip().lower()
+
+    strength = flat.get((p, s))
+    if strength is not None:
+        return strength
 
+    strength = flat.get((p, "default"))
+    if strength is not None:
+        return strength
+
+    return _resolve_strength(profile, p, s, _load_profiles_from_yaml())
+
+
+def _resolve_strength(profile: str, p: str, s: str, yaml_profiles: Dict[str, Dict]) -> float:
+    """
+    Per-profile resolution for lookups not in the flat table: unknown
+    profiles and YAML entries that did not coerce. Raises the same errors
+    (KeyError, or the float() failure) as before the table existed.
+    """
     # 1) Check YAML overrides
     if p in yaml_profiles:
         cfg = yaml_profiles[p] or {}
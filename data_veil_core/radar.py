@@ -11,17 +11,26 @@ Output:
       - structured ripple noise
 """
 
+from functools import lru_cache
+from typing import Optional, Tuple
+
 import numpy as np
 from .random_control import get_rng
 
 
-def veil_radar(radar_map: np.ndarray, strength: float = 1.0) -> np.ndarray:
+def veil_radar(
+    radar_map: np.ndarray,
+    strength: float = 1.0,
+    *,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
     """
     Apply sci-fi veiling to a radar range–Doppler intensity map.
 
     Args:
         radar_map: 2D numpy array in arbitrary units.
         strength: distortion intensity.
+        rng: optional numpy Generator (default: shared get_rng())
 
     Returns:
         2D numpy array of same shape.
@@ -29,60 +38,87 @@ def veil_radar(radar_map: np.ndarray, strength: float = 1.0) -> np.ndarray:
     if radar_map.ndim != 2:
         raise ValueError("veil_radar expects a 2D array.")
 
-    rng = get_rng()
-    m = radar_map.astype(np.float32).copy()
-    rows, cols = m.shape
+    if rng is None:
+        rng = get_rng()
+    veiled = np.array(radar_map, dtype=np.float32, order="C")
+    rows, cols = veiled.shape
 
-    # Normalize to [0,1]
-    v_min = float(np.min(m))
-    v_max = float(np.max(m))
+    # All distortions are defined on the map normalized to [0,1]. Instead of
+    # normalizing and denormalizing the whole map, additive terms are scaled
+    # by span and the final clip uses the original range.
+    v_min = float(np.min(veiled))
+    v_max = float(np.max(veiled))
     span = max(v_max - v_min, 1e-6)
-    norm = (m - v_min) / span
 
     # --- 1) Ghost targets (random blobs) ---
     ghost_count = int(5 * strength)
-    r_lin = np.linspace(0, 1, rows)
-    v_lin = np.linspace(-1, 1, cols)
-    grid_r, grid_v = np.meshgrid(r_lin, v_lin, indexing="ij")
-
-    def gaussian(cx, cy, sx, sy, amp):
-        return amp * np.exp(
-            -(((grid_r - cx) ** 2) / (2 * sx ** 2)
-              + ((grid_v - cy) ** 2) / (2 * sy ** 2))
-        )
-
-    for _ in range(ghost_count):
-        cx = rng.uniform(0.05, 0.95)
-        cy = rng.uniform(-0.9, 0.9)
-        sx = rng.uniform(0.02, 0.1)
-        sy = rng.uniform(0.05, 0.2)
-        amp = rng.uniform(0.3, 1.0) * strength
-
-        norm += gaussian(cx, cy, sx, sy, amp)
+    r_lin = np.linspace(0, 1, rows, dtype=np.float32)
+    v_lin = np.linspace(-1, 1, cols, dtype=np.float32)
+
+    cx = rng.uniform(0.05, 0.95, size=ghost_count)
+    cy = rng.uniform(-0.9, 0.9, size=ghost_count)
+    sx = rng.uniform(0.02, 0.1, size=ghost_count)
+    sy = rng.uniform(0.05, 0.2, size=ghost_count)
+    amp = rng.uniform(0.3, 1.0, size=ghost_count) * (strength * span)
+
+    # Each blob is separable, amp * exp(-dr^2 / 2sx^2) * exp(-dv^2 / 2sy^2),
+    # so all of them are summed with one (rows, G) @ (G, cols) matmul.
+    g_r = np.subtract(r_lin[:, None], cx.astype(np.float32))
+    np.square(g_r, out=g_r)
+    g_r *= (-0.5 / sx ** 2).astype(np.float32)
+    np.exp(g_r, out=g_r)
+    g_r *= amp.astype(np.float32)
+    g_v = np.subtract(v_lin[None, :], cy.astype(np.float32)[:, None])
+    np.square(g_v, out=g_v)
+    g_v *= (-0.5 / sy ** 2).astype(np.float32)[:, None]
+    np.exp(g_v, out=g_v)
+    veiled += g_r @ g_v
 
     # --- 2) Attenuate real patches (erase lanes) ---
+    # Patch bounds and factors are pre-sampled as vectors, so the loop below
+    # only does in-place slice updates (scaling toward v_min).
     patch_count = int(4 * strength)
-    for _ in range(patch_count):
-        r0 = rng.integers(0, max(1, rows - 6))
-        c0 = rng.integers(0, max(1, cols - 4))
-        r1 = min(rows, r0 + rng.integers(3, 12))
-        c1 = min(cols, c0 + rng.integers(3, 8))
-        norm[r0:r1, c0:c1] *= rng.uniform(0.0, 0.3)  # almost wiped
+    r0 = rng.integers(0, max(1, rows - 6), size=patch_count)
+    c0 = rng.integers(0, max(1, cols - 4), size=patch_count)
+    r1 = np.minimum(rows, r0 + rng.integers(3, 12, size=patch_count))
+    c1 = np.minimum(cols, c0 + rng.integers(3, 8, size=patch_count))
+    attn = rng.uniform(0.0, 0.3, size=patch_count).astype(np.float32)  # almost wiped
+    for ra, rb, ca, cb, f in zip(r0.tolist(), r1.tolist(), c0.tolist(), c1.tolist(), attn):
+        patch = veiled[ra:rb, ca:cb]
+        patch -= np.float32(v_min)
+        patch *= f
+        patch += np.float32(v_min)
 
     # --- 3) Structured ripple + random noise ---
-    ripple_row = 0.04 * strength * np.sin(
-        np.linspace(0, 3 * np.pi, rows)
-    )[:, None]
-    ripple_col = 0.04 * strength * np.cos(
-        np.linspace(0, 4 * np.pi, cols)
-    )[None, :]
+    # Ripple shapes are cached per map size; only the scale depends on strength
+    ripple_row, ripple_col = _ripple_patterns(rows, cols)
+    ripple_scale = np.float32(0.04 * strength * span)
 
-    norm += ripple_row
-    norm += ripple_col
+    veiled += ripple_row * ripple_scale
+    veiled += ripple_col * ripple_scale
 
-    noise = rng.normal(loc=0.0, scale=0.04 * strength, size=norm.shape)
-    norm += noise
+    noise = rng.standard_normal(veiled.shape, dtype=np.float32)
+    noise *= np.float32(0.04 * strength * span)
+    veiled += noise
 
-    norm = np.clip(norm, 0.0, 1.0)
-    veiled = norm * span + v_min
+    np.clip(veiled, v_min, v_min + span, out=veiled)
     return veiled
+
+
+@lru_cache(maxsize=8)
+def _ripple_patterns(rows: int, cols: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-size ripple shapes, cached so streams of same-sized maps skip the
+    linspace and trig.
+
+    Returns read-only float32 arrays:
+        ripple_row: (rows, 1) sin over 0..3*pi
+        ripple_col: (1, cols) cos over 0..4*pi
+    """
+    ripple_row = np.sin(np.linspace(0, 3 * np.pi, rows, dtype=np.float32))[:, None]
+    ripple_col = np.cos(np.linspace(0, 4 * np.pi, cols, dtype=np.float32))[None, :]
+
+    out = (ripple_row, ripple_col)
+    for arr in out:
+        arr.flags.writeable = False
+    return out
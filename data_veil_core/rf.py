@@ -20,18 +20,25 @@ Goal:
     while remaining plausible on inspection.
 """
 
-from typing import Dict
+from typing import Dict, Optional
 import numpy as np
 from .random_control import get_rng
+from .windows import ragged_windows
 
 
-def veil_rf(rf: Dict[str, np.ndarray], strength: float = 1.0) -> Dict[str, np.ndarray]:
+def veil_rf(
+    rf: Dict[str, np.ndarray],
+    strength: float = 1.0,
+    *,
+    rng: Optional[np.random.Generator] = None,
+) -> Dict[str, np.ndarray]:
     """
     Veil RF power time series.
 
     Args:
         rf: dict with keys "t", "power"
         strength: distortion intensity (0.5 .. 2.0 typical)
+        rng: optional numpy Generator (default: shared get_rng())
 
     Returns:
         new dict with same keys.
@@ -41,7 +48,7 @@ def veil_rf(rf: Dict[str, np.ndarray], strength: float = 1.0) -> Dict[str, np.nd
     if missing:
         raise ValueError(f"veil_rf missing keys: {missing}")
 
-    veiled = {k: np.asarray(v, dtype=np.float32).copy() for k, v in rf.items()}
+    veiled = {k: np.array(v, dtype=np.float32, order="C") for k, v in rf.items()}
     t = veiled["t"]
     power = veiled["power"]
     n = t.shape[0]
@@ -49,7 +56,8 @@ def veil_rf(rf: Dict[str, np.ndarray], strength: float = 1.0) -> Dict[str, np.nd
     if n == 0:
         return veiled
 
-    rng = get_rng()
+    if rng is None:
+        rng = get_rng()
 
     p_min = float(power.min())
     p_max = float(power.max())
@@ -58,27 +66,34 @@ def veil_rf(rf: Dict[str, np.ndarray], strength: float = 1.0) -> Dict[str, np.nd
     std = max(std, 1e-3)
 
     # Normalize time 0..1
-    t_norm = (t - t[0]) / max(t[-1] - t[0], 1e-6)
+    t_norm = np.subtract(t, t[0])
+    t_norm *= np.float32(1.0 / max(float(t[-1] - t[0]), 1e-6))
 
     # --- 1) Multi-frequency baseline warping ---
 
     freqs = np.array([0.15, 0.4, 0.8], dtype=np.float32) * strength
     phases = rng.uniform(0.0, 2.0 * np.pi, size=freqs.shape[0])
 
-    baseline_warp = np.zeros_like(t_norm, dtype=np.float32)
-    for i, f in enumerate(freqs):
-        angle = 2.0 * np.pi * f * t_norm + phases[i]
-        if i == 0:
-            baseline_warp += 0.7 * np.sin(angle)
-        elif i == 1:
-            baseline_warp += 0.5 * np.cos(angle)
-        else:
-            baseline_warp += 0.4 * np.sin(angle + 0.6) * np.cos(0.4 * angle)
+    # Per component: sin, cos, and a skewed product, all written as plain
+    # sines of scaled/offset angles so the bank is one np.sin and one matmul:
+    #   0.7 * sin(a0)
+    #   0.5 * cos(a1)                     = 0.5 * sin(a1 + pi/2)
+    #   0.4 * sin(a2 + 0.6) * cos(0.4*a2) = 0.2 * (sin(1.4*a2 + 0.6) + sin(0.6*a2 + 0.6))
+    comp = np.array([0, 1, 2, 2])
+    mult = np.array([1.0, 1.0, 1.4, 0.6])
+    offset = np.array([0.0, 0.5 * np.pi, 0.6, 0.6])
+    weights = np.array([0.7, 0.5, 0.2, 0.2], dtype=np.float32)
+
+    angles = np.outer(t_norm, (2.0 * np.pi * mult * freqs[comp]).astype(np.float32))
+    angles += (mult * phases[comp] + offset).astype(np.float32)
+    baseline_warp = np.sin(angles, out=angles) @ weights
 
     # Add slow cumulative drift so pattern is not just sinusoidal
     step_sigma = 0.01 * strength
-    steps = rng.normal(0.0, step_sigma, size=n).astype(np.float32)
-    cumulative = np.cumsum(steps)
+    # drawn, scaled and integrated in one float32 buffer
+    cumulative = rng.standard_normal(n, dtype=np.float32)
+    cumulative *= np.float32(step_sigma)
+    np.cumsum(cumulative, out=cumulative)
 
     baseline_warp += cumulative
 
@@ -91,38 +106,40 @@ def veil_rf(rf: Dict[str, np.ndarray], strength: float = 1.0) -> Dict[str, np.nd
     burst_count = int(3 * strength) + rng.integers(0, 4)
     burst_count = max(burst_count, 1)
 
-    for _ in range(burst_count):
-        center = rng.integers(5, max(6, n - 5))
-        span_len = rng.integers(15, 80)
-        end = min(n, center + span_len)
-        if end <= center:
-            continue
-
-        window_len = end - center
-        base = np.linspace(0.0, 1.0, window_len, dtype=np.float32)
-
-        # Different interference patterns
-        shape_type = rng.choice(["spike_train", "block", "notch"])
-        if shape_type == "spike_train":
-            # intermittent spikes within a shaped envelope
-            spikes = (rng.random(size=window_len) > 0.6).astype(np.float32)
-            envelope = base * (1.0 - base) * 4.0
-            shape = spikes * envelope
-        elif shape_type == "block":
-            # plateau with soft edges
-            shape = base * (1.0 - base) * 4.0
-        else:  # "notch" – signal drop region
-            shape = -base * (1.0 - base) * 4.0
-
-        amp = (1.0 + 1.5 * rng.random()) * std * strength
-        power[center:end] += amp * shape
+    # All bursts are sampled up front and applied with one scatter-add.
+    centers = rng.integers(5, max(6, n - 5), size=burst_count)
+    span_lens = rng.integers(15, 80, size=burst_count)
+    # Different interference patterns: 0=spike_train, 1=block, 2=notch
+    shape_types = rng.integers(0, 3, size=burst_count)
+    amps = (1.0 + 1.5 * rng.random(size=burst_count)) * std * strength
+
+    idx, base, owner = ragged_windows(centers, span_lens, n)
+    kind = shape_types[owner]
+    # plateau with soft edges; negated for a "notch" (signal drop region)
+    shape = base * (1.0 - base) * 4.0
+    # intermittent spikes within the same envelope
+    spikes = rng.random(size=idx.shape[0]) > 0.6
+    shape[(kind == 0) & ~spikes] = 0.0
+    shape[kind == 2] *= -1.0
+
+    np.add.at(power, idx, (amps[owner] * shape).astype(np.float32))
 
     # --- 3) Adaptive noise (time-varying variance) ---
 
     noise_sigma = 0.05 * span * strength
     env_phase = rng.uniform(0.0, 2.0 * np.pi)
-    env = 0.4 + 0.6 * np.abs(np.sin(2.0 * np.pi * 0.07 * t_norm + env_phase))
-    power += rng.normal(0.0, noise_sigma * env, size=n)
+    # 0.4 + 0.6 * |sin(2*pi*0.07*t_norm + env_phase)|, built in the t_norm buffer
+    env = t_norm
+    env *= np.float32(2.0 * np.pi * 0.07)
+    env += np.float32(env_phase)
+    np.sin(env, out=env)
+    np.abs(env, out=env)
+    env *= np.float32(0.6)
+    env += np.float32(0.4)
+    noise = rng.standard_normal(n, dtype=np.float32)
+    noise *= env
+    noise *= np.float32(noise_sigma)
+    power += noise
 
     veiled["power"] = power
 
@@ -11,17 +11,25 @@ Output:
       - thermal "ghosts" and wiped regions
 """
 
+from typing import List, Optional, Tuple
+
 import numpy as np
 from .random_control import get_rng
 
 
-def veil_thermal(thermal: np.ndarray, strength: float = 1.0) -> np.ndarray:
+def veil_thermal(
+    thermal: np.ndarray,
+    strength: float = 1.0,
+    *,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
     """
     Veil thermal data with phantom heat / cold signatures.
 
     Args:
         thermal: 2D numpy array
         strength: intensity of veiling
+        rng: optional numpy Generator (default: shared get_rng())
 
     Returns:
         2D numpy array of same shape.
@@ -29,71 +37,82 @@ def veil_thermal(thermal: np.ndarray, strength: float = 1.0) -> np.ndarray:
     if thermal.ndim != 2:
         raise ValueError("veil_thermal expects a 2D array.")
 
-    t = thermal.astype(np.float32).copy()
-    h, w = t.shape
-    rng = get_rng()
+    veiled = np.array(thermal, dtype=np.float32, order="C")
+    h, w = veiled.shape
+    if rng is None:
+        rng = get_rng()
 
-    t_min = float(np.min(t))
-    t_max = float(np.max(t))
+    t_min = float(np.min(veiled))
+    t_max = float(np.max(veiled))
     span = max(t_max - t_min, 1e-3)
 
-    # Normalize
-    norm = (t - t_min) / span
+    # All distortions are defined on the map normalized to [0,1]. Instead of
+    # normalizing and denormalizing the whole map, offsets are scaled by span
+    # and clips use the matching range [lo, hi] in original units.
+    lo = t_min
+    hi = t_min + span
 
     # --- 1) Phantom hot/cold spots ---
 
+    # Spot bounds and polarity are pre-sampled as vectors; each spot is then
+    # a single in-place add + clip on its slice.
     spot_count = int(6 * strength)
-    for _ in range(spot_count):
-        cy = rng.integers(0, h)
-        cx = rng.integers(0, w)
-        ry = rng.integers(h // 20, h // 8 + 1)
-        rx = rng.integers(w // 20, w // 8 + 1)
-        y0 = max(cy - ry, 0)
-        y1 = min(cy + ry, h)
-        x0 = max(cx - rx, 0)
-        x1 = min(cx + rx, w)
-
-        # Randomly choose hot or cold
-        if rng.random() < 0.5:
-            # Hot patch
-            norm[y0:y1, x0:x1] = np.clip(norm[y0:y1, x0:x1] + 0.4 * strength, 0.0, 1.0)
-        else:
-            # Cold patch
-            norm[y0:y1, x0:x1] = np.clip(norm[y0:y1, x0:x1] - 0.4 * strength, 0.0, 1.0)
+    y0, y1, x0, x1 = _sample_boxes(rng, h, w, spot_count, 20, 8)
+    # Randomly choose hot or cold
+    hot = rng.random(size=spot_count) < 0.5
+    delta = np.where(hot, 0.4 * strength * span, -0.4 * strength * span).astype(np.float32)
+    for ya, yb, xa, xb, d in zip(y0, y1, x0, x1, delta):
+        patch = veiled[ya:yb, xa:xb]
+        patch += d
+        np.clip(patch, lo, hi, out=patch)
 
     # --- 2) Directional smear (simulated conduction / blur streaks) ---
 
-    yy, xx = np.mgrid[0:h, 0:w]
     angle = rng.uniform(0, 2 * np.pi)
     dir_y = np.sin(angle)
     dir_x = np.cos(angle)
 
-    # create a ramp aligned with the chosen direction
-    ramp = (yy * dir_y + xx * dir_x) / max(h, w)
-    smear = 0.15 * strength * ramp
-    norm = np.clip(norm + smear, 0.0, 1.0)
+    # create a ramp aligned with the chosen direction; it is the outer sum of
+    # a row and a column term, so it is added as two broadcast 1D vectors
+    smear = 0.15 * strength * span / max(h, w)
+    veiled += (np.arange(h, dtype=np.float32) * np.float32(dir_y * smear))[:, None]
+    veiled += np.arange(w, dtype=np.float32) * np.float32(dir_x * smear)
+    np.clip(veiled, lo, hi, out=veiled)
 
     # --- 3) Erase some structure (flat dead zones) ---
 
     zone_count = int(3 * strength)
-    for _ in range(zone_count):
-        cy = rng.integers(0, h)
-        cx = rng.integers(0, w)
-        ry = rng.integers(h // 10, h // 5 + 1)
-        rx = rng.integers(w // 10, w // 5 + 1)
-        y0 = max(cy - ry, 0)
-        y1 = min(cy + ry, h)
-        x0 = max(cx - rx, 0)
-        x1 = min(cx + rx, w)
-
+    y0, y1, x0, x1 = _sample_boxes(rng, h, w, zone_count, 10, 5)
+    for ya, yb, xa, xb in zip(y0, y1, x0, x1):
         # flatten to mean
-        region = norm[y0:y1, x0:x1]
-        norm[y0:y1, x0:x1] = float(np.mean(region))
+        region = veiled[ya:yb, xa:xb]
+        region[...] = float(np.mean(region))
 
     # --- 4) Add noise ---
 
-    noise = rng.normal(loc=0.0, scale=0.05 * strength, size=norm.shape)
-    norm = np.clip(norm + noise, 0.0, 1.0)
+    noise = rng.standard_normal(veiled.shape, dtype=np.float32)
+    noise *= np.float32(0.05 * strength * span)
+    veiled += noise
+    np.clip(veiled, lo, hi, out=veiled)
 
-    veiled = norm * span + t_min
     return veiled
+
+
+def _sample_boxes(
+    rng: np.random.Generator, h: int, w: int, count: int, lo_div: int, hi_div: int
+) -> Tuple[List[int], List[int], List[int], List[int]]:
+    """
+    Draw `count` boxes centred at random pixels with half-extents between
+    size // lo_div and size // hi_div, clipped to the map.
+
+    Returns lists (y0, y1, x0, x1) of Python ints, ready for slicing.
+    """
+    cy = rng.integers(0, h, size=count)
+    cx = rng.integers(0, w, size=count)
+    ry = rng.integers(h // lo_div, h // hi_div + 1, size=count)
+    rx = rng.integers(w // lo_div, w // hi_div + 1, size=count)
+    y0 = np.maximum(cy - ry, 0).tolist()
+    y1 = np.minimum(cy + ry, h).tolist()
+    x0 = np.maximum(cx - rx, 0).tolist()
+    x1 = np.minimum(cx + rx, w).tolist()
+    return y0, y1, x0, x1
@@ -18,18 +18,24 @@ Goal:
     while still looking like valid sensor behavior.
 """
 
-from typing import Dict
+from typing import Dict, Optional
 import numpy as np
 from .random_control import get_rng
 
 
-def veil_ultrasonic(us: Dict[str, np.ndarray], strength: float = 1.0) -> Dict[str, np.ndarray]:
+def veil_ultrasonic(
+    us: Dict[str, np.ndarray],
+    strength: float = 1.0,
+    *,
+    rng: Optional[np.random.Generator] = None,
+) -> Dict[str, np.ndarray]:
     """
     Veil ultrasonic time series.
 
     Args:
         us: dict with keys "t", "range"
         strength: distortion intensity (0.5 .. 2.0 typical)
+        rng: optional numpy Generator (default: shared get_rng())
 
     Returns:
         new dict with same keys.
@@ -39,7 +45,7 @@ def veil_ultrasonic(us: Dict[str, np.ndarray], strength: float = 1.0) -> Dict[st
     if missing:
         raise ValueError(f"veil_ultrasonic missing keys: {missing}")
 
-    veiled = {k: np.asarray(v, dtype=np.float32).copy() for k, v in us.items()}
+    veiled = {k: np.array(v, dtype=np.float32, order="C") for k, v in us.items()}
     t = veiled["t"]
     r = veiled["range"]
     n = t.shape[0]
@@ -47,7 +53,8 @@ def veil_ultrasonic(us: Dict[str, np.ndarray], strength: float = 1.0) -> Dict[st
     if n == 0:
         return veiled
 
-    rng = get_rng()
+    if rng is None:
+        rng = get_rng()
 
     r_min = float(r.min())
     r_max = float(r.max())
@@ -56,25 +63,29 @@ def veil_ultrasonic(us: Dict[str, np.ndarray], strength: float = 1.0) -> Dict[st
     std = max(std, 1e-3)
 
     # Normalize time 0..1
-    t_norm = (t - t[0]) / max(t[-1] - t[0], 1e-6)
+    t_norm = np.subtract(t, t[0])
+    t_norm *= np.float32(1.0 / max(float(t[-1] - t[0]), 1e-6))
 
     # --- 1) Baseline warping (slight bias over time) ---
 
     freqs = np.array([0.2, 0.5], dtype=np.float32) * strength
     phases = rng.uniform(0.0, 2.0 * np.pi, size=freqs.shape[0])
 
-    baseline = np.zeros_like(t_norm, dtype=np.float32)
-    for i, f in enumerate(freqs):
-        angle = 2.0 * np.pi * f * t_norm + phases[i]
-        if i == 0:
-            baseline += 0.7 * np.sin(angle)
-        else:
-            baseline += 0.5 * np.cos(angle)
+    # 0.7 * sin(a0) + 0.5 * cos(a1), with cos(a1) = sin(a1 + pi/2) so both
+    # terms come from one np.sin over an (N, 2) angle block.
+    offset = np.array([0.0, 0.5 * np.pi])
+    weights = np.array([0.7, 0.5], dtype=np.float32)
+
+    angles = np.outer(t_norm, (2.0 * np.pi * freqs).astype(np.float32))
+    angles += (phases + offset).astype(np.float32)
+    baseline = np.sin(angles, out=angles) @ weights
 
     # add small cumulative bias so it does not repeat perfectly
     step_sigma = 0.005 * strength
-    steps = rng.normal(0.0, step_sigma, size=n).astype(np.float32)
-    cumulative = np.cumsum(steps)
+    # drawn, scaled and integrated in one float32 buffer
+    cumulative = rng.standard_normal(n, dtype=np.float32)
+    cumulative *= np.float32(step_sigma)
+    np.cumsum(cumulative, out=cumulative)
 
     baseline += cumulative
 
@@ -88,6 +99,9 @@ def veil_ultrasonic(us: Dict[str, np.ndarray], strength: float = 1.0) -> Dict[st
     event_count = int(3 * strength) + rng.integers(0, 3)
     event_count = max(event_count, 1)
 
+    # Blend target per event type (dead_max, dead_min, phantom)
+    targets = (r_max + 0.1 * span, max(r_min - 0.1 * span, 0.0), r_min + 0.2 * span)
+
     for _ in range(event_count):
         center = rng.integers(5, max(6, n - 5))
         span_len = rng.integers(10, 60)
@@ -99,29 +113,30 @@ def veil_ultrasonic(us: Dict[str, np.ndarray], strength: float = 1.0) -> Dict[st
         base = np.linspace(0.0, 1.0, window_len, dtype=np.float32)
         envelope = base * (1.0 - base) * 4.0
 
-        event_type = rng.choice(["dead_max", "dead_min", "phantom"])
-        if event_type == "dead_max":
-            # push toward max range (like nothing detected)
-            target = r_max + 0.1 * span
-            r[center:end] = r[center:end] * (1.0 - envelope) + target * envelope
-        elif event_type == "dead_min":
-            # push toward very near obstacle
-            target = max(r_min - 0.1 * span, 0.0)
-            r[center:end] = r[center:end] * (1.0 - envelope) + target * envelope
-        else:  # phantom
-            # create a band of shorter ranges than usual
-            target = r_min + 0.2 * span
-            r[center:end] = r[center:end] * (1.0 - envelope) + target * envelope
+        # 0=dead_max: push toward max range (like nothing detected)
+        # 1=dead_min: push toward very near obstacle
+        # 2=phantom:  create a band of shorter ranges than usual
+        target = targets[rng.integers(0, 3)]
+        r[center:end] = r[center:end] * (1.0 - envelope) + target * envelope
 
     # --- 3) Adaptive jitter/noise ---
 
     noise_sigma = 0.02 * span * strength
     env_phase = rng.uniform(0.0, 2.0 * np.pi)
-    env = 0.6 + 0.4 * np.sin(2.0 * np.pi * 0.08 * t_norm + env_phase)
-    r += rng.normal(0.0, noise_sigma * env, size=n)
+    # 0.6 + 0.4 * sin(2*pi*0.08*t_norm + env_phase), built in the t_norm buffer
+    env = t_norm
+    env *= np.float32(2.0 * np.pi * 0.08)
+    env += np.float32(env_phase)
+    np.sin(env, out=env)
+    env *= np.float32(0.4)
+    env += np.float32(0.6)
+    noise = rng.standard_normal(n, dtype=np.float32)
+    noise *= env
+    noise *= np.float32(noise_sigma)
+    r += noise
 
     # Keep within plausible bounds (no negative distances)
-    r = np.clip(r, 0.0, r_max + 0.5 * span)
+    np.clip(r, 0.0, r_max + 0.5 * span, out=r)
 
     veiled["range"] = r
 
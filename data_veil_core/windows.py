@@ -0,0 +1,48 @@
+"""
+Window helpers for batched time-series anomalies.
+
+Several veils inject short shaped events ("bumps", "dips", bursts) into
+1D series. Instead of looping over events in Python, callers sample all
+event starts/lengths at once and use ragged_windows() to get one flat
+index array covering every event, plus the 0..1 position inside each
+event (the same values np.linspace(0, 1, length) would give).
+"""
+
+from typing import Tuple
+import numpy as np
+
+
+def ragged_windows(
+    starts: np.ndarray,
+    lengths: np.ndarray,
+    n: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Flatten a batch of [start, start + length) windows into index arrays.
+
+    Windows are truncated to the series length n; empty windows are dropped.
+
+    Args:
+        starts:  (K,) integer window starts
+        lengths: (K,) integer requested window lengths
+        n:       series length
+
+    Returns:
+        positions: (M,) flat indices into the series
+        u:         (M,) float32 position within each window, 0..1
+        owner:     (M,) index of the window each element belongs to
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    lengths = np.minimum(np.asarray(lengths, dtype=np.int64), n - starts)
+    lengths = np.maximum(lengths, 0)
+
+    owner = np.repeat(np.arange(starts.shape[0]), lengths)
+    # Offset of each element from the start of its own window
+    first = np.cumsum(lengths) - lengths
+    offsets = np.arange(owner.shape[0]) - first[owner]
+
+    positions = starts[owner] + offsets
+    denom = np.maximum(lengths - 1, 1)[owner]
+    u = (offsets / denom).astype(np.float32)
+
+    return positions, u, owner
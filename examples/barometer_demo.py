@@ -22,7 +22,7 @@ from data_veil_core.random_control import get_rng
 
 def synth_barometer(n: int = 500, dt: float = 0.1) -> dict:
     rng = get_rng()
-    t = np.linspace(0, (n - 1) * dt, n, dtype=np.float32)
+    t = np.arange(n, dtype=np.float32) * np.float32(dt)
 
     # Base sea-level like pressure with slow oscillation
     base_pressure = 1013.0  # hPa
@@ -28,7 +28,7 @@ from data_veil_core.random_control import get_rng
 
 def synth_timeseries(n: int = 400, dt: float = 0.05):
     rng = get_rng()
-    t = np.linspace(0, (n - 1) * dt, n, dtype=np.float32)
+    t = np.arange(n, dtype=np.float32) * np.float32(dt)
 
     # Simulated "forward mean depth" (meters)
     depth_base = 2.0 + 0.2 * np.sin(2.0 * np.pi * 0.03 * t)
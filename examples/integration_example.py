@@ -17,8 +17,11 @@ This version:
   - Avoids unicode characters so Windows consoles don't choke.
 """
 
+import math
 import os
 import sys
+from functools import lru_cache
+
 import numpy as np
 
 # --- Ensure project root is on sys.path ---
@@ -27,13 +30,7 @@ PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-from data_veil_core import (
-    veil_depth,
-    veil_lidar,
-    veil_thermal,
-    veil_radar,
-    veil_imu,
-)
+from data_veil_core import veil_bundle
 from data_veil_core.random_control import get_rng
 
 # Shared RNG (respects DATA_VEIL_SEED)
@@ -41,54 +38,76 @@ rng = get_rng()
 
 
 def synth_depth(h: int = 64, w: int = 96) -> np.ndarray:
-    yy, xx = np.mgrid[0:h, 0:w]
-    yy_norm = yy / max(h - 1, 1)
-    xx_norm = xx / max(w - 1, 1)
-    base = 1.0 + 2.0 * yy_norm + 0.5 * np.sin(2 * np.pi * xx_norm)
-    noise = rng.normal(0.0, 0.03, size=base.shape)
-    return base + noise
+    # Row gradient + column wave, built as an outer sum of two 1D profiles
+    yy_norm = np.arange(h, dtype=np.float32) / max(h - 1, 1)
+    xx_norm = np.arange(w, dtype=np.float32) / max(w - 1, 1)
+    base = np.add.outer(1.0 + 2.0 * yy_norm, 0.5 * np.sin(2 * np.pi * xx_norm))
+    noise = rng.standard_normal(base.shape, dtype=np.float32)
+    noise *= np.float32(0.03)
+    base += noise
+    return base
+
+
+# Wall sectors for synth_lidar_ranges, in radians
+_FRONT_HALF_WIDTH = math.radians(25)
+_SIDE_START = math.radians(60)
+_SIDE_END = math.radians(120)
+
+
+@lru_cache(maxsize=4)
+def _lidar_scene(n: int) -> np.ndarray:
+    """
+    Noise-free ranges of the synthetic room for n beams, cached per beam
+    count (read-only float32).
+    """
+    angles = np.linspace(-np.pi, np.pi, n, dtype=np.float32)
+    base = np.full(n, 4.0, dtype=np.float32)
+    base[np.abs(angles) < _FRONT_HALF_WIDTH] = 1.5  # wall in front
+    base[(angles > _SIDE_START) & (angles < _SIDE_END)] = 2.5
+    base.flags.writeable = False
+    return base
 
 
 def synth_lidar_ranges(n: int = 128) -> np.ndarray:
-    angles = np.linspace(-np.pi, np.pi, n)
-    base = 4.0 * np.ones_like(angles)
-    front = np.abs(angles) < np.deg2rad(25)
-    base[front] = 1.5  # wall in front
-    side = (angles > np.deg2rad(60)) & (angles < np.deg2rad(120))
-    base[side] = 2.5
-    noise = rng.normal(0.0, 0.05, size=base.shape)
-    return base + noise
+    noise = rng.standard_normal(n, dtype=np.float32)
+    noise *= np.float32(0.05)
+    noise += _lidar_scene(n)
+    return noise
 
 
 def synth_radar_map(r: int = 48, v: int = 32) -> np.ndarray:
     # simple blob + noise
-    rows = np.linspace(0, 1, r)
-    cols = np.linspace(-1, 1, v)
-    grid_r, grid_v = np.meshgrid(rows, cols, indexing="ij")
-    base = 0.05 * np.ones_like(grid_r)
-
-    # one target
-    base += np.exp(
-        -(((grid_r - 0.5) ** 2) / (2 * 0.05 ** 2)
-          + ((grid_v - 0.2) ** 2) / (2 * 0.15 ** 2))
-    )
+    rows = np.linspace(0, 1, r, dtype=np.float32)
+    cols = np.linspace(-1, 1, v, dtype=np.float32)
+
+    # one target; the Gaussian is separable, so it is the outer product of
+    # a range profile and a velocity profile (no full-grid temporaries)
+    g_r = np.exp(-((rows - 0.5) ** 2) / (2 * 0.05 ** 2))
+    g_v = np.exp(-((cols - 0.2) ** 2) / (2 * 0.15 ** 2))
 
-    noise = rng.normal(0.0, 0.02, size=base.shape)
-    return np.clip(base + noise, 0.0, None)
+    noise = rng.standard_normal((r, v), dtype=np.float32)
+    noise *= np.float32(0.02)
+    base = np.multiply.outer(g_r, g_v)
+    base += 0.05
+    base += noise
+    return np.maximum(base, 0.0, out=base)
 
 
 def synth_thermal(h: int = 48, w: int = 64) -> np.ndarray:
-    yy, xx = np.mgrid[0:h, 0:w]
     center_y = h / 2
     center_x = w / 2
-    dist = np.sqrt((yy - center_y) ** 2 + (xx - center_x) ** 2)
-    base = 25.0 + 10.0 * np.exp(-(dist ** 2) / (2 * (min(h, w) / 4) ** 2))
-    noise = rng.normal(0.0, 0.3, size=base.shape)
-    return base + noise
+    # squared distance from the center via broadcast row/column offsets
+    dy2 = ((np.arange(h, dtype=np.float32) - center_y) ** 2)[:, None]
+    dx2 = ((np.arange(w, dtype=np.float32) - center_x) ** 2)[None, :]
+    base = 25.0 + 10.0 * np.exp(-(dy2 + dx2) / (2 * (min(h, w) / 4) ** 2))
+    noise = rng.standard_normal(base.shape, dtype=np.float32)
+    noise *= np.float32(0.3)
+    base += noise
+    return base
 
 
 def synth_imu(n: int = 200, dt: float = 0.01) -> dict:
-    t = np.linspace(0, (n - 1) * dt, n)
+    t = np.arange(n, dtype=np.float32) * np.float32(dt)
 
     # Smooth rotation around Z
     gz = 0.4 * np.sin(2 * np.pi * 0.5 * t)
@@ -101,14 +120,13 @@ def synth_imu(n: int = 200, dt: float = 0.01) -> dict:
     ay = 0.3 * np.cos(2 * np.pi * 0.4 * t)
     az = -g + 0.1 * np.sin(2 * np.pi * 0.6 * t)
 
-    # measurement noise (use shared RNG)
-    gx += rng.normal(0.0, 0.005, size=n)
-    gy += rng.normal(0.0, 0.005, size=n)
-    gz += rng.normal(0.0, 0.01, size=n)
-
-    ax += rng.normal(0.0, 0.02, size=n)
-    ay += rng.normal(0.0, 0.02, size=n)
-    az += rng.normal(0.0, 0.02, size=n)
+    # measurement noise (use shared RNG), one draw for all six channels
+    signals = np.stack([gx, gy, gz, ax, ay, az])
+    sigmas = np.array([0.005, 0.005, 0.01, 0.02, 0.02, 0.02], dtype=np.float32)[:, None]
+    noise = rng.standard_normal(signals.shape, dtype=np.float32)
+    noise *= sigmas
+    signals += noise
+    gx, gy, gz, ax, ay, az = signals
 
     return {
         "t": t,
@@ -125,17 +143,41 @@ def summarize_sensor(name: str, trusted, veiled) -> None:
     """
     Utility to print basic stats before/after veiling.
     (No unicode so Windows encoding doesn't complain.)
+
+    trusted / veiled may be arrays or equal-length sequences of 1D channels
+    (e.g. gx, gy, gz); channels are reduced one by one instead of stacked.
     """
-    trusted_arr = np.asarray(trusted)
-    veiled_arr = np.asarray(veiled)
+    if isinstance(trusted, (list, tuple)):
+        trusted_parts = [np.asarray(a) for a in trusted]
+        veiled_parts = [np.asarray(a) for a in veiled]
+        shape = (len(trusted_parts),) + trusted_parts[0].shape
+    else:
+        trusted_parts = [np.asarray(trusted)]
+        veiled_parts = [np.asarray(veiled)]
+        shape = trusted_parts[0].shape
+
+    t_min = min(a.min() for a in trusted_parts)
+    t_max = max(a.max() for a in trusted_parts)
+    v_min = min(a.min() for a in veiled_parts)
+    v_max = max(a.max() for a in veiled_parts)
+
+    # |trusted - veiled| per channel, each in a single buffer
+    diff_sum = 0.0
+    diff_max = 0.0
+    count = 0
+    for t_arr, v_arr in zip(trusted_parts, veiled_parts):
+        diff = np.subtract(t_arr, v_arr)
+        np.abs(diff, out=diff)
+        diff_sum += float(diff.sum())
+        diff_max = max(diff_max, float(diff.max()))
+        count += diff.size
 
     print(f"\n=== {name} ===")
-    print(f"  shape:             {trusted_arr.shape}")
-    print(f"  trusted min..max:  {trusted_arr.min():.3f} .. {trusted_arr.max():.3f}")
-    print(f"  veiled  min..max:  {veiled_arr.min():.3f} .. {veiled_arr.max():.3f}")
-    diff = np.abs(trusted_arr - veiled_arr)
-    print(f"  mean abs diff:     {diff.mean():.3f}")
-    print(f"  max  abs diff:     {diff.max():.3f}")
+    print(f"  shape:             {shape}")
+    print(f"  trusted min..max:  {t_min:.3f} .. {t_max:.3f}")
+    print(f"  veiled  min..max:  {v_min:.3f} .. {v_max:.3f}")
+    print(f"  mean abs diff:     {diff_sum / count:.3f}")
+    print(f"  max  abs diff:     {diff_max:.3f}")
 
 
 def main():
@@ -146,28 +188,40 @@ def main():
     thermal = synth_thermal()
     imu = synth_imu()
 
-    # On the exposure boundary, you decide to veil them
-    depth_veiled = veil_depth(depth, strength=1.2)
-    lidar_veiled = veil_lidar(lidar_ranges, strength=1.3)
-    radar_veiled = veil_radar(radar_map, strength=1.0)
-    thermal_veiled = veil_thermal(thermal, strength=1.0)
-    imu_veiled = veil_imu(imu, strength=1.0)
+    # On the exposure boundary, you decide to veil them (one call for the
+    # whole snapshot; unlisted sensors use strength 1.0)
+    veiled = veil_bundle(
+        {
+            "depth": depth,
+            "lidar": lidar_ranges,
+            "radar": radar_map,
+            "thermal": thermal,
+            "imu": imu,
+        },
+        strengths={"depth": 1.2, "lidar": 1.3},
+    )
+    depth_veiled = veiled["depth"]
+    lidar_veiled = veiled["lidar"]
+    radar_veiled = veiled["radar"]
+    thermal_veiled = veiled["thermal"]
+    imu_veiled = veiled["imu"]
 
     summarize_sensor("Depth", depth, depth_veiled)
     summarize_sensor("LiDAR ranges", lidar_ranges, lidar_veiled)
     summarize_sensor("Radar map", radar_map, radar_veiled)
     summarize_sensor("Thermal", thermal, thermal_veiled)
 
-    # IMU is a dict; summarize gyro and accel separately
+    # IMU is a dict; summarize gyro and accel separately (per-channel,
+    # no stacking)
     summarize_sensor(
         "IMU gyro (gx, gy, gz)",
-        np.vstack([imu["gx"], imu["gy"], imu["gz"]]),
-        np.vstack([imu_veiled["gx"], imu_veiled["gy"], imu_veiled["gz"]]),
+        (imu["gx"], imu["gy"], imu["gz"]),
+        (imu_veiled["gx"], imu_veiled["gy"], imu_veiled["gz"]),
     )
     summarize_sensor(
         "IMU accel (ax, ay, az)",
-        np.vstack([imu["ax"], imu["ay"], imu["az"]]),
-        np.vstack([imu_veiled["ax"], imu_veiled["ay"], imu_veiled["az"]]),
+        (imu["ax"], imu["ay"], imu["az"]),
+        (imu_veiled["ax"], imu_veiled["ay"], imu_veiled["az"]),
     )
 
     print("\nIntegration example complete.")
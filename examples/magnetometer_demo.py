@@ -22,16 +22,16 @@ from data_veil_core.random_control import get_rng
 
 def synth_magnetometer(n: int = 300, dt: float = 0.05) -> dict:
     rng = get_rng()
-    t = np.linspace(0, (n - 1) * dt, n, dtype=np.float32)
+    t = np.arange(n, dtype=np.float32) * np.float32(dt)
 
     # Base field roughly pointing in some direction with small motion
     base_dir = np.array([0.3, 0.1, 0.9], dtype=np.float32)
     base_dir /= max(np.linalg.norm(base_dir), 1e-6)
 
     mag_strength = 45.0  # microtesla scale
-    mx = np.full(n, mag_strength * base_dir[0], dtype=np.float32)
-    my = np.full(n, mag_strength * base_dir[1], dtype=np.float32)
-    mz = np.full(n, mag_strength * base_dir[2], dtype=np.float32)
+    # the base field is the same vector at every sample, so it is kept as
+    # one (3,) vector rather than three constant (n,) arrays
+    base_field = (mag_strength * base_dir).astype(np.float32)
 
     # small oscillations as the robot turns
     yaw = 0.5 * np.sin(2 * np.pi * 0.1 * t)
@@ -44,29 +44,31 @@ def synth_magnetometer(n: int = 300, dt: float = 0.05) -> dict:
     sin_pitch = np.sin(pitch)
 
     # for simplicity, apply yaw then pitch
-    # base vector in world frame:
-    bx = mx.copy()
-    by = my.copy()
-    bz = mz.copy()
-
-    # yaw around Z
-    x_yaw = bx * cos_yaw - by * sin_yaw
-    y_yaw = bx * sin_yaw + by * cos_yaw
-    z_yaw = bz
-
-    # pitch around Y
-    x_rot = x_yaw * cos_pitch + z_yaw * sin_pitch
-    y_rot = y_yaw
-    z_rot = -x_yaw * sin_pitch + z_yaw * cos_pitch
-
-    mx = x_rot
-    my = y_rot
-    mz = z_rot
-
-    # measurement noise
-    mx += rng.normal(0.0, 0.1, size=n)
-    my += rng.normal(0.0, 0.1, size=n)
-    mz += rng.normal(0.0, 0.1, size=n)
+    # Per-sample rotation R = R_pitch(around Y) @ R_yaw(around Z), applied
+    # to the base vector with one batched matmul
+    R = np.empty((n, 3, 3), dtype=np.float32)
+    R[:, 0, 0] = cos_pitch * cos_yaw
+    R[:, 0, 1] = -cos_pitch * sin_yaw
+    R[:, 0, 2] = sin_pitch
+    R[:, 1, 0] = sin_yaw
+    R[:, 1, 1] = cos_yaw
+    R[:, 1, 2] = 0.0
+    R[:, 2, 0] = -sin_pitch * cos_yaw
+    R[:, 2, 1] = sin_pitch * sin_yaw
+    R[:, 2, 2] = cos_pitch
+
+    rotated = R @ base_field
+
+    mx = rotated[:, 0]
+    my = rotated[:, 1]
+    mz = rotated[:, 2]
+
+    # measurement noise, one draw for all three axes
+    noise = rng.standard_normal((3, n), dtype=np.float32)
+    noise *= np.float32(0.1)
+    mx += noise[0]
+    my += noise[1]
+    mz += noise[2]
 
     return {"t": t, "mx": mx, "my": my, "mz": mz}
 
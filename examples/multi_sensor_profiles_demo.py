@@ -31,14 +31,17 @@ from data_veil_core import (
     veil_thermal,
     veil_imu,
 )
-from data_veil_core.random_control import set_seed
+from data_veil_core.random_control import get_rng, set_seed
 from data_veil_core.profiles import get_profile_strength, list_profiles
 
 
-def generate_synthetic_sensors() -> Dict[str, Any]:
+def generate_synthetic_sensors(rng: np.random.Generator) -> Dict[str, Any]:
     """
     Produce a small bundle of synthetic sensor readings.
 
+    Args:
+        rng: numpy Generator used for all sensor noise.
+
     Returns:
         Dictionary mapping sensor names to trusted arrays.
     """
@@ -49,21 +52,21 @@ def generate_synthetic_sensors() -> Dict[str, Any]:
     y = np.linspace(0, 2 * np.pi, 64)
     X, Y = np.meshgrid(x, y)
     depth = 2.5 + 1.0 * np.sin(X) * np.cos(Y)
-    depth += 0.1 * np.random.randn(64, 96)
+    depth += 0.1 * rng.standard_normal((64, 96), dtype=np.float32)
     sensors["depth"] = np.abs(depth).astype(np.float32)
 
     # LiDAR ranges: 128 beams
     angles = np.linspace(-np.pi / 2, np.pi / 2, 128)
     base_range = 3.0 + 0.5 * np.cos(3 * angles)
-    base_range += 0.1 * np.random.randn(128)
+    base_range += 0.1 * rng.standard_normal(128, dtype=np.float32)
     sensors["lidar"] = np.abs(base_range).astype(np.float32)
 
     # Radar: 48 x 32 range–Doppler
-    radar = np.random.rand(48, 32).astype(np.float32)
+    radar = rng.random((48, 32), dtype=np.float32)
     sensors["radar"] = radar
 
     # Thermal: 48 x 64, around 25-30 degrees
-    thermal = 25.0 + 5.0 * np.random.rand(48, 64)
+    thermal = 25.0 + 5.0 * rng.random((48, 64), dtype=np.float32)
     sensors["thermal"] = thermal.astype(np.float32)
 
     # IMU: expected structure:
@@ -75,13 +78,11 @@ def generate_synthetic_sensors() -> Dict[str, Any]:
     n = 200
     t = np.linspace(0.0, 10.0, n).astype(np.float32)
 
-    gx = 0.05 * np.random.randn(n).astype(np.float32)
-    gy = 0.05 * np.random.randn(n).astype(np.float32)
-    gz = 0.05 * np.random.randn(n).astype(np.float32)
-
-    ax = 0.2 * np.random.randn(n).astype(np.float32)
-    ay = 0.2 * np.random.randn(n).astype(np.float32)
-    az = (-9.81 + 0.2 * np.random.randn(n)).astype(np.float32)
+    # one float32 draw for all six channels
+    noise = rng.standard_normal((6, n), dtype=np.float32)
+    gx, gy, gz = 0.05 * noise[:3]
+    ax, ay, az = 0.2 * noise[3:]
+    az += np.float32(-9.81)
 
     imu = {
         "t": t,
@@ -126,7 +127,8 @@ def main():
     print("Multi-sensor + profiles demo")
     set_seed(42)
 
-    sensors = generate_synthetic_sensors()
+    # Synthetic data and veils share the seeded Data Veil generator
+    sensors = generate_synthetic_sensors(get_rng())
 
     # Decide which profiles to try (only those that actually exist)
     wanted_profiles = ["light", "privacy", "ghost", "chaos"]
@@ -137,6 +139,19 @@ def main():
     print("Using profiles:", profiles_to_use)
     print()
 
+    # do not compute diffs on time axis "t"
+    imu_keys = ["gx", "gy", "gz", "ax", "ay", "az"]
+
+    # Trusted data is the same under every profile, so it is summarized once
+    trusted_summaries: Dict[str, Any] = {}
+    for sensor_name, trusted in sensors.items():
+        if sensor_name == "imu":
+            trusted_summaries[sensor_name] = {
+                key: summarize_array(trusted[key]) for key in imu_keys
+            }
+        else:
+            trusted_summaries[sensor_name] = summarize_array(trusted)
+
     # For each profile, apply to each sensor and print stats
     for profile in profiles_to_use:
         print("=" * 60)
@@ -152,13 +167,12 @@ def main():
 
                 print(f"[{sensor_name}] strength={strength:.2f}")
 
-                # do not compute diffs on time axis "t"
-                for key in ["gx", "gy", "gz", "ax", "ay", "az"]:
+                for key in imu_keys:
                     t_arr = trusted[key]
                     v_arr = veiled[key]
                     diff = np.abs(v_arr - t_arr)
 
-                    print(f"  {key} trusted: {summarize_array(t_arr)}")
+                    print(f"  {key} trusted: {trusted_summaries[sensor_name][key]}")
                     print(f"  {key} veiled : {summarize_array(v_arr)}")
                     print(
                         f"  {key} diff   : mean_abs_diff={diff.mean():.4f}, max_abs_diff={diff.max():.4f}"
@@ -172,7 +186,7 @@ def main():
                 diff = np.abs(v_arr - t_arr)
 
                 print(f"[{sensor_name}] strength={strength:.2f}")
-                print(f"  trusted: {summarize_array(t_arr)}")
+                print(f"  trusted: {trusted_summaries[sensor_name]}")
                 print(f"  veiled : {summarize_array(v_arr)}")
                 print(
                     f"  diff   : mean_abs_diff={diff.mean():.4f}, max_abs_diff={diff.max():.4f}"
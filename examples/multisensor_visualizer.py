@@ -29,26 +29,27 @@ from data_veil_core.random_control import get_rng
 
 def synth_multisensor(n: int = 400, dt: float = 0.05):
     rng = get_rng()
-    t = np.linspace(0, (n - 1) * dt, n, dtype=np.float32)
+    t = np.arange(n, dtype=np.float32) * np.float32(dt)
+
+    # Measurement noise for all four streams in one draw
+    depth_noise, lidar_noise, rf_noise, us_noise = (
+        rng.standard_normal((4, n)) * np.array([0.05, 0.07, 0.8, 0.02])[:, None]
+    )
 
     # Simulated "forward mean depth" (meters)
     depth_base = 2.0 + 0.2 * np.sin(2.0 * np.pi * 0.03 * t)
-    depth_noise = rng.normal(0.0, 0.05, size=n)
     depth_series = depth_base + depth_noise
 
     # Simulated lidar front range (meters)
     lidar_base = 3.0 + 0.3 * np.cos(2.0 * np.pi * 0.02 * t)
-    lidar_noise = rng.normal(0.0, 0.07, size=n)
     lidar_series = lidar_base + lidar_noise
 
     # Simulated RF power (dB)
     rf_base = -65.0 + 2.0 * np.sin(2.0 * np.pi * 0.01 * t)
-    rf_noise = rng.normal(0.0, 0.8, size=n)
     rf_series = rf_base + rf_noise
 
     # Simulated ultrasonic range (meters)
     us_base = 1.5 + 0.1 * np.sin(2.0 * np.pi * 0.04 * t)
-    us_noise = rng.normal(0.0, 0.02, size=n)
     us_series = np.clip(us_base + us_noise, 0.05, 4.0)
 
     sensors = {
@@ -19,6 +19,7 @@ if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
 from data_veil_core import veil_depth  # just to prove we can mix policy + core
+from data_veil_core.random_control import get_rng
 import numpy as np
 
 
@@ -61,7 +62,7 @@ def demo_policy_application():
         print(" modes:", profile["modes"])
 
     # Minimal “see it in action” example with depth:
-    depth = np.random.rand(32, 48).astype(np.float32)
+    depth = get_rng().random((32, 48), dtype=np.float32)
     print("\nDepth example (baseline vs red_team):")
     base_veiled = veil_depth(depth, strength=1.0)
     red_profile = choose_profile(policies, "red_team")
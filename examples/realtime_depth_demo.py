@@ -38,7 +38,7 @@ if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
 from data_veil_core import veil_depth
-from data_veil_core.random_control import set_seed
+from data_veil_core.random_control import get_rng, set_seed
 from data_veil_core.profiles import get_profile_strength, list_profiles
 
 
@@ -46,20 +46,42 @@ from data_veil_core.profiles import get_profile_strength, list_profiles
 # Generate synthetic depth frames
 # ----------------------------------------
 
-def generate_depth_frame(t: float) -> np.ndarray:
+FRAME_H, FRAME_W = 64, 96
+
+# Frame coordinate axes; constant across frames
+_FRAME_X = np.linspace(0, 4 * np.pi, FRAME_W, dtype=np.float32)
+_FRAME_Y = np.linspace(0, 2 * np.pi, FRAME_H, dtype=np.float32)
+
+# Per-frame sensor noise is drawn into this buffer instead of a fresh array
+_FRAME_NOISE = np.empty((FRAME_H, FRAME_W), dtype=np.float32)
+
+
+def generate_depth_frame(t: float, out: np.ndarray | None = None) -> np.ndarray:
     """
     Create a synthetic depth map that evolves over time.
-    """
-    x = np.linspace(0, 4 * np.pi, 96)
-    y = np.linspace(0, 2 * np.pi, 64)
-    X, Y = np.meshgrid(x, y)
 
-    # Time-evolving wave pattern
-    depth = 2.5 + 1.0 * np.sin(X + t * 0.3) * np.cos(Y + t * 0.5)
-    depth += 0.2 * np.random.randn(64, 96)
+    If `out` (float32, FRAME_H x FRAME_W) is given, the frame is written into
+    it in place, so a realtime loop can reuse one buffer for every frame.
+    """
+    if out is None:
+        out = np.empty((FRAME_H, FRAME_W), dtype=np.float32)
+
+    # Time-evolving wave pattern; sin(x) * cos(y) is an outer product of
+    # two 1D waves, so no (64, 96) coordinate grids are needed
+    np.multiply(
+        np.cos(_FRAME_Y + t * 0.5)[:, None],
+        np.sin(_FRAME_X + t * 0.3)[None, :],
+        out=out,
+    )
+    out += 2.5
+    # np.multiply(out=) rather than *=, which would make _FRAME_NOISE local
+    get_rng().standard_normal(dtype=np.float32, out=_FRAME_NOISE)
+    np.multiply(_FRAME_NOISE, np.float32(0.2), out=_FRAME_NOISE)
+    out += _FRAME_NOISE
 
     # Ensure positive depth
-    return np.abs(depth).astype(np.float32)
+    np.abs(out, out=out)
+    return out
 
 
 # ----------------------------------------
@@ -73,6 +95,8 @@ def main():
 
     # Initial time and frame
     t = 0.0
+    # One trusted-frame buffer, rewritten in place every iteration
+    # (imshow/set_data keep their own copy of the pixels)
     depth = generate_depth_frame(t)
 
     # Default profile
@@ -82,9 +106,14 @@ def main():
     current_profile = "privacy" if "privacy" in profiles_available else "light"
     print(f"Starting with profile: {current_profile}")
 
+    # 'depth' as the sensor name for profile lookup; resolved once per
+    # profile so frames only do a dict lookup
+    strength_by_profile = {
+        p: float(get_profile_strength(p, "depth")) for p in profiles_available
+    }
+
     def current_strength() -> float:
-        # 'depth' as the sensor name for profile lookup
-        return float(get_profile_strength(current_profile, "depth"))
+        return strength_by_profile[current_profile]
 
     veiled = veil_depth(depth, strength=current_strength())
 
@@ -96,25 +125,56 @@ def main():
     ax_t = axes[0]
     ax_v = axes[1]
 
-    im_t = ax_t.imshow(depth, cmap="viridis", vmin=0, vmax=5)
+    # Images are "animated": full redraws skip them and the loop blits
+    # just the two rasters over a cached background.
+    im_t = ax_t.imshow(depth, cmap="viridis", vmin=0, vmax=5, animated=True)
     ax_t.set_title("Trusted Depth")
     ax_t.axis("off")
 
-    im_v = ax_v.imshow(veiled, cmap="inferno", vmin=0, vmax=5)
-    ax_v.set_title(f"Veiled Depth (profile: {current_profile})")
+    im_v = ax_v.imshow(veiled, cmap="inferno", vmin=0, vmax=5, animated=True)
     ax_v.axis("off")
 
     # HUD text for profile + strength
     hud_text = fig.text(
         0.5,
         0.02,
-        f"Profile: {current_profile}  |  strength={current_strength():.2f}  (keys: 1=light, 2=privacy, 3=ghost, 4=chaos)",
+        "",
         ha="center",
         va="bottom",
         fontsize=9,
     )
 
+    def update_labels():
+        # Title and HUD only change with the profile; they are part of the
+        # static background, repainted by a full draw.
+        ax_v.set_title(f"Veiled Depth (profile: {current_profile})")
+        hud_text.set_text(
+            f"Profile: {current_profile}  |  strength={current_strength():.2f}  (keys: 1=light, 2=privacy, 3=ghost, 4=chaos)"
+        )
+
+    update_labels()
+
+    background = None
+
+    def blit_images():
+        if background is None:
+            return
+        fig.canvas.restore_region(background)
+        ax_t.draw_artist(im_t)
+        ax_v.draw_artist(im_v)
+        fig.canvas.blit(fig.bbox)
+
+    def on_draw(event):
+        # Re-grab the background after every full draw (first show, resize,
+        # profile switch), then put the current images back on top.
+        nonlocal background
+        background = fig.canvas.copy_from_bbox(fig.bbox)
+        blit_images()
+
+    fig.canvas.mpl_connect("draw_event", on_draw)
+
     plt.show(block=False)
+    fig.canvas.draw()
 
     # Key → profile mapping
     key_to_profile = {
@@ -124,16 +184,19 @@ def main():
         "4": "chaos",
     }
 
-    def on_key(event):
+    def switch_profile(new_profile):
         nonlocal current_profile
-        key = event.key
-        if key in key_to_profile:
-            new_profile = key_to_profile[key]
-            if new_profile in profiles_available:
-                current_profile = new_profile
-                print(f"Switched profile to: {current_profile}")
-            else:
-                print(f"Profile '{new_profile}' not available (not in YAML/built-ins).")
+        if new_profile in profiles_available:
+            current_profile = new_profile
+            print(f"Switched profile to: {current_profile}")
+            update_labels()
+            fig.canvas.draw_idle()
+        else:
+            print(f"Profile '{new_profile}' not available (not in YAML/built-ins).")
+
+    def on_key(event):
+        if event.key in key_to_profile:
+            switch_profile(key_to_profile[event.key])
 
     fig.canvas.mpl_connect("key_press_event", on_key)
 
@@ -143,19 +206,13 @@ def main():
             t += 0.2
 
             # Generate new frames
-            depth = generate_depth_frame(t)
+            generate_depth_frame(t, out=depth)
             veiled = veil_depth(depth, strength=current_strength())
 
-            # Update plots
+            # Update plots: only the two image rasters are repainted
             im_t.set_data(depth)
             im_v.set_data(veiled)
-            ax_v.set_title(f"Veiled Depth (profile: {current_profile})")
-
-            hud_text.set_text(
-                f"Profile: {current_profile}  |  strength={current_strength():.2f}  (keys: 1=light, 2=privacy, 3=ghost, 4=chaos)"
-            )
-
-            fig.canvas.draw()
+            blit_images()
             fig.canvas.flush_events()
 
             # Small delay to control update rate
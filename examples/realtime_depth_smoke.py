@@ -0,0 +1,74 @@
+"""
+Headless smoke run of realtime_depth_demo.py
+--------------------------------------------
+
+Drives the demo's main() for a fixed number of frames on matplotlib's
+Agg backend, so the blit loop can be checked without a display:
+
+    python examples/realtime_depth_smoke.py [frames]
+
+Halfway through, a "3" key press is sent through the canvas, which
+switches to the ghost profile and forces a full redraw (and a fresh
+background capture). The run fails if any frame was not blitted.
+
+Needs matplotlib, like the demo itself.
+"""
+
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import matplotlib
+matplotlib.use("Agg")
+matplotlib.use = lambda *args, **kwargs: None  # keep the demo off TkAgg
+
+import matplotlib.pyplot as plt
+from matplotlib.backend_bases import KeyEvent
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+if CURRENT_DIR not in sys.path:
+    sys.path.insert(0, CURRENT_DIR)
+
+import realtime_depth_demo
+
+
+def run(frames: int = 20) -> None:
+    blits = 0
+    agg_blit = FigureCanvasAgg.blit
+
+    def counting_blit(canvas, bbox=None):
+        nonlocal blits
+        blits += 1
+        agg_blit(canvas, bbox)
+
+    done = 0
+
+    def next_frame(_seconds):
+        # Stands in for the demo's per-frame time.sleep
+        nonlocal done
+        done += 1
+        fig = plt.gcf()
+        if done == frames // 2:
+            event = KeyEvent("key_press_event", fig.canvas, "3")
+            fig.canvas.callbacks.process("key_press_event", event)
+        if done == frames:
+            plt.close(fig)
+
+    FigureCanvasAgg.blit = counting_blit
+    realtime_depth_demo.time = SimpleNamespace(sleep=next_frame)
+    try:
+        realtime_depth_demo.main()
+    finally:
+        FigureCanvasAgg.blit = agg_blit
+        realtime_depth_demo.time = time
+
+    # one blit per frame, plus one after each full draw (start, key press)
+    if blits < frames + 2:
+        raise RuntimeError(f"only {blits} blits for {frames} frames")
+    print(f"Smoke run: {frames} frames, {blits} blits.")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
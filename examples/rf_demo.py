@@ -25,13 +25,15 @@ from data_veil_core.random_control import get_rng
 
 def synth_rf(n: int = 600, dt: float = 0.05) -> dict:
     rng = get_rng()
-    t = np.linspace(0, (n - 1) * dt, n, dtype=np.float32)
+    t = np.arange(n, dtype=np.float32) * np.float32(dt)
 
     base_level = -65.0
     slow_fade = 2.0 * np.sin(2.0 * np.pi * 0.01 * t)
-    noise = rng.normal(0.0, 0.8, size=n)
-
-    power = base_level + slow_fade + noise
+    # float32 noise, drawn once and turned into the power series in place
+    power = rng.standard_normal(n, dtype=np.float32)
+    power *= np.float32(0.8)
+    power += slow_fade
+    power += np.float32(base_level)
 
     return {"t": t, "power": power}
 
@@ -25,15 +25,17 @@ from data_veil_core.random_control import get_rng
 
 def synth_ultrasonic(n: int = 400, dt: float = 0.05) -> dict:
     rng = get_rng()
-    t = np.linspace(0, (n - 1) * dt, n, dtype=np.float32)
+    t = np.arange(n, dtype=np.float32) * np.float32(dt)
 
     # Base distance ~ 1.5 m with small oscillations
     base_dist = 1.5
     slow_motion = 0.1 * np.sin(2.0 * np.pi * 0.03 * t)
-    noise = rng.normal(0.0, 0.02, size=n)
-
-    ranges = base_dist + slow_motion + noise
-    ranges = np.clip(ranges, 0.05, 4.0)  # plausible ultrasonic span
+    # float32 noise, drawn once and turned into the range series in place
+    ranges = rng.standard_normal(n, dtype=np.float32)
+    ranges *= np.float32(0.02)
+    ranges += slow_motion
+    ranges += np.float32(base_dist)
+    np.clip(ranges, 0.05, 4.0, out=ranges)  # plausible ultrasonic span
 
     return {"t": t, "range": ranges}
 
@@ -7,31 +7,78 @@ This example loads config/policy.yaml and prints:
 - then shows how Data Veil would apply the policy
 """
 
+import copy
+import os
+from functools import lru_cache
+
 import yaml
 from pathlib import Path
 import numpy as np
 
 # Import your existing demo functions
-from run_demo import generate_depth_field, apply_data_veil, depth_to_image
-from run_lidar_demo import generate_lidar_scan, apply_data_veil_lidar, lidar_to_image
+from run_demo import generate_depth_field, apply_data_veil
+from run_lidar_demo import generate_lidar_scan, apply_data_veil_lidar
 
 
-def load_policy(path="config/policy.yaml"):
+@lru_cache(maxsize=4)
+def _load_policy_cached(path: str, mtime_ns: int, size: int, inode: int):
     """
-    Load YAML policy file.
+    Parse a YAML policy file. Keyed on the file's stat signature, so an
+    edited file is reparsed on the next call while an unchanged one is
+    parsed only once.
     """
     with open(path, "r") as f:
         return yaml.safe_load(f)
 
 
-def get_sensor_view(policy_entry: dict, sensor_type: str = "depth"):
+def load_policy(path="config/policy.yaml"):
+    """
+    Load YAML policy file.
+    """
+    st = os.stat(path)
+    policy = _load_policy_cached(str(path), st.st_mtime_ns, st.st_size, st.st_ino)
+    # callers get their own copy, so mutating it can't corrupt the cache
+    return copy.deepcopy(policy)
+
+
+@lru_cache(maxsize=8)
+def _trusted_depth_field(width: int = 256, height: int = 256) -> np.ndarray:
+    """
+    Trusted depth field, generated once per size (read-only).
+    """
+    field = generate_depth_field(width, height)
+    field.flags.writeable = False
+    return field
+
+
+@lru_cache(maxsize=8)
+def _trusted_lidar_scan(num_beams: int = 360) -> np.ndarray:
+    """
+    Trusted LiDAR scan, generated once per beam count (read-only).
+    """
+    scan = generate_lidar_scan(num_beams)
+    scan.flags.writeable = False
+    return scan
+
+
+def get_sensor_view(policy_entry: dict, sensor_type: str = "depth", want_data: bool = True):
     """
     Return either REAL or VEILED depending on policy.
+
+    With want_data=False only the view label is resolved and data is None,
+    so callers that just report the decision skip generation and veiling.
     """
     view = policy_entry.get("sensor_view", "veiled")
 
+    if sensor_type not in ("depth", "lidar"):
+        raise ValueError("Unknown sensor type")
+    if not want_data:
+        return None, "REAL" if view == "real" else "VEILED"
+
     if sensor_type == "depth":
-        data = generate_depth_field()
+        # The trusted field is the same for every client; only the veil is
+        # random, and it never writes to its input
+        data = _trusted_depth_field()
 
         if view == "real":
             return data, "REAL"
@@ -39,16 +86,13 @@ def get_sensor_view(policy_entry: dict, sensor_type: str = "depth"):
             return apply_data_veil(data), "VEILED"
 
     elif sensor_type == "lidar":
-        data = generate_lidar_scan(360)
+        data = _trusted_lidar_scan(360)
 
         if view == "real":
             return data, "REAL"
         else:
             return apply_data_veil_lidar(data), "VEILED"
 
-    else:
-        raise ValueError("Unknown sensor type")
-
 
 def demo_policy():
     """
@@ -65,12 +109,13 @@ def demo_policy():
     for entry in policy["policies"]:
         client = entry["client"]
 
+        # Only the decision is printed, so no sensor data is generated
         # Depth view
-        depth_data, depth_view = get_sensor_view(entry, "depth")
+        _, depth_view = get_sensor_view(entry, "depth", want_data=False)
         print(f"{client}: Depth View → {depth_view}")
 
         # LiDAR view
-        lidar_data, lidar_view = get_sensor_view(entry, "lidar")
+        _, lidar_view = get_sensor_view(entry, "lidar", want_data=False)
         print(f"{client}: LiDAR View → {lidar_view}\n")
 
     print("✔ Policy demo complete.\n")
@@ -9,10 +9,13 @@ Core idea:
 PNG images are ONLY for visualization of those arrays, not the core logic.
 """
 
+from functools import lru_cache
 from pathlib import Path
 import numpy as np
 from PIL import Image, ImageDraw
 
+from data_veil_core.random_control import get_rng
+
 
 # -------- 1. Synthetic SENSOR GENERATOR (Trusted Depth Field) -------- #
 
@@ -22,6 +25,18 @@ def generate_depth_field(width: int = 256, height: int = 256) -> np.ndarray:
     This simulates what a depth sensor or LiDAR slice might see:
       - sloped floor / wall
       - a couple of "closer" objects popping out
+
+    The field is deterministic, so it is built once per size and each call
+    returns a fresh (writable) copy.
+    """
+    return _depth_field(width, height).copy()
+
+
+@lru_cache(maxsize=8)
+def _depth_field(width: int, height: int) -> np.ndarray:
+    """
+    Build the depth field of generate_depth_field for one size. Returned
+    read-only, since the cached array is shared.
     """
     # Base depth: smooth gradient (far at top, closer at bottom-right)
     y = np.linspace(0, 1, height).reshape(height, 1)
@@ -31,11 +46,17 @@ def generate_depth_field(width: int = 256, height: int = 256) -> np.ndarray:
     field = depth.copy()
 
     def add_blob(cx: int, cy: int, radius: int, strength: float) -> None:
-        yy, xx = np.mgrid[0:height, 0:width]
-        dist = np.sqrt((xx - cx) ** 2 + (yy - cy) ** 2)
+        # Only pixels inside the blob's bounding box can be within radius,
+        # so the distance field is built for that window alone
+        y0, y1 = max(cy - radius, 0), min(cy + radius + 1, height)
+        x0, x1 = max(cx - radius, 0), min(cx + radius + 1, width)
+        rows = np.arange(y0 - cy, y1 - cy, dtype=np.int32)[:, None]
+        cols = np.arange(x0 - cx, x1 - cx, dtype=np.int32)[None, :]
+        dist = np.sqrt(cols ** 2 + rows ** 2)
         mask = dist < radius
         # Bring the depth closer (smaller values) inside the blob
-        field[mask] -= strength * (1 - dist[mask] / radius)
+        window = field[y0:y1, x0:x1]
+        window[mask] -= strength * (1 - dist[mask] / radius)
 
     # Add two "objects" in the scene
     min_side = min(width, height)
@@ -43,37 +64,139 @@ def generate_depth_field(width: int = 256, height: int = 256) -> np.ndarray:
     add_blob(int(width * 0.7), int(height * 0.4), int(min_side * 0.12), 0.20)
 
     field = np.clip(field, 0.0, 1.0)
+    field.flags.writeable = False
     return field
 
 
 # -------- 2. DATA VEIL – Veiling / Deception on the Depth Field -------- #
 
-def warp_depth_field(depth: np.ndarray, strength: float = 8.0, curve: float = 1.8) -> np.ndarray:
+def _new_warp_scratch(shape: tuple, dtype: np.dtype) -> dict:
+    """
+    Scratch buffers for one warp_depth_field call on a field of `shape`;
+    the curved field and displacements are held in `dtype`.
+    """
+    h, w = shape
+    return {
+        "d": np.empty(shape, dtype=dtype),
+        "disp_x": np.empty(shape, dtype=dtype),
+        "disp_y": np.empty(shape, dtype=dtype),
+        "mx": np.empty(shape, dtype=np.intp),
+        "idx": np.empty(shape, dtype=np.intp),
+        "rows": np.arange(h)[:, None],
+        "cols": np.arange(w)[None, :],
+    }
+
+
+@lru_cache(maxsize=4)
+def _shared_warp_scratch(shape: tuple, dtype: np.dtype) -> dict:
+    """
+    Module-level scratch buffers per (shape, dtype), used by
+    warp_depth_field only when the caller passes out=. They are SHARED by
+    every such call for that key, so those calls must not run concurrently
+    (threads) or re-entrantly.
+    """
+    return _new_warp_scratch(shape, dtype)
+
+
+def warp_depth_field(
+    depth: np.ndarray,
+    strength: float = 8.0,
+    curve: float = 1.8,
+    out: np.ndarray = None,
+) -> np.ndarray:
     """
     Apply a non-linear "warp" to the depth field to simulate:
       - distorted ranges
       - warped geometry
 
     This operates on the NUMPY ARRAY, not on an image.
-    """
-    d = np.clip(depth, 0.0, 1.0) ** curve
-    h, w = d.shape
 
-    yy, xx = np.mgrid[0:h, 0:w]
+    The result keeps a floating `depth`'s dtype (float32 stays float32);
+    other non-uint8 dtypes are warped in float64.
 
+    out: optional array of the same shape and result dtype to write into
+    (may be `depth` itself). Passing out also reuses module-level scratch
+    buffers, shared by all out= calls on that shape, so a streaming caller
+    allocates nothing per frame; such calls must not overlap across
+    threads. Without out, every call gets its own buffers.
+    """
+    h, w = depth.shape
+    dtype = depth.dtype if np.issubdtype(depth.dtype, np.floating) else np.dtype(np.float64)
+    if out is None:
+        scratch = _new_warp_scratch((h, w), dtype)
+    else:
+        scratch = _shared_warp_scratch((h, w), dtype)
+    if depth.dtype == np.uint8:
+        return _warp_depth_field_u8(depth, strength, curve, scratch, out)
+
+    d = np.clip(depth, 0.0, 1.0, out=scratch["d"])
+    np.power(d, curve, out=d)
+
+    # Backward map: every output pixel (y, x) reads d at (y + disp_y, x + disp_x).
+    # Row/column indices broadcast against the displacement, so no index grids
+    # are built.
     # Displacement based on depth value (closer/farther shift differently)
-    disp_x = (d - 0.5) * strength
-    disp_y = (0.5 - d) * strength
-
-    map_x = np.clip(xx + disp_x, 0, w - 1)
-    map_y = np.clip(yy + disp_y, 0, h - 1)
+    disp_x = np.subtract(d, 0.5, out=scratch["disp_x"])
+    disp_x *= strength
+    disp_y = np.subtract(0.5, d, out=scratch["disp_y"])
+    disp_y *= strength
+
+    disp_x += scratch["cols"]
+    disp_y += scratch["rows"]
+    np.clip(disp_x, 0, w - 1, out=disp_x)
+    np.clip(disp_y, 0, h - 1, out=disp_y)
+
+    # Gather through flat indices my * w + mx (truncated like astype(int))
+    mx = scratch["mx"]
+    idx = scratch["idx"]
+    np.copyto(mx, disp_x, casting="unsafe")
+    np.copyto(idx, disp_y, casting="unsafe")
+    idx *= w
+    idx += mx
+    return np.take(d, idx, out=out)
+
+
+@lru_cache(maxsize=8)
+def _u8_warp_luts(strength: float, curve: float):
+    """
+    Lookup tables for the uint8 warp, indexed by the quantized depth value:
+        curve_lut: v -> quantized (v / 255) ** curve
+        dx_lut / dy_lut: curved value -> integer displacement (floor of the
+        float displacement, so col + dx matches truncating col + disp_x)
+    Returned read-only.
+    """
+    levels = np.arange(256) / 255.0
+    curve_lut = (levels ** curve * 255).astype(np.uint8)
+    dx_lut = np.floor((levels - 0.5) * strength).astype(np.intp)
+    dy_lut = np.floor((0.5 - levels) * strength).astype(np.intp)
+
+    out = (curve_lut, dx_lut, dy_lut)
+    for arr in out:
+        arr.flags.writeable = False
+    return out
 
-    mx = map_x.astype(int)
-    my = map_y.astype(int)
 
-    warped = d.copy()
-    warped[yy, xx] = d[my, mx]
-    return warped
+def _warp_depth_field_u8(depth, strength, curve, scratch, out):
+    """
+    warp_depth_field for uint8 fields: the curve and displacements become
+    table lookups and the whole warp runs on integers.
+    """
+    h, w = depth.shape
+    curve_lut, dx_lut, dy_lut = _u8_warp_luts(float(strength), float(curve))
+    d = np.take(curve_lut, depth)
+
+    # table lookups are fastest with native intp indices
+    levels = scratch["idx"]
+    np.copyto(levels, d)
+    mx = np.take(dx_lut, levels, out=scratch["mx"])
+    mx += scratch["cols"]
+    np.clip(mx, 0, w - 1, out=mx)
+    idx = np.take(dy_lut, levels, out=levels)
+    idx += scratch["rows"]
+    np.clip(idx, 0, h - 1, out=idx)
+    idx *= w
+    idx += mx
+    return np.take(d, idx, out=out)
 
 
 def carve_holes(
@@ -82,6 +205,7 @@ def carve_holes(
     min_radius: int = 10,
     max_radius: int = 40,
     mode: str = "noise",
+    out: np.ndarray = None,
 ) -> np.ndarray:
     """
     Carve "voids" in the depth field to simulate:
@@ -93,59 +217,105 @@ def carve_holes(
       - "far"   -> set those cells to max distance (1.0)
       - "near"  -> set those cells to min distance (0.0)
       - "noise" -> random distances in those regions
+
+    out: optional array to carve into (may be `depth` itself); by default
+    a copy of `depth` is made.
+
+    uint8 fields use 255 / 0 / random bytes in place of 1.0 / 0.0 / uniform.
     """
     h, w = depth.shape
-    out = depth.copy()
-    yy, xx = np.mgrid[0:h, 0:w]
-
-    for _ in range(count):
-        r = np.random.randint(min_radius, max_radius)
-        cx = np.random.randint(0, w)
-        cy = np.random.randint(0, h)
-        dist2 = (xx - cx) ** 2 + (yy - cy) ** 2
+    if out is None:
+        out = depth.copy()
+    elif out is not depth:
+        out[...] = depth
+    rows = np.arange(h, dtype=np.int32)[:, None]
+    cols = np.arange(w, dtype=np.int32)[None, :]
+    quantized = out.dtype == np.uint8
+    far = 255 if quantized else 1.0
+
+    # Radius and center of every blob in one draw each
+    rng = get_rng()
+    radii = rng.integers(min_radius, max_radius, size=count).tolist()
+    cxs = rng.integers(0, w, size=count).tolist()
+    cys = rng.integers(0, h, size=count).tolist()
+
+    for r, cx, cy in zip(radii, cxs, cys):
+        # Only the bounding box of the disc can be inside the radius; the
+        # mask is built for that window alone (row-major order within it is
+        # the same as in the full frame, so "noise" fills match)
+        y0, y1 = max(cy - r, 0), min(cy + r + 1, h)
+        x0, x1 = max(cx - r, 0), min(cx + r + 1, w)
+        window = out[y0:y1, x0:x1]
+        dist2 = (cols[:, x0:x1] - cx) ** 2 + (rows[y0:y1] - cy) ** 2
         mask = dist2 < r * r
 
         if mode == "far":
-            out[mask] = 1.0
+            window[mask] = far
         elif mode == "near":
-            out[mask] = 0.0
+            window[mask] = 0
+        elif quantized:  # "noise"
+            window[mask] = rng.integers(0, 256, size=mask.sum(), dtype=np.uint8)
         else:  # "noise"
-            out[mask] = np.random.uniform(0.0, 1.0, size=mask.sum())
+            window[mask] = rng.random(mask.sum())
 
     return out
 
 
-def apply_data_veil(depth: np.ndarray) -> np.ndarray:
+def apply_data_veil(depth: np.ndarray, passes: int = 1, out: np.ndarray = None) -> np.ndarray:
     """
     Trusted depth field IN -> Veiled depth field OUT.
 
     This function represents what an attacker or untrusted client would see
     when they tap the "sensor stream" at the exposure boundary
     (API, gateway, cloud telemetry, etc.).
+
+    passes > 1 veils the veiled field again (heavier distortion).
+    out: optional array of the same shape and dtype to write the veiled
+    field into, so streaming callers can reuse one buffer. It is handed to
+    warp_depth_field, so it also opts into that function's shared scratch
+    buffers (not safe for concurrent calls).
+
+    A uint8 field (see quantize_depth) is veiled on quantized values
+    throughout, moving a quarter of the bytes of the float64 path.
     """
-    warped = warp_depth_field(depth, strength=15.0, curve=2.0)
-    veiled = carve_holes(
-        warped,
-        count=8,
-        min_radius=15,
-        max_radius=50,
-        mode="noise",
-    )
-    veiled = np.clip(veiled, 0.0, 1.0)
+    veiled = depth
+    for _ in range(passes):
+        # warp writes into out (or a fresh array), and holes are carved in
+        # place on it. No final clip is needed: the warp gathers from a field
+        # clipped to 0..1 and holes only write values in 0..1.
+        veiled = warp_depth_field(veiled, strength=15.0, curve=2.0, out=out)
+        carve_holes(
+            veiled,
+            count=8,
+            min_radius=15,
+            max_radius=50,
+            mode="noise",
+            out=veiled,
+        )
     return veiled
 
 
 # -------- 3. VISUALIZATION – Optional, for demo only -------- #
 
+def quantize_depth(depth: np.ndarray) -> np.ndarray:
+    """
+    Quantize a depth field (0..1) to uint8 levels 0..255, the same levels
+    depth_to_image displays.
+    """
+    d = np.clip(depth, 0.0, 1.0)
+    d *= 255
+    return d.astype(np.uint8)
+
+
 def depth_to_image(depth: np.ndarray) -> Image.Image:
     """
-    Convert a depth field (0..1) to a grayscale RGB image for visualization.
+    Convert a depth field (0..1, or uint8 from quantize_depth) to a
+    grayscale RGB image for visualization.
 
     This is ONLY to see what the sensor arrays look like.
     The core logic remains numeric in the arrays.
     """
-    d = np.clip(depth, 0.0, 1.0)
-    arr = (d * 255).astype("uint8")
+    arr = depth if depth.dtype == np.uint8 else quantize_depth(depth)
     img = Image.fromarray(arr, mode="L")
     return img.convert("RGB")
 
@@ -159,16 +329,18 @@ def make_side_by_side(trusted: np.ndarray, veiled: np.ndarray, out_path: str) ->
     img_left = depth_to_image(trusted)
     img_right = depth_to_image(veiled)
 
-    # Normalize heights
+    # Normalize heights (only an image that is taller needs resampling)
     h = min(img_left.height, img_right.height)
-    img_left = img_left.resize(
-        (int(img_left.width * h / img_left.height), h),
-        Image.Resampling.LANCZOS,
-    )
-    img_right = img_right.resize(
-        (int(img_right.width * h / img_right.height), h),
-        Image.Resampling.LANCZOS,
-    )
+    if img_left.height != h:
+        img_left = img_left.resize(
+            (int(img_left.width * h / img_left.height), h),
+            Image.Resampling.LANCZOS,
+        )
+    if img_right.height != h:
+        img_right = img_right.resize(
+            (int(img_right.width * h / img_right.height), h),
+            Image.Resampling.LANCZOS,
+        )
 
     label_height = 40
     total_width = img_left.width + img_right.width
@@ -17,6 +17,7 @@ from pathlib import Path
 import numpy as np
 from PIL import Image, ImageDraw
 
+from data_veil_core.random_control import get_rng
 from run_demo import generate_depth_field, apply_data_veil, depth_to_image
 
 
@@ -29,36 +30,38 @@ def apply_mode(field: np.ndarray, mode: str) -> np.ndarray:
 
     if mode == "stealth":
         # Mostly real, slightly veiled
-        veiled = apply_data_veil(base)
-        combined = 0.75 * base + 0.25 * veiled
-        return np.clip(combined, 0.0, 1.0)
+        combined = apply_data_veil(base)
+        combined *= 0.25
+        combined += 0.75 * base
+        return np.clip(combined, 0.0, 1.0, out=combined)
 
     elif mode == "default":
-        # Current standard veiling
-        return np.clip(apply_data_veil(base), 0.0, 1.0)
+        # Current standard veiling (already clipped to 0..1)
+        return apply_data_veil(base)
 
     elif mode == "aggressive":
         # Apply veiling twice for stronger distortion
-        v1 = apply_data_veil(base)
-        v2 = apply_data_veil(v1)
-        return np.clip(v2, 0.0, 1.0)
+        return apply_data_veil(base, passes=2)
 
     elif mode == "sci_fi":
         # Double veil + extra noise for a glitchy, sci-fi effect
-        v1 = apply_data_veil(base)
-        v2 = apply_data_veil(v1)
-        noise = np.random.normal(loc=0.0, scale=0.08, size=base.shape)
-        out = v2 + noise
-        return np.clip(out, 0.0, 1.0)
+        out = apply_data_veil(base, passes=2)
+        noise = get_rng().standard_normal(base.shape)
+        noise *= 0.08
+        out += noise
+        return np.clip(out, 0.0, 1.0, out=out)
 
     else:
         raise ValueError(f"Unknown mode: {mode}")
 
 
-def make_modes_strip(field: np.ndarray, out_path: Path) -> None:
+def make_modes_strip(field: np.ndarray, out_path: Path, high_quality: bool = False) -> None:
     """
     Build a horizontal strip:
       [Trusted] [Stealth] [Default] [Aggressive] [Sci-Fi]
+
+    Tiles are scaled with BILINEAR, which is plenty for grayscale depth
+    thumbnails; high_quality=True uses LANCZOS instead.
     """
     modes = ["trusted", "stealth", "default", "aggressive", "sci_fi"]
 
@@ -78,13 +81,15 @@ def make_modes_strip(field: np.ndarray, out_path: Path) -> None:
 
     # Normalize heights
     target_height = 200
+    resample = Image.Resampling.LANCZOS if high_quality else Image.Resampling.BILINEAR
     resized = []
     for img in images:
-        resized_img = img.resize(
-            (int(img.width * target_height / img.height), target_height),
-            Image.Resampling.LANCZOS,
-        )
-        resized.append(resized_img)
+        if img.height != target_height:
+            img = img.resize(
+                (int(img.width * target_height / img.height), target_height),
+                resample,
+            )
+        resized.append(img)
 
     label_height = 40
     total_width = sum(img.width for img in resized)
@@ -12,6 +12,7 @@ Output:
   - examples/fusion_dashboard.png
 """
 
+from functools import lru_cache
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 
@@ -19,12 +20,24 @@ from PIL import Image, ImageDraw, ImageFont
 EXAMPLES_DIR = Path("examples")
 
 
+@lru_cache(maxsize=32)
+def _load_rgb(path: str, mtime_ns: int, size: int) -> Image.Image:
+    """
+    Decode an image to RGB. Keyed on the file's mtime and size, so a
+    re-rendered tile is decoded again while an unchanged one is decoded once.
+    """
+    with Image.open(path) as img:
+        return img.convert("RGB")
+
+
 def load_image(path: Path, fallback_color=(20, 20, 20)) -> Image.Image:
     """
     Try to load an image. If missing, create a placeholder.
     """
     if path.exists():
-        return Image.open(path).convert("RGB")
+        st = path.stat()
+        # copy so callers can't modify the cached image
+        return _load_rgb(str(path), st.st_mtime_ns, st.st_size).copy()
     # Fallback placeholder
     img = Image.new("RGB", (256, 256), fallback_color)
     draw = ImageDraw.Draw(img)
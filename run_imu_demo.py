@@ -25,6 +25,12 @@ from pathlib import Path
 import numpy as np
 from PIL import Image, ImageDraw
 
+from data_veil_core.random_control import get_rng
+
+
+# Channel order of the stacked (6, n) IMU array
+CHANS = ("gx", "gy", "gz", "ax", "ay", "az")
+
 
 def generate_imu_series(n: int = 200, dt: float = 0.01) -> dict:
     """
@@ -34,7 +40,7 @@ def generate_imu_series(n: int = 200, dt: float = 0.01) -> dict:
       - gravity mostly on -Z axis
     Returns a dict with keys: t, gx, gy, gz, ax, ay, az
     """
-    t = np.linspace(0, (n - 1) * dt, n)
+    t = np.arange(n) * dt
 
     # Gyro: mostly rotation around Z
     gz = 0.4 * np.sin(2 * np.pi * 0.5 * t)      # swinging yaw rate
@@ -47,24 +53,15 @@ def generate_imu_series(n: int = 200, dt: float = 0.01) -> dict:
     ay = 0.3 * np.cos(2 * np.pi * 0.4 * t)
     az = -g + 0.1 * np.sin(2 * np.pi * 0.6 * t)
 
-    # Add small measurement noise
-    gx += np.random.normal(0, 0.005, size=n)
-    gy += np.random.normal(0, 0.005, size=n)
-    gz += np.random.normal(0, 0.01, size=n)
-
-    ax += np.random.normal(0, 0.02, size=n)
-    ay += np.random.normal(0, 0.02, size=n)
-    az += np.random.normal(0, 0.02, size=n)
-
-    return {
-        "t": t,
-        "gx": gx,
-        "gy": gy,
-        "gz": gz,
-        "ax": ax,
-        "ay": ay,
-        "az": az,
-    }
+    # Add small measurement noise, one draw for all six channels
+    chans = np.stack([gx, gy, gz, ax, ay, az])
+    sigmas = np.array([0.005, 0.005, 0.01, 0.02, 0.02, 0.02])
+    chans += get_rng().standard_normal(chans.shape) * sigmas[:, None]
+
+    # Channels are exposed as row views of the one (6, n) array
+    imu = {"t": t}
+    imu.update(zip(CHANS, chans))
+    return imu
 
 
 def apply_imu_veil(imu: dict) -> dict:
@@ -74,38 +71,35 @@ def apply_imu_veil(imu: dict) -> dict:
       - short spikes (fake jolts / impacts)
       - extra noise
     """
-    veiled = {k: np.copy(v) for k, v in imu.items()}
-
-    n = veiled["t"].shape[0]
+    # All six channels are veiled together as one (6, n) array
+    chans = np.stack([imu[k] for k in CHANS])
+    n = chans.shape[1]
 
     # Slow drift on gyro Z and accelerometer X/Y
-    drift_gz = np.linspace(0.0, 0.25, n)
-    drift_ax = np.linspace(0.0, 0.6, n)
-    drift_ay = np.linspace(0.0, -0.4, n)
-
-    veiled["gz"] += drift_gz
-    veiled["ax"] += drift_ax
-    veiled["ay"] += drift_ay
-
-    # Inject spikes: fake jolts
-    for _ in range(5):
-        idx = np.random.randint(10, n - 10)
-        span = np.random.randint(3, 8)
-        end = min(n, idx + span)
-
-        # spike in gyro
-        veiled["gx"][idx:end] += np.random.choice([-1.5, 1.5])
-        veiled["gy"][idx:end] += np.random.choice([-1.0, 1.0])
-
-        # spike in accel (fake impact)
-        veiled["ax"][idx:end] += np.random.choice([-3.0, 3.0])
-        veiled["ay"][idx:end] += np.random.choice([-2.0, 2.0])
-        veiled["az"][idx:end] += np.random.choice([-4.0, 4.0])
+    chans[2:5] += np.linspace(0.0, [0.25, 0.6, -0.4], n).T
+
+    # Inject spikes: fake jolts (gx, gy in gyro; ax, ay, az as fake impact).
+    # Positions, lengths and signs are drawn up front for all spikes.
+    spike_rows = [0, 1, 3, 4, 5]
+    spike_amp = np.array([1.5, 1.0, 3.0, 2.0, 4.0])
+    rng = get_rng()
+    starts = rng.integers(10, n - 10, size=5)
+    ends = np.minimum(n, starts + rng.integers(3, 8, size=5))
+    signs = rng.choice([-1.0, 1.0], size=(5, len(spike_rows)))
+    # Every spike is a step up at its start and back down at its end, so all
+    # of them are laid down as one difference array and a cumulative sum
+    steps = np.zeros((len(spike_rows), n + 1))
+    amps = (signs * spike_amp).T
+    np.add.at(steps, (slice(None), starts), amps)
+    np.subtract.at(steps, (slice(None), ends), amps)
+    chans[spike_rows] += np.cumsum(steps[:, :n], axis=1)
 
     # Extra noise on all channels
-    for key in ["gx", "gy", "gz", "ax", "ay", "az"]:
-        veiled[key] += np.random.normal(0, 0.03 if key.startswith("g") else 0.1, size=n)
+    noise_sigma = np.array([0.03, 0.03, 0.03, 0.1, 0.1, 0.1])
+    chans += rng.standard_normal(chans.shape) * noise_sigma[:, None]
 
+    veiled = {"t": np.copy(imu["t"])}
+    veiled.update(zip(CHANS, chans))
     return veiled
 
 
@@ -136,18 +130,17 @@ def _plot_series_panel(
     # Draw title
     draw.text((10, 5), title, fill=(230, 230, 230))
 
-    # Determine global min/max among all channels
-    values = np.concatenate([series_dict[k] for k in series_dict])
-    vmin, vmax = values.min(), values.max()
+    # Determine global min/max among all channels (reduced per channel,
+    # no concatenated copy)
+    vmin = min(float(np.min(s)) for s in series_dict.values())
+    vmax = max(float(np.max(s)) for s in series_dict.values())
     if abs(vmax - vmin) < 1e-6:
         vmax = vmin + 1.0  # avoid division by zero
 
-    def to_xy(idx, value):
-        x = x0 + (idx / (len(t) - 1)) * plot_w
-        # invert y for plotting (higher value => higher on image)
-        normalized = (value - vmin) / (vmax - vmin)
-        y = y0 + (1.0 - normalized) * plot_h
-        return x, y
+    # Pixel mapping, hoisted out of the channel loop: x positions are shared
+    # by every channel, and y = y0 + (vmax - value) * y_scale
+    xs = (x0 + np.arange(len(t)) * (plot_w / (len(t) - 1))).tolist()
+    y_scale = plot_h / (vmax - vmin)
 
     # Colors per channel
     colors = {
@@ -162,15 +155,15 @@ def _plot_series_panel(
     # Draw axes baseline
     draw.rectangle((x0, y0, x0 + plot_w, y0 + plot_h), outline=(100, 100, 100), width=1)
 
-    # Draw each series
+    # Draw each series as one polyline
     for key, series in series_dict.items():
         color = colors.get(key, (180, 180, 180))
-        prev_xy = None
-        for i, val in enumerate(series):
-            x, y = to_xy(i, val)
-            if prev_xy is not None:
-                draw.line((prev_xy[0], prev_xy[1], x, y), fill=color, width=1)
-            prev_xy = (x, y)
+        # invert y for plotting (higher value => higher on image)
+        ys = vmax - np.asarray(series)
+        ys *= y_scale
+        ys += y0
+        ys = ys.tolist()
+        draw.line(list(zip(xs, ys)), fill=color, width=1)
 
     # Add legend (top-right)
     legend_y = margin_top
@@ -184,17 +177,20 @@ def _plot_series_panel(
     return img
 
 
-def render_imu_trusted(imu: dict, out_path: Path) -> None:
+def _build_imu_image(imu: dict, label: str) -> Image.Image:
+    """
+    Stack the gyro and accelerometer panels for one IMU series.
+    """
     t = imu["t"]
     gyro_panel = _plot_series_panel(
         t,
         {"gx": imu["gx"], "gy": imu["gy"], "gz": imu["gz"]},
-        title="IMU – Gyro (Trusted)",
+        title=f"IMU – Gyro ({label})",
     )
     accel_panel = _plot_series_panel(
         t,
         {"ax": imu["ax"], "ay": imu["ay"], "az": imu["az"]},
-        title="IMU – Accelerometer (Trusted)",
+        title=f"IMU – Accelerometer ({label})",
     )
 
     width = max(gyro_panel.width, accel_panel.width)
@@ -202,46 +198,25 @@ def render_imu_trusted(imu: dict, out_path: Path) -> None:
     img = Image.new("RGB", (width, height), (0, 0, 0))
     img.paste(gyro_panel, (0, 0))
     img.paste(accel_panel, (0, gyro_panel.height))
+    return img
+
 
+def render_imu_trusted(imu: dict, out_path: Path) -> None:
+    img = _build_imu_image(imu, "Trusted")
     out_path.parent.mkdir(parents=True, exist_ok=True)
     img.save(out_path)
 
 
 def render_imu_veiled(imu: dict, out_path: Path) -> None:
-    t = imu["t"]
-    gyro_panel = _plot_series_panel(
-        t,
-        {"gx": imu["gx"], "gy": imu["gy"], "gz": imu["gz"]},
-        title="IMU – Gyro (Veiled)",
-    )
-    accel_panel = _plot_series_panel(
-        t,
-        {"ax": imu["ax"], "ay": imu["ay"], "az": imu["az"]},
-        title="IMU – Accelerometer (Veiled)",
-    )
-
-    width = max(gyro_panel.width, accel_panel.width)
-    height = gyro_panel.height + accel_panel.height
-    img = Image.new("RGB", (width, height), (0, 0, 0))
-    img.paste(gyro_panel, (0, 0))
-    img.paste(accel_panel, (0, gyro_panel.height))
-
+    img = _build_imu_image(imu, "Veiled")
     out_path.parent.mkdir(parents=True, exist_ok=True)
     img.save(out_path)
 
 
 def make_imu_comparison(trusted: dict, veiled: dict, out_path: Path) -> None:
-    tmp_dir = Path("examples")
-    tmp_dir.mkdir(exist_ok=True)
-
-    trusted_tmp = tmp_dir / "imu_trusted_tmp.png"
-    veiled_tmp = tmp_dir / "imu_veiled_tmp.png"
-
-    render_imu_trusted(trusted, trusted_tmp)
-    render_imu_veiled(veiled, veiled_tmp)
-
-    trusted_img = Image.open(trusted_tmp).convert("RGB")
-    veiled_img = Image.open(veiled_tmp).convert("RGB")
+    # Panels are composed in memory; no temporary PNGs
+    trusted_img = _build_imu_image(trusted, "Trusted")
+    veiled_img = _build_imu_image(veiled, "Veiled")
 
     width = max(trusted_img.width, veiled_img.width)
     height = trusted_img.height + veiled_img.height + 30
@@ -253,11 +228,9 @@ def make_imu_comparison(trusted: dict, veiled: dict, out_path: Path) -> None:
     combined.paste(trusted_img, (0, 30))
     combined.paste(veiled_img, (0, 30 + trusted_img.height))
 
+    out_path.parent.mkdir(parents=True, exist_ok=True)
     combined.save(out_path)
 
-    trusted_tmp.unlink(missing_ok=True)
-    veiled_tmp.unlink(missing_ok=True)
-
 
 def demo_imu() -> None:
     trusted = generate_imu_series()
@@ -11,13 +11,32 @@ would see if they tap the exposed LiDAR stream.
 Images are just visualizations of those arrays.
 """
 
+from functools import lru_cache
 from pathlib import Path
 import numpy as np
 from PIL import Image, ImageDraw
 
+from data_veil_core.random_control import get_rng
+
+# zlib level for saved PNGs (PIL's default is 6, which is much slower)
+PNG_COMPRESS_LEVEL = 1
+
 
 # -------- 1. Synthetic LiDAR GENERATOR (Trusted Scan) -------- #
 
+@lru_cache(maxsize=8)
+def _beam_trig(num_beams: int):
+    """
+    Beam angles of a num_beams sweep and their cos/sin, computed once per
+    beam count and shared (read-only) by the generator and the plot.
+    """
+    angles = np.linspace(0, 2 * np.pi, num_beams, endpoint=False)
+    cos, sin = np.cos(angles), np.sin(angles)
+    for arr in (angles, cos, sin):
+        arr.flags.writeable = False
+    return angles, cos, sin
+
+
 def generate_lidar_scan(num_beams: int = 360) -> np.ndarray:
     """
     Generate a synthetic 360° LiDAR scan.
@@ -26,7 +45,7 @@ def generate_lidar_scan(num_beams: int = 360) -> np.ndarray:
       0.0 = very close
       1.0 = far
     """
-    angles = np.linspace(0, 2 * np.pi, num_beams, endpoint=False)
+    angles, _, _ = _beam_trig(num_beams)
 
     # Base environment: slightly wavy distance field
     base = 0.6 + 0.2 * np.sin(2 * angles) + 0.1 * np.cos(3 * angles)
@@ -37,7 +56,7 @@ def generate_lidar_scan(num_beams: int = 360) -> np.ndarray:
     def add_obstacle(center_angle_deg: float, width_deg: float, depth: float) -> None:
         center = np.deg2rad(center_angle_deg)
         width = np.deg2rad(width_deg)
-        diff = np.angle(np.exp(1j * (angles - center)))  # wrap to [-pi, pi]
+        diff = (angles - center + np.pi) % (2 * np.pi) - np.pi  # wrap to [-pi, pi)
         mask = np.abs(diff) < width / 2
         scan[mask] -= depth * (1 - np.abs(diff[mask]) / (width / 2))
 
@@ -58,7 +77,9 @@ def warp_lidar_scan(scan: np.ndarray, strength: float = 0.2) -> np.ndarray:
       - slightly warped environment
     """
     num_beams = scan.shape[0]
-    noise = np.random.normal(loc=1.0, scale=strength, size=num_beams)
+    noise = get_rng().standard_normal(num_beams)
+    noise *= strength
+    noise += 1.0
     warped = scan * noise
     return np.clip(warped, 0.05, 1.2)
 
@@ -76,25 +97,31 @@ def inject_lidar_voids_and_ghosts(
     out = scan.copy()
     num_beams = scan.shape[0]
 
-    def span_to_indices(center_idx: int, span_beams: int) -> np.ndarray:
-        half = span_beams // 2
-        idx = (np.arange(center_idx - half, center_idx + half + 1) + num_beams) % num_beams
-        return idx
-
-    # Voids – missing returns or interference
-    for _ in range(void_count):
-        center_idx = np.random.randint(0, num_beams)
-        span_beams = np.random.randint(5, int(num_beams * (max_span_deg / 360.0)))
-        idx = span_to_indices(center_idx, span_beams)
-        out[idx] = 1.2  # beyond max range
-
-    # Ghosts – fake close obstacles
-    for _ in range(ghost_count):
-        center_idx = np.random.randint(0, num_beams)
-        span_beams = np.random.randint(3, int(num_beams * (max_span_deg / 360.0)))
-        idx = span_to_indices(center_idx, span_beams)
-        ghost_range = np.random.uniform(0.1, 0.35)
-        out[idx] = ghost_range
+    # Centers, spans and ghost ranges for all voids and ghosts in one draw
+    rng = get_rng()
+    max_span = int(num_beams * (max_span_deg / 360.0))
+    centers = rng.integers(0, num_beams, size=void_count + ghost_count)
+    min_spans = np.repeat([5, 3], [void_count, ghost_count])
+    spans = rng.integers(min_spans, max_span)
+    ghost_ranges = rng.uniform(0.1, 0.35, size=ghost_count)
+    values = np.concatenate([np.full(void_count, 1.2), ghost_ranges])
+
+    # Every span covers center - span//2 .. center + span//2 (wrapping);
+    # all of them are laid out as one ragged index array, tagged with the
+    # span that owns each entry
+    half = spans // 2
+    lengths = 2 * half + 1
+    owner = np.repeat(np.arange(len(spans)), lengths)
+    offset_in_span = np.arange(owner.size) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    idx = (np.repeat(centers - half, lengths) + offset_in_span) % num_beams
+
+    # Voids (1.2 = beyond max range: missing returns or interference) come
+    # first, then ghosts (fake close obstacles) drawn over them: where spans
+    # overlap, the last one wins
+    last = np.full(num_beams, -1)
+    np.maximum.at(last, idx, owner)
+    hit = last >= 0
+    out[hit] = values[last[hit]]
 
     return np.clip(out, 0.05, 1.2)
 
@@ -133,12 +160,13 @@ def lidar_to_image(scan: np.ndarray, size: int = 512) -> Image.Image:
     s = np.clip(scan, 0.0, 1.2)
     s = (s - s.min()) / (s.max() - s.min() + 1e-8)
 
-    for i in range(num_beams):
-        angle = 2 * np.pi * i / num_beams
-        r = s[i] * max_radius
-        x = cx + r * np.cos(angle)
-        y = cy + r * np.sin(angle)
+    # Ray endpoints for all beams at once
+    _, cos, sin = _beam_trig(num_beams)
+    r = s * max_radius
+    xs = (cx + r * cos).tolist()
+    ys = (cy + r * sin).tolist()
 
+    for x, y in zip(xs, ys):
         # draw a small point or short line at the end of the ray
         draw.line((cx, cy, x, y), fill=(40, 120, 240), width=1)
 
@@ -156,15 +184,18 @@ def make_side_by_side_images(left: Image.Image, right: Image.Image, out_path: st
     """
     Combine two images side by side with labels at the top.
     """
+    # Normalize heights (only an image that is taller needs resampling)
     h = min(left.height, right.height)
-    left = left.resize(
-        (int(left.width * h / left.height), h),
-        Image.Resampling.LANCZOS,
-    )
-    right = right.resize(
-        (int(right.width * h / right.height), h),
-        Image.Resampling.LANCZOS,
-    )
+    if left.height != h:
+        left = left.resize(
+            (int(left.width * h / left.height), h),
+            Image.Resampling.LANCZOS,
+        )
+    if right.height != h:
+        right = right.resize(
+            (int(right.width * h / right.height), h),
+            Image.Resampling.LANCZOS,
+        )
 
     label_height = 40
     total_width = left.width + right.width
@@ -179,7 +210,7 @@ def make_side_by_side_images(left: Image.Image, right: Image.Image, out_path: st
 
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    combined.save(out_path)
+    combined.save(out_path, compress_level=PNG_COMPRESS_LEVEL)
 
 
 # -------- 4. DEMO ENTRY POINT -------- #
@@ -203,8 +234,8 @@ def demo_lidar() -> None:
     img_trusted = lidar_to_image(scan)
     img_veiled = lidar_to_image(veiled_scan)
 
-    img_trusted.save(out_dir / "lidar_trusted.png")
-    img_veiled.save(out_dir / "lidar_veiled.png")
+    img_trusted.save(out_dir / "lidar_trusted.png", compress_level=PNG_COMPRESS_LEVEL)
+    img_veiled.save(out_dir / "lidar_veiled.png", compress_level=PNG_COMPRESS_LEVEL)
     make_side_by_side_images(
         img_trusted,
         img_veiled,
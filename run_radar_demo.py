@@ -22,18 +22,48 @@ Outputs:
   - examples/radar_trusted_vs_veiled.png
 """
 
+from functools import lru_cache
 from pathlib import Path
 import numpy as np
 from PIL import Image, ImageDraw
 
+from data_veil_core.random_control import get_rng
 
-def gaussian_blob(grid_x, grid_y, cx, cy, sx, sy, amplitude=1.0):
+# zlib level for saved PNGs (PIL's default is 6, which is much slower)
+PNG_COMPRESS_LEVEL = 1
+
+
+def accumulate_blobs(out, r_axis, v_axis, cx, cy, sx, sy, amplitude):
     """
-    Create a 2D Gaussian blob centered at (cx, cy) with std devs (sx, sy).
+    Add 2D Gaussian blobs centered at (cx, cy) with std devs (sx, sy) into
+    `out` (shape (len(r_axis), len(v_axis))), in place.
+
+    Blob parameters are 1D arrays, one entry per blob. Each Gaussian is
+    separable, exp(-(a + b)) = exp(-a) * exp(-b), so only the 1D range and
+    velocity profiles are exponentiated and all blobs are summed by one
+    (rows, N) @ (N, cols) product.
     """
-    return amplitude * np.exp(
-        -(((grid_x - cx) ** 2) / (2 * sx ** 2) + ((grid_y - cy) ** 2) / (2 * sy ** 2))
+    cx, cy, sx, sy, amplitude = (
+        np.asarray(p, dtype=np.float32)[:, None] for p in (cx, cy, sx, sy, amplitude)
     )
+    prof_r = np.exp(-((r_axis - cx) ** 2) / (2 * sx ** 2)) * amplitude  # (N, rows)
+    prof_v = np.exp(-((v_axis - cy) ** 2) / (2 * sy ** 2))              # (N, cols)
+    out += prof_r.T @ prof_v
+    return out
+
+
+@lru_cache(maxsize=8)
+def _radar_axes(range_bins: int, velocity_bins: int):
+    """
+    Range and velocity axes of a (range_bins, velocity_bins) map, float32.
+    Built once per map size and shared read-only by the trusted map and
+    the veil.
+    """
+    r = np.linspace(0, 1, range_bins, dtype=np.float32)
+    v = np.linspace(-1, 1, velocity_bins, dtype=np.float32)
+    r.flags.writeable = False
+    v.flags.writeable = False
+    return r, v
 
 
 def generate_radar_map(
@@ -47,28 +77,29 @@ def generate_radar_map(
 
     Returns a 2D array of "intensity" values in [0,1].
     """
-    r = np.linspace(0, 1, range_bins)
-    v = np.linspace(-1, 1, velocity_bins)
-    grid_r, grid_v = np.meshgrid(r, v, indexing="ij")  # shape (range_bins, velocity_bins)
-
-    # Base noise floor
-    base = 0.05 * np.ones_like(grid_r)
-
-    # Add a few clean targets (blobs)
-    # Target 1: mid-range, slightly positive velocity
-    base += gaussian_blob(grid_r, grid_v, cx=0.4, cy=0.3, sx=0.04, sy=0.12, amplitude=0.7)
-
-    # Target 2: far range, negative velocity
-    base += gaussian_blob(grid_r, grid_v, cx=0.8, cy=-0.4, sx=0.05, sy=0.08, amplitude=0.9)
-
-    # Target 3: near range, zero-ish velocity
-    base += gaussian_blob(grid_r, grid_v, cx=0.2, cy=0.0, sx=0.03, sy=0.10, amplitude=0.6)
+    r, v = _radar_axes(range_bins, velocity_bins)
+
+    # Base noise floor, shape (range_bins, velocity_bins)
+    base = np.full((range_bins, velocity_bins), 0.05, dtype=np.float32)
+
+    # Add a few clean targets (blobs):
+    #   1: mid-range, slightly positive velocity
+    #   2: far range, negative velocity
+    #   3: near range, zero-ish velocity
+    accumulate_blobs(
+        base, r, v,
+        cx=[0.4, 0.8, 0.2],
+        cy=[0.3, -0.4, 0.0],
+        sx=[0.04, 0.05, 0.03],
+        sy=[0.12, 0.08, 0.10],
+        amplitude=[0.7, 0.9, 0.6],
+    )
 
     # Small random noise
-    noise = np.random.normal(loc=0.0, scale=0.01, size=base.shape)
-    out = np.clip(base + noise, 0.0, 1.0)
-
-    return out
+    noise = get_rng().standard_normal(base.shape, dtype=np.float32)
+    noise *= 0.01
+    base += noise
+    return np.clip(base, 0.0, 1.0, out=base)
 
 
 def apply_radar_veil(radar_map: np.ndarray) -> np.ndarray:
@@ -81,33 +112,33 @@ def apply_radar_veil(radar_map: np.ndarray) -> np.ndarray:
     veiled = radar_map.copy()
     rows, cols = veiled.shape
 
-    # Add ghost blobs
+    rng = get_rng()
+
+    # Add ghost blobs: one (ghost_count, 5) draw of cx, cy, sx, sy, amplitude,
+    # then all blobs are accumulated in one pass
     ghost_count = 3
-    for _ in range(ghost_count):
-        cx = np.random.uniform(0.1, 0.9)
-        cy = np.random.uniform(-0.8, 0.8)
-        sx = np.random.uniform(0.03, 0.09)
-        sy = np.random.uniform(0.05, 0.15)
-        amp = np.random.uniform(0.4, 0.9)
-
-        r = np.linspace(0, 1, rows)
-        v = np.linspace(-1, 1, cols)
-        grid_r, grid_v = np.meshgrid(r, v, indexing="ij")
-        veiled += gaussian_blob(grid_r, grid_v, cx=cx, cy=cy, sx=sx, sy=sy, amplitude=amp)
+    params = rng.uniform(
+        [0.1, -0.8, 0.03, 0.05, 0.4],
+        [0.9, 0.8, 0.09, 0.15, 0.9],
+        size=(ghost_count, 5),
+    )
+    r, v = _radar_axes(rows, cols)
+    accumulate_blobs(veiled, r, v, *params.T)
 
     # Remove/weaken some real targets by zeroing random patches
     patch_count = 4
-    for _ in range(patch_count):
-        r0 = np.random.randint(0, rows - 8)
-        c0 = np.random.randint(0, cols - 6)
-        r1 = min(rows, r0 + np.random.randint(4, 12))
-        c1 = min(cols, c0 + np.random.randint(3, 8))
+    r0s = rng.integers(0, rows - 8, size=patch_count)
+    c0s = rng.integers(0, cols - 6, size=patch_count)
+    r1s = np.minimum(rows, r0s + rng.integers(4, 12, size=patch_count))
+    c1s = np.minimum(cols, c0s + rng.integers(3, 8, size=patch_count))
+    for r0, r1, c0, c1 in zip(r0s.tolist(), r1s.tolist(), c0s.tolist(), c1s.tolist()):
         veiled[r0:r1, c0:c1] *= 0.2  # strongly attenuate
 
     # Structured noise: mild ripple pattern + random noise
-    ripple = 0.03 * np.sin(np.linspace(0, 4 * np.pi, rows))[:, None]
+    ripple = 0.03 * np.sin(np.linspace(0, 4 * np.pi, rows, dtype=np.float32))[:, None]
     veiled += ripple
-    rand_noise = np.random.normal(loc=0.0, scale=0.03, size=veiled.shape)
+    rand_noise = rng.standard_normal(veiled.shape, dtype=np.float32)
+    rand_noise *= 0.03
     veiled += rand_noise
 
     veiled = np.clip(veiled, 0.0, 1.0)
@@ -174,7 +205,7 @@ def make_radar_comparison(trusted_map: np.ndarray, veiled_map: np.ndarray, out_p
     draw.text((trusted_img.width + 10, 10), "Radar – Veiled", fill=(230, 230, 230))
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    combined.save(out_path)
+    combined.save(out_path, compress_level=PNG_COMPRESS_LEVEL)
 
 
 def demo_radar() -> None:
@@ -191,8 +222,12 @@ def demo_radar() -> None:
     veiled_path = out_dir / "radar_veiled.png"
     combo_path = out_dir / "radar_trusted_vs_veiled.png"
 
-    radar_to_image(trusted, tint="trusted", scale=4).save(trusted_path)
-    radar_to_image(veiled, tint="veiled", scale=4).save(veiled_path)
+    radar_to_image(trusted, tint="trusted", scale=4).save(
+        trusted_path, compress_level=PNG_COMPRESS_LEVEL
+    )
+    radar_to_image(veiled, tint="veiled", scale=4).save(
+        veiled_path, compress_level=PNG_COMPRESS_LEVEL
+    )
     make_radar_comparison(trusted, veiled, combo_path)
 
     print("✅ Radar demo complete.")
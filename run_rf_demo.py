@@ -23,6 +23,12 @@ from pathlib import Path
 import numpy as np
 from PIL import Image, ImageDraw
 
+from data_veil_core.grids import upsample_blocks
+from data_veil_core.random_control import get_rng
+
+# zlib level for saved PNGs (PIL's default is 6, which is much slower)
+PNG_COMPRESS_LEVEL = 1
+
 
 # -------- 1. Synthetic RF FIELD GENERATOR (Trusted View) -------- #
 
@@ -34,39 +40,38 @@ def generate_rf_field(width: int = 256, height: int = 256) -> np.ndarray:
       - a few RF emitters (access points, beacons)
       - gradual attenuation with distance
       - mild global noise
+
+    The field is float32. Each emitter's Gaussian dropoff is separable,
+    exp(-(dx^2 + dy^2) / 2s^2) = exp(-dx^2 / 2s^2) * exp(-dy^2 / 2s^2), so
+    only 1D row/column profiles are exponentiated and all emitters are
+    summed by one (H, N) @ (N, W) product.
     """
-    yy, xx = np.mgrid[0:height, 0:width]
-
-    field = np.zeros((height, width), dtype=float)
-
-    def add_emitter(cx: float, cy: float, power: float, spread: float) -> None:
-        """
-        Add an RF emitter at normalized position (cx, cy),
-        with power and spread controlling intensity and range.
-        """
-        cx_px = int(cx * width)
-        cy_px = int(cy * height)
-        dist2 = (xx - cx_px) ** 2 + (yy - cy_px) ** 2
-        # simple gaussian-like dropoff
-        contrib = power * np.exp(-dist2 / (2 * (spread ** 2)))
-        nonlocal field
-        field += contrib
-
-    # A few main emitters (e.g., WiFi APs / beacons)
-    add_emitter(0.25, 0.3, power=1.0, spread=120.0)
-    add_emitter(0.75, 0.4, power=0.9, spread=100.0)
-    add_emitter(0.5, 0.8, power=0.8, spread=110.0)
-
-    # Mild global noise
-    noise = np.random.normal(loc=0.0, scale=0.03, size=(height, width))
-    field += noise
+    # A few main emitters (e.g., WiFi APs / beacons): normalized position
+    # (cx, cy), with power and spread controlling intensity and range
+    cx = np.array([0.25, 0.75, 0.5])
+    cy = np.array([0.3, 0.4, 0.8])
+    power = np.array([1.0, 0.9, 0.8], dtype=np.float32)[:, None]
+    spread = np.array([120.0, 100.0, 110.0], dtype=np.float32)[:, None]
+
+    cx_px = (cx * width).astype(np.int64)[:, None]
+    cy_px = (cy * height).astype(np.int64)[:, None]
+    yy = np.arange(height, dtype=np.float32)
+    xx = np.arange(width, dtype=np.float32)
+    # simple gaussian-like dropoff, power folded into the row profile
+    prof_y = power * np.exp(-((yy - cy_px) ** 2) / (2 * spread ** 2))  # (N, H)
+    prof_x = np.exp(-((xx - cx_px) ** 2) / (2 * spread ** 2))          # (N, W)
+
+    # Mild global noise, with the emitters added on top
+    field = get_rng().standard_normal((height, width), dtype=np.float32)
+    field *= 0.03
+    field += prof_y.T @ prof_x
 
     # Normalize to [0,1]
-    field = field - field.min()
+    field -= field.min()
     if field.max() > 0:
-        field = field / field.max()
+        field /= field.max()
 
-    return np.clip(field, 0.0, 1.0)
+    return np.clip(field, 0.0, 1.0, out=field)
 
 
 # -------- 2. DATA VEIL – RF Deception -------- #
@@ -79,30 +84,33 @@ def warp_rf_field(field: np.ndarray, strength: float = 0.25) -> np.ndarray:
       - propagation anomalies
     """
     h, w = field.shape
-    yy, xx = np.mgrid[0:h, 0:w]
-
-    # Low-frequency noise for displacement
-    noise_x = np.random.normal(loc=0.0, scale=1.0, size=(h, w))
-    noise_y = np.random.normal(loc=0.0, scale=1.0, size=(h, w))
+    rows = np.arange(h, dtype=np.float32)[:, None]
+    cols = np.arange(w, dtype=np.float32)[None, :]
 
+    # Low-frequency noise for displacement: only the coarse grid that the
+    # upsample below reads is drawn, one sample per factor x factor block
     factor = 8
-    small_x = noise_x[::factor, ::factor]
-    small_y = noise_y[::factor, ::factor]
+    sh, sw = -(-h // factor), -(-w // factor)
+    small_x, small_y = get_rng().standard_normal((2, sh, sw), dtype=np.float32)
 
-    up_x = np.repeat(np.repeat(small_x, factor, axis=0), factor, axis=1)
-    up_y = np.repeat(np.repeat(small_y, factor, axis=0), factor, axis=1)
-    up_x = up_x[:h, :w]
-    up_y = up_y[:h, :w]
+    # Scale on the coarse grid, then upsample each value to a factor x factor
+    # block (one copy instead of two np.repeat passes). The upsampled arrays
+    # are fresh, so the source coordinates are formed and clipped in place.
+    map_x = upsample_blocks(small_x * strength * 12.0, factor, h, w)
+    map_y = upsample_blocks(small_y * strength * 12.0, factor, h, w)
 
-    disp_x = up_x * strength * 12.0
-    disp_y = up_y * strength * 12.0
+    # Broadcast row/column offsets stand in for a full mgrid, and every
+    # destination pixel is written, so the warp is one direct gather
+    map_x += cols
+    map_y += rows
+    np.clip(map_x, 0, w - 1, out=map_x)
+    np.clip(map_y, 0, h - 1, out=map_y)
 
-    map_x = np.clip(xx + disp_x, 0, w - 1).astype(int)
-    map_y = np.clip(yy + disp_y, 0, h - 1).astype(int)
-
-    warped = field.copy()
-    warped[yy, xx] = field[map_y, map_x]
-    return warped
+    # Flat source index y * w + x, gathered with np.take
+    idx = map_y.astype(np.intp)
+    idx *= w
+    idx += map_x.astype(np.intp)
+    return field.take(idx)
 
 
 def inject_rf_anomalies(
@@ -121,35 +129,49 @@ def inject_rf_anomalies(
     h, w = field.shape
     out = field.copy()
 
-    def random_bloom(is_dead: bool) -> None:
-        cx = np.random.uniform(0.1, 0.9)
-        cy = np.random.uniform(0.1, 0.9)
-        radius_frac = np.random.uniform(*radius_frac_range)
+    # Position, size and strength of every bloom and dead zone in one draw
+    rng = get_rng()
+    n = interference_blooms + dead_zones
+    is_dead_all = np.arange(n) >= interference_blooms
+    cx_all = rng.uniform(0.1, 0.9, size=n)
+    cy_all = rng.uniform(0.1, 0.9, size=n)
+    radius_frac_all = rng.uniform(*radius_frac_range, size=n)
+    strength_all = rng.uniform(
+        np.where(is_dead_all, dead_strength_range[0], bloom_strength_range[0]),
+        np.where(is_dead_all, dead_strength_range[1], bloom_strength_range[1]),
+    )
 
-        strength = np.random.uniform(
-            *(dead_strength_range if is_dead else bloom_strength_range)
-        )
+    yy = np.arange(h, dtype=np.float32)[:, None]
+    xx = np.arange(w, dtype=np.float32)[None, :]
 
-        yy, xx = np.mgrid[0:h, 0:w]
+    def random_bloom(is_dead, cx, cy, radius_frac, strength) -> None:
         cx_px = int(cx * w)
         cy_px = int(cy * h)
         radius = int(radius_frac * min(w, h))
 
-        dist = np.sqrt((xx - cx_px) ** 2 + (yy - cy_px) ** 2)
+        # Only the bounding box of the disc can be inside the radius
+        r0, r1 = max(cy_px - radius, 0), min(cy_px + radius + 1, h)
+        c0, c1 = max(cx_px - radius, 0), min(cx_px + radius + 1, w)
+        window = out[r0:r1, c0:c1]
+
+        dist = np.sqrt((xx[:, c0:c1] - cx_px) ** 2 + (yy[r0:r1] - cy_px) ** 2)
         mask = dist < radius
 
         if is_dead:
             # carve intensity down
-            out[mask] -= strength * (1 - dist[mask] / radius)
+            window[mask] -= strength * (1 - dist[mask] / radius)
         else:
             # spike intensity up
-            out[mask] += strength * (1 - dist[mask] / radius)
-
-    for _ in range(interference_blooms):
-        random_bloom(is_dead=False)
+            window[mask] += strength * (1 - dist[mask] / radius)
 
-    for _ in range(dead_zones):
-        random_bloom(is_dead=True)
+    for params in zip(
+        is_dead_all.tolist(),
+        cx_all.tolist(),
+        cy_all.tolist(),
+        radius_frac_all.tolist(),
+        strength_all.tolist(),
+    ):
+        random_bloom(*params)
 
     # Re-normalize but keep some extremes
     out = np.clip(out, 0.0, 1.0)
@@ -204,15 +226,18 @@ def make_side_by_side_rf(trusted: np.ndarray, veiled: np.ndarray, out_path: str)
     img_left = rf_to_image(trusted)
     img_right = rf_to_image(veiled)
 
+    # Normalize heights (only an image that is taller needs resampling)
     h = min(img_left.height, img_right.height)
-    img_left = img_left.resize(
-        (int(img_left.width * h / img_left.height), h),
-        Image.Resampling.LANCZOS,
-    )
-    img_right = img_right.resize(
-        (int(img_right.width * h / img_right.height), h),
-        Image.Resampling.LANCZOS,
-    )
+    if img_left.height != h:
+        img_left = img_left.resize(
+            (int(img_left.width * h / img_left.height), h),
+            Image.Resampling.LANCZOS,
+        )
+    if img_right.height != h:
+        img_right = img_right.resize(
+            (int(img_right.width * h / img_right.height), h),
+            Image.Resampling.LANCZOS,
+        )
 
     label_height = 40
     total_width = img_left.width + img_right.width
@@ -227,7 +252,7 @@ def make_side_by_side_rf(trusted: np.ndarray, veiled: np.ndarray, out_path: str)
 
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    combined.save(out_path)
+    combined.save(out_path, compress_level=PNG_COMPRESS_LEVEL)
 
 
 # -------- 4. DEMO ENTRY POINT -------- #
@@ -248,8 +273,8 @@ def demo_rf() -> None:
     out_dir = Path("examples")
     out_dir.mkdir(exist_ok=True)
 
-    rf_to_image(field).save(out_dir / "rf_trusted.png")
-    rf_to_image(veiled_field).save(out_dir / "rf_veiled.png")
+    rf_to_image(field).save(out_dir / "rf_trusted.png", compress_level=PNG_COMPRESS_LEVEL)
+    rf_to_image(veiled_field).save(out_dir / "rf_veiled.png", compress_level=PNG_COMPRESS_LEVEL)
     make_side_by_side_rf(field, veiled_field, out_dir / "rf_trusted_vs_hacker.png")
 
     print("✅ RF demo complete.")
@@ -19,10 +19,16 @@ Outputs:
   - examples/rgb_trusted_vs_veiled.png
 """
 
+from functools import lru_cache
 from pathlib import Path
 import numpy as np
 from PIL import Image, ImageDraw, ImageFilter
 
+from data_veil_core.random_control import get_rng
+
+# zlib level for saved PNGs (PIL's default is 6, which is much slower)
+PNG_COMPRESS_LEVEL = 1
+
 
 def generate_rgb_scene(width: int = 320, height: int = 240) -> Image.Image:
     """
@@ -31,17 +37,11 @@ def generate_rgb_scene(width: int = 320, height: int = 240) -> Image.Image:
       - a few colored rectangles / circles
       - feels like a simple robotics camera view
     """
-    # Background gradient
-    img = Image.new("RGB", (width, height))
-    pixels = img.load()
-
-    for y in range(height):
-        t = y / (height - 1)
-        r = int(40 + 80 * t)
-        g = int(40 + 60 * t)
-        b = int(60 + 120 * t)
-        for x in range(width):
-            pixels[x, y] = (r, g, b)
+    # Background gradient: one (r, g, b) per row, broadcast across the width
+    t = np.arange(height)[:, None] / (height - 1)
+    row_rgb = (np.array([40, 40, 60]) + np.array([80, 60, 120]) * t).astype(np.uint8)
+    background = np.broadcast_to(row_rgb[:, None, :], (height, width, 3))
+    img = Image.fromarray(np.ascontiguousarray(background), mode="RGB")
 
     draw = ImageDraw.Draw(img)
 
@@ -76,6 +76,20 @@ def generate_rgb_scene(width: int = 320, height: int = 240) -> Image.Image:
     return img
 
 
+@lru_cache(maxsize=1)
+def _color_warp_lut() -> tuple:
+    """
+    Per-channel 256-entry lookup table for the color warp: each uint8 level
+    scaled in float32, clipped to [0, 255] and truncated, as a flat R+G+B
+    table for Image.point.
+    """
+    # Slight green boost, red attenuation, blue variance
+    gains = np.array([0.9, 1.1, 1.05], dtype=np.float32)
+    levels = np.arange(256, dtype=np.float32)[None, :]
+    lut = np.clip(levels * gains[:, None], 0, 255).astype(np.uint8)
+    return tuple(lut.ravel().tolist())
+
+
 def apply_rgb_veil(trusted_img: Image.Image) -> Image.Image:
     """
     Apply a set of distortions to simulate a veiled camera view:
@@ -85,38 +99,33 @@ def apply_rgb_veil(trusted_img: Image.Image) -> Image.Image:
       - noise overlays
     """
     w, h = trusted_img.size
+    rng = get_rng()
 
-    # Convert to numpy for color ops
-    arr = np.array(trusted_img).astype(np.float32)
-
-    # Color warp: shift channels in a way that feels "off"
-    # Slight green boost, red attenuation, blue variance
-    arr[..., 0] *= 0.9   # red
-    arr[..., 1] *= 1.1   # green
-    arr[..., 2] *= 1.05  # blue
-
-    # Clip back to [0,255]
-    arr = np.clip(arr, 0, 255).astype(np.uint8)
-    img = Image.fromarray(arr, mode="RGB")
+    # Color warp: shift channels in a way that feels "off". The input is
+    # uint8, so scale + clip + cast is a per-channel table lookup and needs
+    # no float copy of the frame.
+    img = trusted_img.point(_color_warp_lut())
 
     # Add a mild blur
     img = img.filter(ImageFilter.GaussianBlur(radius=1.4))
 
-    # Jitter vertical strips (simulate edge misalignment / rolling shutter weirdness)
-    jittered = Image.new("RGB", (w, h))
+    # Jitter vertical strips (simulate edge misalignment / rolling shutter weirdness).
+    # Each strip is shifted down by its offset (negative offsets leave it in
+    # place); the uncovered rows stay black.
+    arr = np.asarray(img)
+    jittered = np.zeros_like(arr)
     strip_width = 8
-    for x in range(0, w, strip_width):
-        strip = img.crop((x, 0, min(x + strip_width, w), h))
-        offset = int(np.random.randint(-2, 3))  # -2 to +2 pixels
-        jittered.paste(strip, (x, offset if offset > 0 else 0))
-    img = jittered
-
-    # Add noise overlay
-    noise = np.random.normal(loc=0.0, scale=10.0, size=(h, w, 3))
-    arr = np.array(img).astype(np.float32)
-    arr += noise
-    arr = np.clip(arr, 0, 255).astype(np.uint8)
-    img = Image.fromarray(arr, mode="RGB")
+    offsets = rng.integers(-2, 3, size=-(-w // strip_width))  # -2 to +2 pixels
+    for x, offset in zip(range(0, w, strip_width), np.maximum(offsets, 0).tolist()):
+        jittered[offset:, x:x + strip_width] = arr[:h - offset, x:x + strip_width]
+
+    # Add noise overlay: noise, add and clip all in one float32 buffer,
+    # cast to uint8 once
+    arr = rng.standard_normal((h, w, 3), dtype=np.float32)
+    arr *= 10.0
+    arr += jittered
+    np.clip(arr, 0, 255, out=arr)
+    img = Image.fromarray(arr.astype(np.uint8), mode="RGB")
 
     return img
 
@@ -129,6 +138,9 @@ def make_rgb_side_by_side(trusted: Image.Image, veiled: Image.Image, out_path: P
     """
     h = min(trusted.height, veiled.height)
     def resize_keep_aspect(im: Image.Image) -> Image.Image:
+        # only an image that is taller needs resampling
+        if im.height == h:
+            return im
         return im.resize(
             (int(im.width * h / im.height), h),
             Image.Resampling.LANCZOS,
@@ -149,7 +161,7 @@ def make_rgb_side_by_side(trusted: Image.Image, veiled: Image.Image, out_path: P
     draw.text((left.width + 10, 10), "Veiled RGB camera", fill=(230, 230, 230))
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    combined.save(out_path)
+    combined.save(out_path, compress_level=PNG_COMPRESS_LEVEL)
 
 
 def demo_rgb() -> None:
@@ -169,8 +181,8 @@ def demo_rgb() -> None:
     veiled_path = out_dir / "rgb_veiled.png"
     side_path = out_dir / "rgb_trusted_vs_veiled.png"
 
-    trusted.save(trusted_path)
-    veiled.save(veiled_path)
+    trusted.save(trusted_path, compress_level=PNG_COMPRESS_LEVEL)
+    veiled.save(veiled_path, compress_level=PNG_COMPRESS_LEVEL)
     make_rgb_side_by_side(trusted, veiled, side_path)
 
     print("✅ RGB demo complete.")
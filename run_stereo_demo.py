@@ -22,24 +22,36 @@ Outputs:
   - examples/stereo_trusted_vs_veiled.png (4-panel comparison)
 """
 
+from functools import lru_cache
 from pathlib import Path
 import numpy as np
 from PIL import Image, ImageDraw
 
+from data_veil_core.random_control import get_rng
+
 
 def generate_base_scene(width: int = 320, height: int = 240) -> Image.Image:
     """
     Create a synthetic grayscale base scene that could represent
     a simple environment for stereo imaging.
+
+    The scene is deterministic, so it is drawn once per size and each call
+    returns a fresh copy.
     """
-    # Gradient background
-    img = Image.new("L", (width, height))
-    pixels = img.load()
-    for y in range(height):
-        for x in range(width):
-            t = (x / (width - 1)) * 0.6 + (y / (height - 1)) * 0.4
-            val = int(40 + 160 * t)
-            pixels[x, y] = val
+    return _base_scene(width, height).copy()
+
+
+@lru_cache(maxsize=8)
+def _base_scene(width: int, height: int) -> Image.Image:
+    """
+    Draw the base scene of generate_base_scene for one size (shared, so
+    callers only ever see copies).
+    """
+    # Gradient background: column and row terms broadcast to the full frame
+    x = np.arange(width)[None, :]
+    y = np.arange(height)[:, None]
+    t = (x / (width - 1)) * 0.6 + (y / (height - 1)) * 0.4
+    img = Image.fromarray((40 + 160 * t).astype(np.uint8), mode="L")
 
     draw = ImageDraw.Draw(img)
 
@@ -80,28 +92,40 @@ def apply_stereo_veil(left: Image.Image, right: Image.Image) -> tuple[Image.Imag
       - add small random disparity errors
       - overlay noise
     """
+    rng = get_rng()
+    # float32 noise buffer per (height, width), allocated once per call and
+    # reused for the left and right images
+    noise_bufs = {}
+
     def jitter_image(img: Image.Image) -> Image.Image:
         w, h = img.size
-        arr = np.array(img).astype(np.float32)
+        arr = np.asarray(img, dtype=np.float32)
 
         band_height = 16
         jittered = np.zeros_like(arr)
 
-        for y in range(0, h, band_height):
+        # One offset per band, drawn in a single call; each band is then a
+        # single slice copy
+        offsets = rng.integers(-3, 4, size=-(-h // band_height))  # -3..+3 pixels
+        for y, offset in zip(range(0, h, band_height), offsets.tolist()):
             band_end = min(y + band_height, h)
-            offset = np.random.randint(-3, 4)  # -3..+3 pixels
             if offset >= 0:
                 jittered[y:band_end, offset:] = arr[y:band_end, : w - offset]
             else:
                 off = -offset
                 jittered[y:band_end, : w - off] = arr[y:band_end, off:]
 
-        # Add noise
-        noise = np.random.normal(loc=0.0, scale=5.0, size=arr.shape)
-        jittered = jittered + noise
-        jittered = np.clip(jittered, 0, 255).astype(np.uint8)
+        # Add noise: drawn into a reused float32 buffer, then added and
+        # clipped in place, with a single cast to uint8
+        noise = noise_bufs.get(arr.shape)
+        if noise is None:
+            noise = noise_bufs[arr.shape] = np.empty(arr.shape, dtype=np.float32)
+        rng.standard_normal(dtype=np.float32, out=noise)
+        noise *= np.float32(5.0)
+        jittered += noise
+        np.clip(jittered, 0, 255, out=jittered)
 
-        return Image.fromarray(jittered, mode="L")
+        return Image.fromarray(jittered.astype(np.uint8), mode="L")
 
     veiled_left = jitter_image(left)
     veiled_right = jitter_image(right)
@@ -125,9 +149,11 @@ def make_pair_panel(left: Image.Image, right: Image.Image, label: str) -> Image.
     left_rgb = to_rgb(left)
     right_rgb = to_rgb(right)
 
-    # Normalize heights
+    # Normalize heights (only an image that is taller needs resampling)
     h = min(left_rgb.height, right_rgb.height)
     def resize_keep_aspect(im: Image.Image) -> Image.Image:
+        if im.height == h:
+            return im
         return im.resize(
             (int(im.width * h / im.height), h),
             Image.Resampling.LANCZOS,
@@ -20,6 +20,8 @@ from pathlib import Path
 import numpy as np
 from PIL import Image, ImageDraw
 
+from data_veil_core.random_control import get_rng
+
 from run_demo import (
     generate_depth_field,
     apply_data_veil,
@@ -29,9 +31,22 @@ from run_demo import (
 
 # -------- 1. Trusted sequence generator -------- #
 
-def generate_trusted_sequence(num_frames: int = 6) -> list[np.ndarray]:
+def _shift_clamped(frame: np.ndarray, shift_y: int, shift_x: int) -> np.ndarray:
+    """
+    Translate a frame by whole pixels, repeating the edge rows/columns into
+    the uncovered border: out[y, x] = frame[clip(y - shift_y), clip(x - shift_x)].
     """
-    Generate a short sequence of trusted depth fields.
+    h, w = frame.shape
+    top, bottom = max(shift_y, 0), max(-shift_y, 0)
+    left, right = max(shift_x, 0), max(-shift_x, 0)
+    padded = np.pad(frame, ((top, bottom), (left, right)), mode="edge")
+    return padded[bottom:bottom + h, right:right + w]
+
+
+def generate_trusted_sequence(num_frames: int = 6) -> np.ndarray:
+    """
+    Generate a short sequence of trusted depth fields, returned as one
+    (num_frames, H, W) array (iterating it yields the frames).
 
     We simulate small, realistic changes over time:
       - slight noise
@@ -41,30 +56,25 @@ def generate_trusted_sequence(num_frames: int = 6) -> list[np.ndarray]:
     base = generate_depth_field()
     h, w = base.shape
 
-    frames: list[np.ndarray] = []
-    for i in range(num_frames):
-        # Small temporal variation
-        noise = np.random.normal(loc=0.0, scale=0.02, size=(h, w))
-        frame = base + noise
+    # Small temporal variation: the noise of every frame in one draw, with
+    # the base field broadcast over the frame axis
+    frames = get_rng().standard_normal((num_frames, h, w))
+    frames *= 0.02
+    frames += base
 
+    for i in range(num_frames):
         # Optional small "drift" of one of the blobs (simulated by translation)
         shift_x = int((i - num_frames // 2) * 0.5)
         shift_y = int((i - num_frames // 2) * 0.3)
+        if shift_x or shift_y:
+            frames[i] = _shift_clamped(frames[i], shift_y, shift_x)
 
-        yy, xx = np.mgrid[0:h, 0:w]
-        sx = np.clip(xx - shift_x, 0, w - 1)
-        sy = np.clip(yy - shift_y, 0, h - 1)
-        frame = frame[sy, sx]
-
-        frame = np.clip(frame, 0.0, 1.0)
-        frames.append(frame)
-
-    return frames
+    return np.clip(frames, 0.0, 1.0, out=frames)
 
 
 # -------- 2. Veiled sequence with temporal anomalies -------- #
 
-def generate_veiled_sequence(trusted_frames: list[np.ndarray]) -> list[np.ndarray]:
+def generate_veiled_sequence(trusted_frames: np.ndarray) -> np.ndarray:
     """
     Apply Data Veil over time and inject temporal anomalies:
 
@@ -72,45 +82,47 @@ def generate_veiled_sequence(trusted_frames: list[np.ndarray]) -> list[np.ndarra
       - ghost frames (reusing old frames)
       - flicker (extra-strong veil)
       - partial frame corruption
-    """
-    veiled_frames: list[np.ndarray] = []
 
+    trusted_frames is a (N, H, W) sequence; each veiled frame is written
+    straight into its plane of the returned (N, H, W) array.
+    """
     num_frames = len(trusted_frames)
+    veiled_frames = np.empty((num_frames,) + trusted_frames[0].shape, dtype=trusted_frames[0].dtype)
+
     for i, frame in enumerate(trusted_frames):
         # Base veiling (spatial)
-        veiled = apply_data_veil(frame)
+        veiled = apply_data_veil(frame, out=veiled_frames[i])
 
         # Temporal anomalies:
         #  - every 3rd frame: extra corruption (hard veil)
         #  - sometimes reuse an earlier frame (ghost / time jump)
         if i % 3 == 2:
             # Stronger warp by re-veiling
-            veiled = apply_data_veil(veiled)
+            apply_data_veil(veiled, out=veiled)
 
         # Ghost frame: reuse frame 0 or previous frame occasionally
         if i in (num_frames - 2,):
             # Force a ghost frame from earlier in the sequence
             ghost_idx = max(0, i - 4)
-            veiled = veiled_frames[ghost_idx]
-
-        veiled_frames.append(veiled)
+            veiled[...] = veiled_frames[ghost_idx]
 
     return veiled_frames
 
 
 # -------- 3. Sequence visualization -------- #
 
-def sequence_to_strip(frames: list[np.ndarray], label: str) -> Image.Image:
+def sequence_to_strip(frames: np.ndarray, label: str) -> Image.Image:
     """
     Convert a sequence of depth frames to a horizontal strip image
     with a label at the top.
     """
     imgs = [depth_to_image(f) for f in frames]
 
-    # Normalize heights
+    # Normalize heights (frames normally share one shape, so usually no
+    # image needs resampling)
     height = min(img.height for img in imgs)
     resized = [
-        img.resize(
+        img if img.height == height else img.resize(
             (int(img.width * height / img.height), height),
             Image.Resampling.LANCZOS,
         )
@@ -134,8 +146,8 @@ def sequence_to_strip(frames: list[np.ndarray], label: str) -> Image.Image:
 
 
 def make_temporal_side_by_side(
-    trusted_frames: list[np.ndarray],
-    veiled_frames: list[np.ndarray],
+    trusted_frames: np.ndarray,
+    veiled_frames: np.ndarray,
     out_path: str,
 ) -> None:
     """
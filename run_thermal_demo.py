@@ -8,10 +8,14 @@ This demo simulates a thermal (infrared) sensor:
 All operations are on NUMPY ARRAYS. Images are for visualization only.
 """
 
+from functools import lru_cache
 from pathlib import Path
 import numpy as np
 from PIL import Image, ImageDraw
 
+from data_veil_core.grids import upsample_blocks
+from data_veil_core.random_control import get_rng
+
 
 # -------- 1. Synthetic THERMAL GENERATOR (Trusted Heat Map) -------- #
 
@@ -25,9 +29,21 @@ def generate_thermal_field(width: int = 256, height: int = 256) -> np.ndarray:
       - a warm background gradient
       - a few hot objects (machines, people)
       - a cooler region (vent, window, cold air)
+
+    The field is float32. It is deterministic, so it is built once per size
+    and each call returns a fresh (writable) copy.
     """
-    y = np.linspace(0, 1, height).reshape(height, 1)
-    x = np.linspace(0, 1, width).reshape(1, width)
+    return _thermal_field(width, height).copy()
+
+
+@lru_cache(maxsize=8)
+def _thermal_field(width: int, height: int) -> np.ndarray:
+    """
+    Build the thermal field of generate_thermal_field for one size.
+    Returned read-only, since the cached array is shared.
+    """
+    y = np.linspace(0, 1, height, dtype=np.float32).reshape(height, 1)
+    x = np.linspace(0, 1, width, dtype=np.float32).reshape(1, width)
 
     # Base: slightly warmer toward the center, cooler at edges
     center_bias = np.exp(-(((x - 0.5) ** 2 + (y - 0.5) ** 2) * 4.0))
@@ -35,8 +51,12 @@ def generate_thermal_field(width: int = 256, height: int = 256) -> np.ndarray:
 
     field = base.copy()
 
+    # Pixel coordinates as broadcast (H, 1) / (1, W) float32 vectors, shared
+    # by all spots
+    yy = np.arange(height, dtype=np.float32)[:, None]
+    xx = np.arange(width, dtype=np.float32)[None, :]
+
     def add_hot_spot(cx: float, cy: float, radius_frac: float, strength: float) -> None:
-        yy, xx = np.mgrid[0:height, 0:width]
         cx_px = int(cx * width)
         cy_px = int(cy * height)
         radius = int(radius_frac * min(width, height))
@@ -47,7 +67,6 @@ def generate_thermal_field(width: int = 256, height: int = 256) -> np.ndarray:
         field[mask] += strength * (1 - dist[mask] / radius)
 
     def add_cold_spot(cx: float, cy: float, radius_frac: float, strength: float) -> None:
-        yy, xx = np.mgrid[0:height, 0:width]
         cx_px = int(cx * width)
         cy_px = int(cy * height)
         radius = int(radius_frac * min(width, height))
@@ -66,6 +85,7 @@ def generate_thermal_field(width: int = 256, height: int = 256) -> np.ndarray:
     add_cold_spot(0.85, 0.15, 0.18, 0.25)
 
     field = np.clip(field, 0.0, 1.0)
+    field.flags.writeable = False
     return field
 
 
@@ -79,32 +99,33 @@ def warp_thermal_field(field: np.ndarray, strength: float = 0.25) -> np.ndarray:
       - subtle spatial warping of temperatures
     """
     h, w = field.shape
-    yy, xx = np.mgrid[0:h, 0:w]
+    rows = np.arange(h, dtype=np.float32)[:, None]
+    cols = np.arange(w, dtype=np.float32)[None, :]
 
-    # Small, smooth displacement fields based on low-frequency noise
-    noise_x = np.random.normal(loc=0.0, scale=1.0, size=(h, w))
-    noise_y = np.random.normal(loc=0.0, scale=1.0, size=(h, w))
-
-    # Smooth them by simple downsample/upsample trick
+    # Small, smooth displacement fields based on low-frequency noise: only
+    # the coarse grid, one sample per factor x factor block, is drawn
     factor = 8
-    small_x = noise_x[::factor, ::factor]
-    small_y = noise_y[::factor, ::factor]
-
-    # Upsample back to full size (nearest neighbor is fine for distortion)
-    up_x = np.repeat(np.repeat(small_x, factor, axis=0), factor, axis=1)
-    up_y = np.repeat(np.repeat(small_y, factor, axis=0), factor, axis=1)
-    up_x = up_x[:h, :w]
-    up_y = up_y[:h, :w]
+    sh, sw = -(-h // factor), -(-w // factor)
+    small_x, small_y = get_rng().standard_normal((2, sh, sw), dtype=np.float32)
 
-    disp_x = up_x * strength * 10.0
-    disp_y = up_y * strength * 10.0
+    # Upsample back to full size (nearest neighbor is fine for distortion):
+    # scale on the coarse grid, then expand each value to its block; the
+    # result is one fresh full-size copy per axis
+    disp_x = upsample_blocks(small_x * strength * 10.0, factor, h, w)
+    disp_y = upsample_blocks(small_y * strength * 10.0, factor, h, w)
 
-    map_x = np.clip(xx + disp_x, 0, w - 1).astype(int)
-    map_y = np.clip(yy + disp_y, 0, h - 1).astype(int)
+    # Source coordinates, formed and clipped in place in the displacement
+    # arrays (every destination pixel is written, so no copy of the field)
+    disp_x += cols
+    disp_y += rows
+    np.clip(disp_x, 0, w - 1, out=disp_x)
+    np.clip(disp_y, 0, h - 1, out=disp_y)
 
-    warped = field.copy()
-    warped[yy, xx] = field[map_y, map_x]
-    return warped
+    # One gather through the flat source index y * w + x
+    idx = disp_y.astype(np.intp)
+    idx *= w
+    idx += disp_x.astype(np.intp)
+    return field.take(idx)
 
 
 def inject_thermal_anomalies(
@@ -121,34 +142,45 @@ def inject_thermal_anomalies(
       - cold ghosts: fake cold zones (fake vents, leaks)
     """
     h, w = field.shape
-    out = field.copy()
-
-    def random_spot(is_hot: bool) -> None:
-        cx = np.random.uniform(0.1, 0.9)
-        cy = np.random.uniform(0.1, 0.9)
-        radius_frac = np.random.uniform(*radius_frac_range)
-        strength = np.random.uniform(
-            *(hot_strength_range if is_hot else cold_strength_range)
-        )
-
-        yy, xx = np.mgrid[0:h, 0:w]
-        cx_px = int(cx * w)
-        cy_px = int(cy * h)
-        radius = int(radius_frac * min(w, h))
-
-        dist = np.sqrt((xx - cx_px) ** 2 + (yy - cy_px) ** 2)
-        mask = dist < radius
-
-        if is_hot:
-            out[mask] += strength * (1 - dist[mask] / radius)
-        else:
-            out[mask] -= strength * (1 - dist[mask] / radius)
-
-    for _ in range(hot_ghosts):
-        random_spot(is_hot=True)
-
-    for _ in range(cold_ghosts):
-        random_spot(is_hot=False)
+    out = field.astype(np.float32)  # always a copy; the ghosts are added in float32
+
+    # Position, size and strength of every ghost in one draw each; cold
+    # ghosts carry a negative strength, so every spot is added the same way
+    rng = get_rng()
+    n = hot_ghosts + cold_ghosts
+    is_hot = np.arange(n) < hot_ghosts
+    cx_px = (rng.uniform(0.1, 0.9, size=n) * w).astype(np.intp)
+    cy_px = (rng.uniform(0.1, 0.9, size=n) * h).astype(np.intp)
+    radii = (rng.uniform(*radius_frac_range, size=n) * min(w, h)).astype(np.intp)
+    strengths = rng.uniform(
+        np.where(is_hot, hot_strength_range[0], cold_strength_range[0]),
+        np.where(is_hot, hot_strength_range[1], cold_strength_range[1]),
+    )
+    strengths[~is_hot] *= -1
+
+    # Pixel coordinates as broadcast (H, 1) / (1, W) float32 vectors, shared
+    # by all spots
+    yy = np.arange(h, dtype=np.float32)[:, None]
+    xx = np.arange(w, dtype=np.float32)[None, :]
+
+    for cx, cy, radius, strength in zip(
+        cx_px.tolist(), cy_px.tolist(), radii.tolist(), strengths.tolist()
+    ):
+        if radius <= 0:
+            continue  # an empty disc (and no division by zero below)
+
+        # Only the bounding box of the disc can be inside the radius
+        r0, r1 = max(cy - radius, 0), min(cy + radius + 1, h)
+        c0, c1 = max(cx - radius, 0), min(cx + radius + 1, w)
+        window = out[r0:r1, c0:c1]
+
+        # Linear falloff, clamped to zero outside the radius, added branchless:
+        # hot spots raise the intensity, cold spots (negative strength) carve it down
+        dist = np.sqrt((xx[:, c0:c1] - cx) ** 2 + (yy[r0:r1] - cy) ** 2)
+        falloff = np.subtract(1, dist / radius, out=dist)
+        np.maximum(falloff, 0.0, out=falloff)
+        falloff *= strength
+        window += falloff
 
     return np.clip(out, 0.0, 1.0)
 
@@ -178,16 +210,29 @@ def thermal_to_image(field: np.ndarray) -> Image.Image:
     - Hot: orange/red
     """
     f = np.clip(field, 0.0, 1.0)
-    # Build simple RGB channels
-    # Blue channel strongest at cold
-    blue = (1.0 - f) * 255.0
+    h, w = f.shape
+
+    # Build simple RGB channels, each computed in one float scratch array
+    # and cast straight into its plane of the uint8 image
+    rgb = np.empty((h, w, 3), dtype=np.uint8)
+    tmp = np.empty_like(f)
+
     # Red strongest at hot
-    red = f * 255.0
+    np.multiply(f, 255.0, out=tmp)
+    rgb[..., 0] = tmp
+    # Blue channel strongest at cold
+    np.subtract(1.0, f, out=tmp)
+    tmp *= 255.0
+    rgb[..., 2] = tmp
     # Green peaks in the middle
-    green = (1.0 - np.abs(f - 0.5) * 2.0) * 255.0
-    green = np.clip(green, 0.0, 255.0)
+    np.subtract(f, 0.5, out=tmp)
+    np.abs(tmp, out=tmp)
+    tmp *= 2.0
+    np.subtract(1.0, tmp, out=tmp)
+    tmp *= 255.0
+    np.clip(tmp, 0.0, 255.0, out=tmp)
+    rgb[..., 1] = tmp
 
-    rgb = np.stack([red, green, blue], axis=-1).astype("uint8")
     img = Image.fromarray(rgb, mode="RGB")
     return img
 
@@ -201,15 +246,18 @@ def make_side_by_side_thermal(trusted: np.ndarray, veiled: np.ndarray, out_path:
     img_left = thermal_to_image(trusted)
     img_right = thermal_to_image(veiled)
 
+    # Normalize heights (only an image that is taller needs resampling)
     h = min(img_left.height, img_right.height)
-    img_left = img_left.resize(
-        (int(img_left.width * h / img_left.height), h),
-        Image.Resampling.LANCZOS,
-    )
-    img_right = img_right.resize(
-        (int(img_right.width * h / img_right.height), h),
-        Image.Resampling.LANCZOS,
-    )
+    if img_left.height != h:
+        img_left = img_left.resize(
+            (int(img_left.width * h / img_left.height), h),
+            Image.Resampling.LANCZOS,
+        )
+    if img_right.height != h:
+        img_right = img_right.resize(
+            (int(img_right.width * h / img_right.height), h),
+            Image.Resampling.LANCZOS,
+        )
 
     label_height = 40
     total_width = img_left.width + img_right.width
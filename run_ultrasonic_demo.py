@@ -27,6 +27,8 @@ from pathlib import Path
 import numpy as np
 from PIL import Image, ImageDraw
 
+from data_veil_core.random_control import get_rng
+
 
 def generate_ultrasonic_ring(num_sensors: int = 64) -> np.ndarray:
     """
@@ -47,7 +49,8 @@ def generate_ultrasonic_ring(num_sensors: int = 64) -> np.ndarray:
     base[side_mask] = 0.5
 
     # Slight random variation to feel more natural
-    noise = np.random.normal(loc=0.0, scale=0.02, size=base.shape)
+    noise = get_rng().standard_normal(base.shape)
+    noise *= 0.02
     base = np.clip(base + noise, 0.1, 1.0)
 
     return base
@@ -62,36 +65,35 @@ def apply_ultrasonic_veil(distances: np.ndarray) -> np.ndarray:
     """
     veiled = distances.copy()
     n = veiled.shape[0]
+    rng = get_rng()
 
     # Phantom obstacles: pick several random sectors and force them VERY close
-    for _ in range(4):
-        idx = np.random.randint(0, n)
-        span = np.random.randint(2, 6)
-        end = min(n, idx + span)
+    starts = rng.integers(0, n, size=4)
+    ends = np.minimum(n, starts + rng.integers(2, 6, size=4))
+    for idx, end in zip(starts.tolist(), ends.tolist()):
         veiled[idx:end] = 0.08  # very close "fake wall"
 
     # Remove real obstacles: flatten some regions to far distances
-    for _ in range(3):
-        idx = np.random.randint(0, n)
-        span = np.random.randint(4, 10)
-        end = min(n, idx + span)
+    starts = rng.integers(0, n, size=3)
+    ends = np.minimum(n, starts + rng.integers(4, 10, size=3))
+    for idx, end in zip(starts.tolist(), ends.tolist()):
         veiled[idx:end] = 0.9  # fake "no obstacle"
 
     # Stronger global noise
-    noise = np.random.normal(loc=0.0, scale=0.06, size=veiled.shape)
+    noise = rng.standard_normal(veiled.shape)
+    noise *= 0.06
     veiled = np.clip(veiled + noise, 0.05, 1.0)
 
     return veiled
 
 
-def render_ultrasonic(
+def ultrasonic_to_image(
     distances: np.ndarray,
     title: str,
-    out_path: Path,
     bar_color=(80, 180, 220),
-) -> None:
+) -> Image.Image:
     """
-    Render the ring of distances as a bar-like strip:
+    Draw the ring of distances as a bar-like strip:
     x-axis = sensor index
     y-axis = distance (inverted so closer = taller bar).
 
@@ -127,6 +129,19 @@ def render_ultrasonic(
             fill=bar_color,
         )
 
+    return img
+
+
+def render_ultrasonic(
+    distances: np.ndarray,
+    title: str,
+    out_path: Path,
+    bar_color=(80, 180, 220),
+) -> None:
+    """
+    Render the ring of distances (see ultrasonic_to_image) and save it.
+    """
+    img = ultrasonic_to_image(distances, title, bar_color=bar_color)
     out_path.parent.mkdir(parents=True, exist_ok=True)
     img.save(out_path)
 
@@ -137,28 +152,18 @@ def make_ultrasonic_comparison(trusted: np.ndarray, veiled: np.ndarray, out_path
       Top: trusted (blue)
       Bottom: veiled (red)
     """
-    tmp_dir = Path("examples")
-    tmp_dir.mkdir(exist_ok=True)
-
-    trusted_tmp = tmp_dir / "ultrasonic_trusted_tmp.png"
-    veiled_tmp = tmp_dir / "ultrasonic_veiled_tmp.png"
-
-    render_ultrasonic(
+    # Both panels are stitched in memory, only the combined image is saved
+    trusted_img = ultrasonic_to_image(
         trusted,
         "Ultrasonic – Trusted distances",
-        trusted_tmp,
         bar_color=(80, 180, 220),   # blue-ish
     )
-    render_ultrasonic(
+    veiled_img = ultrasonic_to_image(
         veiled,
         "Ultrasonic – Veiled distances",
-        veiled_tmp,
         bar_color=(220, 80, 80),    # red-ish
     )
 
-    trusted_img = Image.open(trusted_tmp).convert("RGB")
-    veiled_img = Image.open(veiled_tmp).convert("RGB")
-
     w = max(trusted_img.width, veiled_img.width)
     h = trusted_img.height + veiled_img.height
 
@@ -166,12 +171,9 @@ def make_ultrasonic_comparison(trusted: np.ndarray, veiled: np.ndarray, out_path
     combined.paste(trusted_img, (0, 0))
     combined.paste(veiled_img, (0, trusted_img.height))
 
+    out_path.parent.mkdir(parents=True, exist_ok=True)
     combined.save(out_path)
 
-    # Cleanup temp files
-    trusted_tmp.unlink(missing_ok=True)
-    veiled_tmp.unlink(missing_ok=True)
-
 
 def demo_ultrasonic() -> None:
     trusted = generate_ultrasonic_ring()